@@ -7,7 +7,6 @@
 # ----------------------------------------------------------------------------
 
 from warnings import warn
-from itertools import product
 
 import numpy as np
 
@@ -125,7 +124,8 @@ blosum50 = \
 def local_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
                                     gap_extend_penalty=2,
                                     match_score=2, mismatch_score=-3,
-                                    substitution_matrix=None):
+                                    substitution_matrix=None,
+                                    score_only=False):
     """Locally align exactly two nucleotide seqs with Smith-Waterman
 
     Parameters
@@ -151,14 +151,21 @@ def local_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
         Lookup for substitution scores (these values are added to the
         previous best alignment score). If provided, this overrides
         ``match_score`` and ``mismatch_score``.
+    score_only : bool, optional
+        If ``True``, only the alignment score is computed and returned. The
+        score is computed one anti-diagonal of the dynamic programming matrix
+        at a time, keeping only the anti-diagonals needed to compute the next
+        one, so memory use is linear in the sum of the lengths of the
+        sequences, :math:`O(m + n)`, instead of proportional to their product.
 
     Returns
     -------
-    tuple
+    tuple or float
         ``TabularMSA`` object containing the aligned sequences, alignment score
         (float), and start/end positions of each input sequence (iterable
         of two-item tuples). Note that start/end positions are indexes into the
-        unaligned sequences.
+        unaligned sequences. If `score_only` is ``True``, only the alignment
+        score (float) is returned.
 
     See Also
     --------
@@ -193,13 +200,14 @@ def local_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
             make_identity_substitution_matrix(match_score, mismatch_score)
 
     return local_pairwise_align(seq1, seq2, gap_open_penalty,
-                                gap_extend_penalty, substitution_matrix)
+                                gap_extend_penalty, substitution_matrix,
+                                score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def local_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
                                  gap_extend_penalty=1,
-                                 substitution_matrix=None):
+                                 substitution_matrix=None, score_only=False):
     """Locally align exactly two protein seqs with Smith-Waterman
 
     Parameters
@@ -217,14 +225,21 @@ def local_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
     substitution_matrix: 2D dict (or similar), optional
         Lookup for substitution scores (these values are added to the
         previous best alignment score); default is BLOSUM 50.
+    score_only : bool, optional
+        If ``True``, only the alignment score is computed and returned. The
+        score is computed one anti-diagonal of the dynamic programming matrix
+        at a time, keeping only the anti-diagonals needed to compute the next
+        one, so memory use is linear in the sum of the lengths of the
+        sequences, :math:`O(m + n)`, instead of proportional to their product.
 
     Returns
     -------
-    tuple
+    tuple or float
         ``TabularMSA`` object containing the aligned sequences, alignment score
         (float), and start/end positions of each input sequence (iterable
         of two-item tuples). Note that start/end positions are indexes into the
-        unaligned sequences.
+        unaligned sequences. If `score_only` is ``True``, only the alignment
+        score (float) is returned.
 
     See Also
     --------
@@ -261,12 +276,14 @@ def local_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
         substitution_matrix = blosum50
 
     return local_pairwise_align(seq1, seq2, gap_open_penalty,
-                                gap_extend_penalty, substitution_matrix)
+                                gap_extend_penalty, substitution_matrix,
+                                score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def local_pairwise_align(seq1, seq2, gap_open_penalty,
-                         gap_extend_penalty, substitution_matrix):
+                         gap_extend_penalty, substitution_matrix,
+                         score_only=False):
     """Locally align exactly two seqs with Smith-Waterman
 
     Parameters
@@ -284,14 +301,21 @@ def local_pairwise_align(seq1, seq2, gap_open_penalty,
     substitution_matrix: 2D dict (or similar)
         Lookup for substitution scores (these values are added to the
         previous best alignment score).
+    score_only : bool, optional
+        If ``True``, only the alignment score is computed and returned. The
+        score is computed one anti-diagonal of the dynamic programming matrix
+        at a time, keeping only the anti-diagonals needed to compute the next
+        one, so memory use is linear in the sum of the lengths of the
+        sequences, :math:`O(m + n)`, instead of proportional to their product.
 
     Returns
     -------
-    tuple
+    tuple or float
         ``TabularMSA`` object containing the aligned sequences, alignment score
         (float), and start/end positions of each input sequence (iterable
         of two-item tuples). Note that start/end positions are indexes into the
-        unaligned sequences.
+        unaligned sequences. If `score_only` is ``True``, only the alignment
+        score (float) is returned.
 
     See Also
     --------
@@ -334,6 +358,12 @@ def local_pairwise_align(seq1, seq2, gap_open_penalty,
     seq1 = _coerce_alignment_input_type(seq1)
     seq2 = _coerce_alignment_input_type(seq2)
 
+    if score_only:
+        return _compute_score(
+            seq1, seq2, gap_open_penalty, gap_extend_penalty,
+            substitution_matrix, new_alignment_score=0.0,
+            init_matrices_f=_init_matrices_sw, local=True)
+
     score_matrix, traceback_matrix = _compute_score_and_traceback_matrices(
         seq1, seq2, gap_open_penalty, gap_extend_penalty,
         substitution_matrix, new_alignment_score=0.0,
@@ -358,7 +388,8 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
                                      gap_extend_penalty=2,
                                      match_score=1, mismatch_score=-2,
                                      substitution_matrix=None,
-                                     penalize_terminal_gaps=False):
+                                     penalize_terminal_gaps=False,
+                                     score_only=False):
     """Globally align nucleotide seqs or alignments with Needleman-Wunsch
 
     Parameters
@@ -391,14 +422,21 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
         the sequences being aligned are of different length. This is ``False``
         by default, which is very likely to be the behavior you want in all or
         nearly all cases.
+    score_only : bool, optional
+        If ``True``, only the alignment score is computed and returned. The
+        score is computed one anti-diagonal of the dynamic programming matrix
+        at a time, keeping only the anti-diagonals needed to compute the next
+        one, so memory use is linear in the sum of the lengths of the
+        sequences, :math:`O(m + n)`, instead of proportional to their product.
 
     Returns
     -------
-    tuple
+    tuple or float
         ``TabularMSA`` object containing the aligned sequences, alignment score
         (float), and start/end positions of each input sequence (iterable
         of two-item tuples). Note that start/end positions are indexes into the
-        unaligned sequences.
+        unaligned sequences. If `score_only` is ``True``, only the alignment
+        score (float) is returned.
 
     See Also
     --------
@@ -442,14 +480,16 @@ def global_pairwise_align_nucleotide(seq1, seq2, gap_open_penalty=5,
 
     return global_pairwise_align(seq1, seq2, gap_open_penalty,
                                  gap_extend_penalty, substitution_matrix,
-                                 penalize_terminal_gaps=penalize_terminal_gaps)
+                                 penalize_terminal_gaps=penalize_terminal_gaps,
+                                 score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
                                   gap_extend_penalty=1,
                                   substitution_matrix=None,
-                                  penalize_terminal_gaps=False):
+                                  penalize_terminal_gaps=False,
+                                  score_only=False):
     """Globally align pair of protein seqs or alignments with Needleman-Wunsch
 
     Parameters
@@ -474,14 +514,21 @@ def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
         the sequences being aligned are of different length. This is ``False``
         by default, which is very likely to be the behavior you want in all or
         nearly all cases.
+    score_only : bool, optional
+        If ``True``, only the alignment score is computed and returned. The
+        score is computed one anti-diagonal of the dynamic programming matrix
+        at a time, keeping only the anti-diagonals needed to compute the next
+        one, so memory use is linear in the sum of the lengths of the
+        sequences, :math:`O(m + n)`, instead of proportional to their product.
 
     Returns
     -------
-    tuple
+    tuple or float
         ``TabularMSA`` object containing the aligned sequences, alignment score
         (float), and start/end positions of each input sequence (iterable
         of two-item tuples). Note that start/end positions are indexes into the
-        unaligned sequences.
+        unaligned sequences. If `score_only` is ``True``, only the alignment
+        score (float) is returned.
 
     See Also
     --------
@@ -526,12 +573,14 @@ def global_pairwise_align_protein(seq1, seq2, gap_open_penalty=11,
 
     return global_pairwise_align(seq1, seq2, gap_open_penalty,
                                  gap_extend_penalty, substitution_matrix,
-                                 penalize_terminal_gaps=penalize_terminal_gaps)
+                                 penalize_terminal_gaps=penalize_terminal_gaps,
+                                 score_only=score_only)
 
 
 @experimental(as_of="0.4.0")
 def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
-                          substitution_matrix, penalize_terminal_gaps=False):
+                          substitution_matrix, penalize_terminal_gaps=False,
+                          score_only=False):
     """Globally align a pair of seqs or alignments with Needleman-Wunsch
 
     Parameters
@@ -556,14 +605,21 @@ def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
         the sequences being aligned are of different length. This is ``False``
         by default, which is very likely to be the behavior you want in all or
         nearly all cases.
+    score_only : bool, optional
+        If ``True``, only the alignment score is computed and returned. The
+        score is computed one anti-diagonal of the dynamic programming matrix
+        at a time, keeping only the anti-diagonals needed to compute the next
+        one, so memory use is linear in the sum of the lengths of the
+        sequences, :math:`O(m + n)`, instead of proportional to their product.
 
     Returns
     -------
-    tuple
+    tuple or float
         ``TabularMSA`` object containing the aligned sequences, alignment score
         (float), and start/end positions of each input sequence (iterable
         of two-item tuples). Note that start/end positions are indexes into the
-        unaligned sequences.
+        unaligned sequences. If `score_only` is ``True``, only the alignment
+        score (float) is returned.
 
     See Also
     --------
@@ -620,6 +676,13 @@ def global_pairwise_align(seq1, seq2, gap_open_penalty, gap_extend_penalty,
     else:
         init_matrices_f = _init_matrices_nw_no_terminal_gap_penalty
 
+    if score_only:
+        return _compute_score(
+            seq1, seq2, gap_open_penalty, gap_extend_penalty,
+            substitution_matrix, new_alignment_score=-np.inf,
+            init_matrices_f=init_matrices_f,
+            penalize_terminal_gaps=penalize_terminal_gaps)
+
     score_matrix, traceback_matrix = \
         _compute_score_and_traceback_matrices(
             seq1, seq2, gap_open_penalty, gap_extend_penalty,
@@ -843,16 +906,43 @@ def _init_matrices_nw_no_terminal_gap_penalty(
     return score_matrix, traceback_matrix
 
 
-def _compute_substitution_score(aln1_chars, aln2_chars, substitution_matrix,
-                                gap_substitution_score, gap_chars):
-    substitution_score = 0
-    for aln1_char, aln2_char in product(aln1_chars, aln2_chars):
-        if aln1_char in gap_chars or aln2_char in gap_chars:
-                substitution_score += gap_substitution_score
-        else:
+def _substitution_score_factors(aln1, aln2, substitution_matrix,
+                                gap_substitution_score):
+    """Return factors of the substitution scores of all pairs of positions.
+
+    The score of a pair of positions is the average substitution score of all
+    pairs of characters at those positions, where a pair with a gap character
+    scores `gap_substitution_score`. Positions are compared through their
+    character counts, so the substitution matrix is only looked up once for
+    each pair of distinct characters.
+
+    Returns
+    -------
+    tuple of 2D np.ndarray (float)
+        Arrays of shape ``(aln2.shape.position, k)`` and
+        ``(aln1.shape.position, k)`` such that the substitution score of
+        position ``i`` of `aln2` and position ``j`` of `aln1` is the dot
+        product of row ``i`` of the first array and row ``j`` of the second.
+
+    """
+    # only the characters present in each alignment are counted, so the
+    # counts hold a few columns per position rather than 256
+    codes1 = aln1._present_codes()
+    codes2 = aln2._present_codes()
+    counts1 = aln1._position_counts(codes1)
+    counts2 = aln2._position_counts(codes2)
+    gap_codes = set(aln1.dtype._gap_codes)
+
+    lookup = np.empty((len(codes2), len(codes1)))
+    for i, code2 in enumerate(codes2):
+        for j, code1 in enumerate(codes1):
+            if code1 in gap_codes or code2 in gap_codes:
+                lookup[i, j] = gap_substitution_score
+                continue
+
+            aln1_char, aln2_char = chr(code1), chr(code2)
             try:
-                substitution_score += \
-                    substitution_matrix[aln1_char][aln2_char]
+                lookup[i, j] = substitution_matrix[aln1_char][aln2_char]
             except KeyError:
                 offending_chars = \
                     [c for c in (aln1_char, aln2_char)
@@ -866,8 +956,151 @@ def _compute_substitution_score(aln1_chars, aln2_chars, substitution_matrix,
                     "sequences)? Does your sequence contain invalid "
                     "characters? The offending character(s) is: "
                     " %s." % ', '.join(offending_chars))
-    substitution_score /= (len(aln1_chars) * len(aln2_chars))
-    return substitution_score
+
+    scores2 = counts2.dot(lookup)
+    scores2 /= aln1.shape.sequence * aln2.shape.sequence
+    return scores2, counts1.astype(float)
+
+
+def _compute_substitution_scores(aln1, aln2, substitution_matrix,
+                                 gap_substitution_score):
+    """Return the substitution score of every pair of positions.
+
+    Returns
+    -------
+    2D np.ndarray (float)
+        Array of shape ``(aln2.shape.position, aln1.shape.position)``.
+
+    """
+    scores2, counts1 = _substitution_score_factors(
+        aln1, aln2, substitution_matrix, gap_substitution_score)
+    return scores2.dot(counts1.T)
+
+
+def _init_edge(length, gap_open_penalty, gap_extend_penalty, init_matrices_f,
+               gap):
+    """Return the first row or column that `init_matrices_f` would create.
+
+    `gap` is the traceback value of the cells of the edge (other than the
+    first one) in the Needleman-Wunsch matrices.
+
+    """
+    scores = np.zeros(length + 1)
+    traceback = np.full(length + 1, gap, dtype=int)
+    traceback[0] = _traceback_encoding['alignment-end']
+    if init_matrices_f is _init_matrices_sw:
+        traceback[1:] = _traceback_encoding['alignment-end']
+    elif init_matrices_f is _init_matrices_nw:
+        scores[1:] = (-gap_open_penalty -
+                      np.arange(length) * gap_extend_penalty)
+    return scores, traceback
+
+
+def _iter_score_and_traceback_diagonals(
+        aln1, aln2, gap_open_penalty, gap_extend_penalty, substitution_matrix,
+        new_alignment_score, row_edge, column_edge, penalize_terminal_gaps,
+        gap_substitution_score):
+    """Yield the scores and traceback of each anti-diagonal of the matrices.
+
+    `row_edge` and `column_edge` are ``(scores, traceback)`` pairs holding the
+    first row and first column of the matrices. For each anti-diagonal, from
+    the top-left cell to the bottom-right one, the index of its top row is
+    yielded with the scores and traceback values of its cells (ordered by
+    row). Only the two previous anti-diagonals are kept, so memory use is
+    linear in the lengths of the alignments.
+
+    """
+    aln1_length = aln1.shape.position
+    aln2_length = aln2.shape.position
+    # cache some values for quicker/simpler access
+    aend = _traceback_encoding['alignment-end']
+    match = _traceback_encoding['match']
+    vgap = _traceback_encoding['vertical-gap']
+    hgap = _traceback_encoding['horizontal-gap']
+
+    # aln2 is the vertical sequence and aln1 the horizontal one
+    substitution_factors2, substitution_factors1 = \
+        _substitution_score_factors(aln1, aln2, substitution_matrix,
+                                    gap_substitution_score)
+
+    # Each cell depends only on the cells above, to the left and diagonally
+    # up-left of it, so all cells of an anti-diagonal are computed at once
+    # from the two anti-diagonals before it.
+    previous = None
+    before_previous = None
+    for diagonal in range(aln1_length + aln2_length + 1):
+        top_row = max(0, diagonal - aln1_length)
+        bottom_row = min(aln2_length, diagonal)
+        scores = np.empty(bottom_row - top_row + 1)
+        traceback = np.empty(bottom_row - top_row + 1, dtype=int)
+        if top_row == 0:
+            scores[0] = row_edge[0][diagonal]
+            traceback[0] = row_edge[1][diagonal]
+        if bottom_row == diagonal:
+            scores[-1] = column_edge[0][diagonal]
+            traceback[-1] = column_edge[1][diagonal]
+
+        first_row = max(1, top_row)
+        last_row = min(bottom_row, diagonal - 1)
+        if first_row <= last_row:
+            cells = slice(first_row - top_row, last_row - top_row + 1)
+            previous_top_row, previous_scores, previous_traceback = previous
+            up = slice(first_row - 1 - previous_top_row,
+                       last_row - previous_top_row)
+            left = slice(first_row - previous_top_row,
+                         last_row - previous_top_row + 1)
+            diag = slice(first_row - 1 - before_previous[0],
+                         last_row - before_previous[0])
+
+            # compute the score for a match/mismatch
+            diag_scores = before_previous[1][diag] + np.einsum(
+                'ij,ij->i', substitution_factors2[first_row - 1:last_row],
+                substitution_factors1[diagonal - last_row - 1:
+                                      diagonal - first_row][::-1])
+
+            # compute the score for adding a gap in aln2 (vertical): gap
+            # extend if the cell above was also a gap, otherwise gap open
+            up_penalties = np.where(previous_traceback[up] == vgap,
+                                    gap_extend_penalty, gap_open_penalty)
+            # compute the score for adding a gap in aln1 (horizontal): gap
+            # extend if the cell to the left was also a gap, otherwise gap
+            # open
+            left_penalties = np.where(previous_traceback[left] == hgap,
+                                      gap_extend_penalty, gap_open_penalty)
+
+            if not penalize_terminal_gaps:
+                if diagonal - first_row == aln1_length:
+                    # we've reached the end of aln1, so adding vertical gaps
+                    # (which become gaps in aln1) should no longer be
+                    # penalized
+                    up_penalties[0] = 0
+                if last_row == aln2_length:
+                    # we've reached the end of aln2, so adding horizontal
+                    # gaps (which become gaps in aln2) should no longer be
+                    # penalized
+                    left_penalties[-1] = 0
+
+            up_scores = previous_scores[up] - up_penalties
+            left_scores = previous_scores[left] - left_penalties
+
+            # identify the largest score, and use that information to
+            # populate the score and traceback matrices. Ties are resolved
+            # in favor of the earliest candidate.
+            best_scores = np.full(len(diag_scores), new_alignment_score)
+            best_directions = np.full(len(diag_scores), aend, dtype=int)
+            for candidate_scores, direction in ((left_scores, hgap),
+                                                (diag_scores, match),
+                                                (up_scores, vgap)):
+                better = candidate_scores > best_scores
+                best_scores[better] = candidate_scores[better]
+                best_directions[better] = direction
+
+            scores[cells] = best_scores
+            traceback[cells] = best_directions
+
+        before_previous = previous
+        previous = top_row, scores, traceback
+        yield previous
 
 
 def _compute_score_and_traceback_matrices(
@@ -889,84 +1122,59 @@ def _compute_score_and_traceback_matrices(
     that users are most likely to be looking for.
 
     """
-    aln1_length = aln1.shape.position
-    aln2_length = aln2.shape.position
-    # cache some values for quicker/simpler access
-    aend = _traceback_encoding['alignment-end']
-    match = _traceback_encoding['match']
-    vgap = _traceback_encoding['vertical-gap']
-    hgap = _traceback_encoding['horizontal-gap']
-
-    new_alignment_score = (new_alignment_score, aend)
-
     # Initialize a matrix to use for scoring the alignment and for tracing
     # back the best alignment
     score_matrix, traceback_matrix = init_matrices_f(
         aln1, aln2, gap_open_penalty, gap_extend_penalty)
 
-    # Iterate over the characters in aln2 (which corresponds to the vertical
-    # sequence in the matrix)
-    for aln2_pos, aln2_chars in enumerate(aln2.iter_positions(
-            ignore_metadata=True), 1):
-        aln2_chars = str(aln2_chars)
+    diagonals = _iter_score_and_traceback_diagonals(
+        aln1, aln2, gap_open_penalty, gap_extend_penalty, substitution_matrix,
+        new_alignment_score, (score_matrix[0], traceback_matrix[0]),
+        (score_matrix[:, 0], traceback_matrix[:, 0]), penalize_terminal_gaps,
+        gap_substitution_score)
+    for diagonal, (top_row, scores, traceback) in enumerate(diagonals):
+        rows = np.arange(top_row, top_row + len(scores))
+        score_matrix[rows, diagonal - rows] = scores
+        traceback_matrix[rows, diagonal - rows] = traceback
+
+    return score_matrix, traceback_matrix
 
-        # Iterate over the characters in aln1 (which corresponds to the
-        # horizontal sequence in the matrix)
-        for aln1_pos, aln1_chars in enumerate(aln1.iter_positions(
-                ignore_metadata=True), 1):
-            aln1_chars = str(aln1_chars)
 
-            # compute the score for a match/mismatch
-            substitution_score = _compute_substitution_score(
-                aln1_chars, aln2_chars, substitution_matrix,
-                gap_substitution_score, aln1.dtype.gap_chars)
-
-            diag_score = \
-                (score_matrix[aln2_pos-1, aln1_pos-1] + substitution_score,
-                 match)
-
-            # compute the score for adding a gap in aln2 (vertical)
-            if not penalize_terminal_gaps and (aln1_pos == aln1_length):
-                # we've reached the end of aln1, so adding vertical gaps
-                # (which become gaps in aln1) should no longer
-                # be penalized (if penalize_terminal_gaps == False)
-                up_score = (score_matrix[aln2_pos-1, aln1_pos], vgap)
-            elif traceback_matrix[aln2_pos-1, aln1_pos] == vgap:
-                # gap extend, because the cell above was also a gap
-                up_score = \
-                    (score_matrix[aln2_pos-1, aln1_pos] - gap_extend_penalty,
-                     vgap)
-            else:
-                # gap open, because the cell above was not a gap
-                up_score = \
-                    (score_matrix[aln2_pos-1, aln1_pos] - gap_open_penalty,
-                     vgap)
-
-            # compute the score for adding a gap in aln1 (horizontal)
-            if not penalize_terminal_gaps and (aln2_pos == aln2_length):
-                # we've reached the end of aln2, so adding horizontal gaps
-                # (which become gaps in aln2) should no longer
-                # be penalized (if penalize_terminal_gaps == False)
-                left_score = (score_matrix[aln2_pos, aln1_pos-1], hgap)
-            elif traceback_matrix[aln2_pos, aln1_pos-1] == hgap:
-                # gap extend, because the cell to the left was also a gap
-                left_score = \
-                    (score_matrix[aln2_pos, aln1_pos-1] - gap_extend_penalty,
-                     hgap)
-            else:
-                # gap open, because the cell to the left was not a gap
-                left_score = \
-                    (score_matrix[aln2_pos, aln1_pos-1] - gap_open_penalty,
-                     hgap)
-
-            # identify the largest score, and use that information to populate
-            # the score and traceback matrices
-            best_score = _first_largest([new_alignment_score, left_score,
-                                         diag_score, up_score])
-            score_matrix[aln2_pos, aln1_pos] = best_score[0]
-            traceback_matrix[aln2_pos, aln1_pos] = best_score[1]
+def _compute_score(aln1, aln2, gap_open_penalty, gap_extend_penalty,
+                   substitution_matrix, new_alignment_score=-np.inf,
+                   init_matrices_f=_init_matrices_nw,
+                   penalize_terminal_gaps=True, gap_substitution_score=0,
+                   local=False):
+    """Return the alignment score without building the full matrices.
 
-    return score_matrix, traceback_matrix
+    The score is the same as the one found by tracing back through the
+    matrices returned by ``_compute_score_and_traceback_matrices`` with the
+    same arguments: the score of the bottom-right cell, or the largest score
+    of any cell if `local` is ``True``. Only the anti-diagonals needed to
+    compute the next one are kept, which hold at most
+    ``min(m, n) + 1`` cells for alignments of `m` and `n` positions. The
+    substitution scores are computed from per-position character counts of
+    each alignment, so memory use is :math:`O(m + n)` overall rather than
+    proportional to the product of the lengths.
+
+    """
+    row_edge = _init_edge(aln1.shape.position, gap_open_penalty,
+                          gap_extend_penalty, init_matrices_f,
+                          _traceback_encoding['horizontal-gap'])
+    column_edge = _init_edge(aln2.shape.position, gap_open_penalty,
+                             gap_extend_penalty, init_matrices_f,
+                             _traceback_encoding['vertical-gap'])
+
+    best_score = -np.inf
+    for _, scores, _ in _iter_score_and_traceback_diagonals(
+            aln1, aln2, gap_open_penalty, gap_extend_penalty,
+            substitution_matrix, new_alignment_score, row_edge, column_edge,
+            penalize_terminal_gaps, gap_substitution_score):
+        if local:
+            best_score = max(best_score, scores.max())
+    if not local:
+        best_score = scores[-1]
+    return best_score
 
 
 def _traceback(traceback_matrix, score_matrix, aln1, aln2, start_row,
@@ -976,14 +1184,12 @@ def _traceback(traceback_matrix, score_matrix, aln1, aln2, start_row,
     match = _traceback_encoding['match']
     vgap = _traceback_encoding['vertical-gap']
     hgap = _traceback_encoding['horizontal-gap']
-    gap_character = aln1.dtype.default_gap_char
-
-    # initialize the result alignments
-    aln1_sequence_count = aln1.shape.sequence
-    aligned_seqs1 = [[] for e in range(aln1_sequence_count)]
+    gap_code = ord(aln1.dtype.default_gap_char)
 
-    aln2_sequence_count = aln2.shape.sequence
-    aligned_seqs2 = [[] for e in range(aln2_sequence_count)]
+    # positions of the input alignments that make up each aligned position,
+    # or -1 for a gap
+    aln1_positions = []
+    aln2_positions = []
 
     current_row = start_row
     current_col = start_col
@@ -995,23 +1201,17 @@ def _traceback(traceback_matrix, score_matrix, aln1, aln2, start_row,
         current_value = traceback_matrix[current_row, current_col]
 
         if current_value == match:
-            for aligned_seq, input_seq in zip(aligned_seqs1, aln1):
-                aligned_seq.append(str(input_seq[current_col-1]))
-            for aligned_seq, input_seq in zip(aligned_seqs2, aln2):
-                aligned_seq.append(str(input_seq[current_row-1]))
+            aln1_positions.append(current_col - 1)
+            aln2_positions.append(current_row - 1)
             current_row -= 1
             current_col -= 1
         elif current_value == vgap:
-            for aligned_seq in aligned_seqs1:
-                aligned_seq.append(gap_character)
-            for aligned_seq, input_seq in zip(aligned_seqs2, aln2):
-                aligned_seq.append(str(input_seq[current_row-1]))
+            aln1_positions.append(-1)
+            aln2_positions.append(current_row - 1)
             current_row -= 1
         elif current_value == hgap:
-            for aligned_seq, input_seq in zip(aligned_seqs1, aln1):
-                aligned_seq.append(str(input_seq[current_col-1]))
-            for aligned_seq in aligned_seqs2:
-                aligned_seq.append(gap_character)
+            aln1_positions.append(current_col - 1)
+            aln2_positions.append(-1)
             current_col -= 1
         elif current_value == aend:
             continue
@@ -1019,37 +1219,24 @@ def _traceback(traceback_matrix, score_matrix, aln1, aln2, start_row,
             raise ValueError(
                 "Invalid value in traceback matrix: %s" % current_value)
 
-    for i, (aligned_seq, original) in enumerate(zip(aligned_seqs1, aln1)):
-        aligned_seq = ''.join(aligned_seq)[::-1]
-        constructor = aln1.dtype
-        metadata = None
-        if original.has_metadata():
-            metadata = original.metadata
-        aligned_seqs1[i] = constructor(aligned_seq, metadata=metadata,
-                                       validate=False)
-
-    for i, (aligned_seq, original) in enumerate(zip(aligned_seqs2, aln2)):
-        aligned_seq = ''.join(aligned_seq)[::-1]
-        constructor = aln2.dtype
-        metadata = None
-        if original.has_metadata():
-            metadata = original.metadata
-        aligned_seqs2[i] = constructor(aligned_seq, metadata=metadata,
-                                       validate=False)
+    aligned_seqs1 = _aligned_sequences(aln1, aln1_positions[::-1], gap_code)
+    aligned_seqs2 = _aligned_sequences(aln2, aln2_positions[::-1], gap_code)
 
     return aligned_seqs1, aligned_seqs2, best_score, current_col, current_row
 
 
-def _first_largest(scores):
-    """ Similar to max, but returns the first element achieving the high score
+def _aligned_sequences(aln, positions, gap_code):
+    """Build the aligned sequences of `aln` from traceback positions."""
+    positions = np.asarray(positions, dtype=int)
+    is_gap = positions == -1
 
-    If max receives a tuple, it will break a tie for the highest value
-    of entry[i] with entry[i+1]. We don't want that here - to better match
-    with the results of other tools, we want to be able to define which
-    entry is returned in the case of a tie.
-    """
-    result = scores[0]
-    for score, direction in scores[1:]:
-        if score > result[0]:
-            result = (score, direction)
-    return result
+    aligned_seqs = []
+    for original, seq_bytes in zip(aln, aln._byte_matrix):
+        aligned_bytes = np.full(len(positions), gap_code, dtype=np.uint8)
+        aligned_bytes[~is_gap] = seq_bytes[positions[~is_gap]]
+        metadata = None
+        if original.has_metadata():
+            metadata = original.metadata
+        aligned_seqs.append(aln.dtype(aligned_bytes, metadata=metadata,
+                                      validate=False))
+    return aligned_seqs
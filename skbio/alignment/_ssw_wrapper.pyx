@@ -7,8 +7,10 @@
 # -----------------------------------------------------------------------------
 
 from cpython cimport bool
+from libc.stdlib cimport malloc, free
 import numpy as np
 cimport numpy as cnp
+import pandas as pd
 from skbio.sequence import Protein, Sequence
 
 cdef extern from "_lib/ssw.h":
@@ -43,7 +45,7 @@ cdef extern from "_lib/ssw.h":
                             const cnp.uint8_t flag,
                             const cnp.uint16_t filters,
                             const cnp.int32_t filterd,
-                            const cnp.int32_t maskLen)
+                            const cnp.int32_t maskLen) nogil
 
     cdef void align_destroy(s_align* a)
 
@@ -70,6 +72,19 @@ np_nt_table = np.array([
 mid_table = np.array(['M', 'I', 'D'])
 
 
+cdef str _cigar_string(s_align* p):
+    cigar_list = []
+    for i in range(p.cigarLen):
+        # stored the same as that in BAM format,
+        # high 28 bits: length, low 4 bits: M/I/D (0/1/2)
+
+        # Length, remove first 4 bits
+        cigar_list.append(str(p.cigar[i] >> 4))
+        # M/I/D, lookup first 4 bits in the mid_table
+        cigar_list.append(mid_table[p.cigar[i] & 0xf])
+    return "".join(cigar_list)
+
+
 cdef class AlignmentStructure:
     """Wraps the result of an alignment c struct so it is accessible to Python
 
@@ -261,17 +276,8 @@ cdef class AlignmentStructure:
         # Memoization! (1/2)
         if self._cigar_string is not None:
             return self._cigar_string
-        cigar_list = []
-        for i in range(self.p.cigarLen):
-            # stored the same as that in BAM format,
-            # high 28 bits: length, low 4 bits: M/I/D (0/1/2)
-
-            # Length, remove first 4 bits
-            cigar_list.append(str(self.p.cigar[i] >> 4))
-            # M/I/D, lookup first 4 bits in the mid_table
-            cigar_list.append(mid_table[self.p.cigar[i] & 0xf])
         # Memoization! (2/2)
-        self._cigar_string = "".join(cigar_list)
+        self._cigar_string = _cigar_string(self.p)
         return self._cigar_string
 
     @property
@@ -650,6 +656,142 @@ cdef class StripedSmithWaterman:
         alignment.__constructor(align)  # Hack to get a pointer through
         return alignment
 
+    def align_many(self, target_sequences):
+        """Align each of `target_sequences` to `query_sequence`
+
+        Parameters
+        ----------
+        target_sequences : iterable of str
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per target sequence, in the order they were provided, with
+            columns ``optimal_alignment_score``,
+            ``suboptimal_alignment_score``, ``query_begin``, ``query_end``,
+            ``target_begin``, ``target_end_optimal``,
+            ``target_end_suboptimal`` and ``cigar``. The values are the same as
+            the properties of the ``AlignmentStructure`` returned when aligning
+            each target sequence separately.
+
+        See Also
+        --------
+        skbio.alignment.AlignmentStructure
+
+        Notes
+        -----
+        The query profile is built once, when this object is created, and
+        reused for every target sequence. The alignments are computed without
+        holding the GIL, so several ``StripedSmithWaterman`` objects (e.g., one
+        per query sequence) can align targets concurrently from a thread pool:
+
+        .. code-block:: python
+
+           from concurrent.futures import ThreadPoolExecutor
+
+           def screen(query):
+               return StripedSmithWaterman(query).align_many(references)
+
+           with ThreadPoolExecutor() as executor:
+               results = list(executor.map(screen, reads))
+
+        Examples
+        --------
+        >>> from skbio.alignment import StripedSmithWaterman
+        >>> query = StripedSmithWaterman('ACTAAGGCTCTCTACCCCTCTCAGAGA')
+        >>> targets = ['AAAAAACTCTCTAAACTCACTAAGGCTCTCTACCCCTCTTCAGAGAAGTCGA',
+        ...            'ACTAAGG']
+        >>> results = query.align_many(targets)
+        >>> results['optimal_alignment_score'].tolist()
+        [49, 14]
+        >>> results['cigar'].tolist()
+        ['20M1D7M', '7M']
+
+        """
+        targets = [self._seq_converter(seq) for seq in target_sequences]
+
+        cdef Py_ssize_t n_targets = len(targets)
+        cdef Py_ssize_t i
+        cdef cnp.ndarray reference
+        cdef const s_profile* profile = self.profile
+        cdef cnp.uint8_t gap_open_penalty = self.gap_open_penalty
+        cdef cnp.uint8_t gap_extend_penalty = self.gap_extend_penalty
+        cdef cnp.uint8_t bit_flag = self.bit_flag
+        cdef cnp.uint16_t score_filter = self.score_filter
+        cdef cnp.int32_t distance_filter = self.distance_filter
+        cdef cnp.int32_t mask_length = self.mask_length
+        cdef int index_starts_at = self.index_starts_at
+
+        cdef cnp.int8_t** references = <cnp.int8_t**> malloc(
+            max(n_targets, 1) * sizeof(cnp.int8_t*))
+        cdef cnp.int32_t* lengths = <cnp.int32_t*> malloc(
+            max(n_targets, 1) * sizeof(cnp.int32_t))
+        cdef s_align** aligns = <s_align**> malloc(
+            max(n_targets, 1) * sizeof(s_align*))
+        if references is NULL or lengths is NULL or aligns is NULL:
+            free(references)
+            free(lengths)
+            free(aligns)
+            raise MemoryError()
+        for i in range(n_targets):
+            aligns[i] = NULL
+
+        optimal_scores = np.empty(n_targets, dtype=np.uint16)
+        suboptimal_scores = np.empty(n_targets, dtype=np.uint16)
+        query_begins = np.empty(n_targets, dtype=np.int32)
+        query_ends = np.empty(n_targets, dtype=np.int32)
+        target_begins = np.empty(n_targets, dtype=np.int32)
+        target_ends_optimal = np.empty(n_targets, dtype=np.int32)
+        target_ends_suboptimal = np.empty(n_targets, dtype=np.int32)
+        cigars = np.empty(n_targets, dtype=object)
+
+        try:
+            for i in range(n_targets):
+                reference = targets[i]
+                references[i] = <cnp.int8_t*> reference.data
+                lengths[i] = len(reference)
+
+            with nogil:
+                for i in range(n_targets):
+                    aligns[i] = ssw_align(profile, references[i], lengths[i],
+                                          gap_open_penalty,
+                                          gap_extend_penalty, bit_flag,
+                                          score_filter, distance_filter,
+                                          mask_length)
+
+            for i in range(n_targets):
+                optimal_scores[i] = aligns[i].score1
+                suboptimal_scores[i] = aligns[i].score2
+                query_begins[i] = (aligns[i].read_begin1 + index_starts_at
+                                   if aligns[i].read_begin1 >= 0 else -1)
+                query_ends[i] = aligns[i].read_end1 + index_starts_at
+                target_begins[i] = (aligns[i].ref_begin1 + index_starts_at
+                                    if aligns[i].ref_begin1 >= 0 else -1)
+                target_ends_optimal[i] = aligns[i].ref_end1 + index_starts_at
+                target_ends_suboptimal[i] = (aligns[i].ref_end2 +
+                                             index_starts_at)
+                cigars[i] = _cigar_string(aligns[i])
+        finally:
+            for i in range(n_targets):
+                if aligns[i] is not NULL:
+                    align_destroy(aligns[i])
+            free(references)
+            free(lengths)
+            free(aligns)
+
+        return pd.DataFrame(
+            {'optimal_alignment_score': optimal_scores,
+             'suboptimal_alignment_score': suboptimal_scores,
+             'query_begin': query_begins,
+             'query_end': query_ends,
+             'target_begin': target_begins,
+             'target_end_optimal': target_ends_optimal,
+             'target_end_suboptimal': target_ends_suboptimal,
+             'cigar': cigars},
+            columns=['optimal_alignment_score', 'suboptimal_alignment_score',
+                     'query_begin', 'query_end', 'target_begin',
+                     'target_end_optimal', 'target_end_suboptimal', 'cigar'])
+
     def __dealloc__(self):
         if self.profile is not NULL:
             init_destroy(self.profile)
@@ -672,13 +814,10 @@ cdef class StripedSmithWaterman:
             self,
             sequence):
         cdef cnp.ndarray[cnp.int8_t, ndim = 1, mode = "c"] seq
-        seq = np.empty(len(sequence), dtype=np.int8)
-        if self.is_protein:
-            for i, char in enumerate(sequence):
-                seq[i] = np_aa_table[ord(char)]
-        else:
-            for i, char in enumerate(sequence):
-                seq[i] = np_nt_table[ord(char)]
+        table = np_aa_table if self.is_protein else np_nt_table
+        codes = np.fromiter(map(ord, sequence), dtype=np.intp,
+                            count=len(sequence))
+        seq = table[codes].astype(np.int8)
         return seq
 
     cdef cnp.ndarray[cnp.int8_t, ndim = 1, mode = "c"] \
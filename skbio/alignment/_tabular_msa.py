@@ -11,12 +11,14 @@ import copy
 
 import numpy as np
 import pandas as pd
-import scipy.stats
+import scipy.special
 
 from skbio._base import SkbioObject
 from skbio.metadata._mixin import MetadataMixin, PositionalMetadataMixin
 from skbio.sequence import Sequence
 from skbio.sequence._grammared_sequence import GrammaredSequence
+from skbio.sequence.distance import _pairwise_hamming_from_bytes
+from skbio.stats.distance import DistanceMatrix
 from skbio.util._decorator import experimental, classonlymethod, overrides
 from skbio.util._misc import resolve_key
 from skbio.alignment._indexing import TabularMSAILoc, TabularMSALoc
@@ -26,6 +28,10 @@ from skbio.alignment._repr import _TabularMSAReprBuilder
 
 _Shape = collections.namedtuple('Shape', ['sequence', 'position'])
 
+# Maximum number of characters counted at once by
+# `TabularMSA._position_counts`.
+_COUNTS_BLOCK_SIZE = 2 ** 20
+
 
 class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
     """Store a multiple sequence alignment in tabular (row/column) form.
@@ -781,6 +787,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
             raise ValueError(
                 "Cannot use both `minter` and `index` at the same time.")
         self._seqs = pd.Series([])
+        self._byte_matrix_cache = None
         self.extend(sequences, minter=minter, index=index,
                     reset_index=minter is None and index is None)
 
@@ -1197,9 +1204,34 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         except TypeError:  # NaN hit the constructor, key was bad... probably
             raise KeyError("Part of `%r` was not in the index.")
 
+    @property
+    def _byte_matrix(self):
+        """Sequence characters as a read-only 2-D array of bytes.
+
+        Row ``i`` holds the bytes of the ``i``-th sequence, so columns are the
+        positions of the MSA. The matrix is built the first time it is needed
+        and cached until the sequences of the MSA change.
+
+        """
+        if self._byte_matrix_cache is None:
+            if len(self):
+                matrix = np.vstack([seq._bytes for seq in self._seqs])
+            else:
+                matrix = np.empty((0, 0), dtype=np.uint8)
+            matrix.flags.writeable = False
+            self._byte_matrix_cache = matrix
+        return self._byte_matrix_cache
+
+    def _has_sequence_positional_metadata(self):
+        return any(seq.has_positional_metadata() for seq in self._seqs)
+
     def _get_position_(self, i, ignore_metadata=False):
-        if ignore_metadata:
-            return Sequence(''.join([str(s[i]) for s in self._seqs]))
+        is_integer = (isinstance(i, (int, np.integer)) and
+                      not isinstance(i, bool))
+        if (len(self) and is_integer and
+                (ignore_metadata or
+                 not self._has_sequence_positional_metadata())):
+            return self._get_position_from_matrix(i, ignore_metadata)
 
         seq = Sequence.concat([s[i] for s in self._seqs], how='outer')
         # TODO: change for #1198
@@ -1207,13 +1239,43 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
             seq.metadata = dict(self.positional_metadata.iloc[i])
         return seq
 
+    def _get_position_from_matrix(self, i, ignore_metadata=False):
+        # Without per-sequence positional metadata to concatenate, a position
+        # is simply a column of the byte matrix.
+        seq = Sequence(self._byte_matrix[:, i])
+        # TODO: change for #1198
+        if not ignore_metadata and self.has_positional_metadata():
+            seq.metadata = dict(self.positional_metadata.iloc[i])
+        return seq
+
     def _slice_positions_(self, i):
-        seqs = self._seqs.apply(lambda seq: seq[i])
         # TODO: change for #1198
         pm = None
         if len(self) and self.has_positional_metadata():
             pm = self.positional_metadata.iloc[i]
-        return self._constructor_(seqs, positional_metadata=pm)
+
+        if not len(self) or self._has_sequence_positional_metadata():
+            seqs = self._seqs.apply(lambda seq: seq[i])
+            return self._constructor_(seqs, positional_metadata=pm)
+
+        if isinstance(i, np.ndarray) and i.size == 0:
+            i = i.astype(int)
+        matrix = np.ascontiguousarray(self._byte_matrix[:, i])
+
+        # The rows of the sliced matrix back the new sequences, so they are
+        # not copied again by `_constructor_`.
+        seqs = []
+        for seq, row in zip(self._seqs, matrix):
+            metadata = seq.metadata if seq.has_metadata() else None
+            seqs.append(seq._constructor(sequence=row, metadata=metadata,
+                                         positional_metadata=None))
+
+        metadata = self.metadata if self.has_metadata() else None
+        msa = self.__class__(seqs, metadata=metadata, positional_metadata=pm,
+                             index=self.index)
+        matrix.flags.writeable = False
+        msa._byte_matrix_cache = matrix
+        return msa
     # end of helpers
 
     @experimental(as_of='0.4.1')
@@ -1339,7 +1401,13 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         if reverse:
             indices = reversed(indices)
 
-        return (self._get_position_(index, ignore_metadata=ignore_metadata)
+        if len(self) and (ignore_metadata or
+                          not self._has_sequence_positional_metadata()):
+            get_position = self._get_position_from_matrix
+        else:
+            get_position = self._get_position_
+
+        return (get_position(index, ignore_metadata=ignore_metadata)
                 for index in indices)
 
     @experimental(as_of='0.4.1')
@@ -1405,33 +1473,98 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         if self.has_positional_metadata():
             positional_metadata = self.positional_metadata
 
-        consensus = []
-        for position in self.iter_positions(ignore_metadata=True):
-            freqs = position.frequencies()
+        if len(self):
+            counts = self._position_counts()
+            self._merge_gap_counts(counts)
+
+            # Ties are broken in favor of non-gap characters, so the gap
+            # character only wins a position where it is strictly the most
+            # frequent.
+            gap_code = ord(dtype.default_gap_char)
+            gap_counts = counts[:, gap_code].copy()
+            counts[:, gap_code] = 0
+            consensus = np.argmax(counts, axis=1)
+            max_counts = counts[np.arange(len(consensus)), consensus]
+            consensus[gap_counts > max_counts] = gap_code
+            consensus = consensus.astype(np.uint8)
+        else:
+            consensus = np.array([], dtype=np.uint8)
 
-            gap_freq = 0
-            for gap_char in dtype.gap_chars:
-                if gap_char in freqs:
-                    gap_freq += freqs.pop(gap_char)
-            assert dtype.default_gap_char not in freqs
-            freqs[dtype.default_gap_char] = gap_freq
+        return dtype(consensus, positional_metadata=positional_metadata)
 
-            consensus.append(collections.Counter(freqs).most_common(1)[0][0])
+    def _position_counts(self, codes=None):
+        """Count the occurrences of each character at each position.
+
+        Parameters
+        ----------
+        codes : 1D array_like (int), optional
+            ASCII codes of the characters to count, which must include every
+            character in the MSA. If provided, column ``j`` of the counts
+            holds the occurrences of ``codes[j]``, so the counts do not need
+            a column for each of the 256 ASCII codes.
 
-        return dtype(''.join(consensus),
-                     positional_metadata=positional_metadata)
+        Returns
+        -------
+        2D np.ndarray (int)
+            Array of shape ``(n_positions, 256)`` where element ``[i, c]`` is
+            the number of sequences with the character of ASCII code ``c`` at
+            position ``i``, or of shape ``(n_positions, len(codes))`` if
+            `codes` is provided.
 
-    def _build_inverse_shannon_uncertainty_f(self, include_gaps):
+        """
+        matrix = self._byte_matrix
+        n_sequences, n_positions = matrix.shape
+        if codes is None:
+            n_codes = Sequence._number_of_extended_ascii_codes
+        else:
+            n_codes = len(codes)
+            lookup = np.zeros(Sequence._number_of_extended_ascii_codes,
+                              dtype=int)
+            lookup[np.asarray(codes, dtype=int)] = np.arange(n_codes)
+
+        # Counts are accumulated over blocks of sequences so that the
+        # temporary array of (position, character) codes stays small.
+        offsets = np.arange(n_positions) * n_codes
+        block_size = max(1, _COUNTS_BLOCK_SIZE // max(1, n_positions))
+
+        counts = np.zeros(n_positions * n_codes, dtype=int)
+        for start in range(0, n_sequences, block_size):
+            block = matrix[start:start + block_size]
+            if codes is not None:
+                block = lookup[block]
+            counts += np.bincount((block + offsets).ravel(),
+                                  minlength=counts.size)
+        return counts.reshape(n_positions, n_codes)
+
+    def _present_codes(self):
+        """Return the sorted ASCII codes of the characters in the MSA."""
+        present = np.zeros(Sequence._number_of_extended_ascii_codes,
+                           dtype=bool)
+        for row in self._byte_matrix:
+            present[row] = True
+        return np.flatnonzero(present)
+
+    def _merge_gap_counts(self, counts):
+        """Recode the gap characters in `counts` as the default gap character.
+
+        `counts` is modified in place.
+
+        """
+        gap_codes = np.asarray(self.dtype._gap_codes, dtype=int)
+        gap_counts = counts[:, gap_codes].sum(axis=1)
+        counts[:, gap_codes] = 0
+        counts[:, ord(self.dtype.default_gap_char)] = gap_counts
+
+    def _inverse_shannon_uncertainty(self, counts, include_gaps):
         base = len(self.dtype.definite_chars)
         if include_gaps:
             # Increment the base by one to reflect the possible inclusion of
             # the default gap character.
             base += 1
 
-        def f(p):
-            freqs = list(p.frequencies().values())
-            return 1. - scipy.stats.entropy(freqs, base=base)
-        return f
+        totals = counts.sum(axis=1, keepdims=True)
+        freqs = counts / np.maximum(totals, 1)
+        return 1. - scipy.special.entr(freqs).sum(axis=1) / np.log(base)
 
     @experimental(as_of='0.4.1')
     def conservation(self, metric='inverse_shannon_uncertainty',
@@ -1523,51 +1656,49 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
             # handle empty alignment to avoid error on lookup of character sets
             return np.array([])
 
+        counts = self._position_counts()
+        gap_codes = np.asarray(self.dtype._gap_codes, dtype=int)
+        degenerate_codes = np.asarray(self.dtype._degenerate_codes, dtype=int)
+        has_gaps = counts[:, gap_codes].any(axis=1)
+        has_degenerates = counts[:, degenerate_codes].any(axis=1)
+
+        # Report the first position that cannot be scored, checking
+        # degenerate characters before gaps as each position is visited.
+        degenerate_errors = has_degenerates & (degenerate_mode == 'error')
+        gap_errors = has_gaps & (gap_mode == 'error')
+        errors = degenerate_errors | gap_errors
+        if errors.any():
+            position = np.argmax(errors)
+            if degenerate_errors[position]:
+                pos_seq = self.dtype(self._get_position_from_matrix(
+                    position, ignore_metadata=True))
+                degenerate_chars = pos_seq[pos_seq.degenerates()]
+                raise ValueError("Conservation is undefined for positions "
+                                 "with degenerate characters. The "
+                                 "following degenerate characters were "
+                                 "observed: %s." % degenerate_chars)
+            raise ValueError("Gap characters present in alignment.")
+
+        if gap_mode == 'ignore':
+            counts[:, gap_codes] = 0
+        elif gap_mode == 'include':
+            # Recode all gap characters with the default gap character.
+            self._merge_gap_counts(counts)
+
         # Since the only currently allowed metric is
         # inverse_shannon_uncertainty, and we already know that a valid metric
-        # was provided, we just define metric_f here. When additional metrics
-        # are supported, this will be handled differently (e.g., via a lookup
-        # or if/elif/else).
-        metric_f = self._build_inverse_shannon_uncertainty_f(
-                        gap_mode == 'include')
-
-        result = []
-        for p in self.iter_positions(ignore_metadata=True):
-            cons = None
-            # cast p to self.dtype for access to gap/degenerate related
-            # functionality
-            pos_seq = self.dtype(p)
-
-            # handle degenerate characters if present
-            if pos_seq.has_degenerates():
-                if degenerate_mode == 'nan':
-                    cons = np.nan
-                else:  # degenerate_mode == 'error' is the only choice left
-                    degenerate_chars = pos_seq[pos_seq.degenerates()]
-                    raise ValueError("Conservation is undefined for positions "
-                                     "with degenerate characters. The "
-                                     "following degenerate characters were "
-                                     "observed: %s." % degenerate_chars)
-
-            # handle gap characters if present
-            if pos_seq.has_gaps():
-                if gap_mode == 'nan':
-                    cons = np.nan
-                elif gap_mode == 'error':
-                    raise ValueError("Gap characters present in alignment.")
-                elif gap_mode == 'ignore':
-                    pos_seq = pos_seq.degap()
-                else:  # gap_mode == 'include' is the only choice left
-                    # Recode all gap characters with pos_seq.default_gap_char.
-                    pos_seq = pos_seq.replace(pos_seq.gaps(),
-                                              pos_seq.default_gap_char)
-
-            if cons is None:
-                cons = metric_f(pos_seq)
-
-            result.append(cons)
-
-        return np.array(result)
+        # was provided, we just compute it here. When additional metrics are
+        # supported, this will be handled differently (e.g., via a lookup or
+        # if/elif/else).
+        result = self._inverse_shannon_uncertainty(
+            counts, gap_mode == 'include')
+
+        if degenerate_mode == 'nan':
+            result[has_degenerates] = np.nan
+        if gap_mode == 'nan':
+            result[has_gaps] = np.nan
+
+        return result
 
     @experimental(as_of='0.4.1')
     def gap_frequencies(self, axis='sequence', relative=False):
@@ -1627,24 +1758,25 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
 
         """
         if self._is_sequence_axis(axis):
-            seq_iterator = self.iter_positions(ignore_metadata=True)
             length = self.shape.sequence
+            sum_axis = 0
         else:
-            seq_iterator = self
             length = self.shape.position
+            sum_axis = 1
 
-        gap_freqs = []
-        for seq in seq_iterator:
-            # Not using Sequence.frequencies(relative=relative) because each
-            # gap character's relative frequency is computed separately and
-            # must be summed. This is less precise than summing the absolute
-            # frequencies of gap characters and dividing by the length. Likely
-            # not a big deal for typical gap characters ('-', '.') but can be
-            # problematic as the number of gap characters grows (we aren't
-            # guaranteed to always have two gap characters). See unit tests for
-            # an example.
-            freqs = seq.frequencies(chars=self.dtype.gap_chars)
-            gap_freqs.append(sum(freqs.values()))
+        if len(self):
+            # Counting all gap characters at once and dividing by the length
+            # is more precise than summing the relative frequency of each gap
+            # character. Likely not a big deal for typical gap characters
+            # ('-', '.') but can be problematic as the number of gap characters
+            # grows (we aren't guaranteed to always have two gap characters).
+            # See unit tests for an example.
+            matrix = self._byte_matrix
+            is_gap = np.in1d(matrix, self.dtype._gap_codes).reshape(
+                matrix.shape)
+            gap_freqs = is_gap.sum(axis=sum_axis)
+        else:
+            gap_freqs = []
 
         gap_freqs = np.asarray(gap_freqs, dtype=float if relative else int)
 
@@ -1653,6 +1785,91 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
 
         return gap_freqs
 
+    @experimental(as_of='0.5.3')
+    def hamming_distances(self, ignore_gaps=False, ignore_degenerates=False):
+        """Compute the Hamming distances between all pairs of sequences.
+
+        The Hamming distance between two aligned sequences is the proportion
+        of positions where their characters differ.
+
+        Parameters
+        ----------
+        ignore_gaps : bool, optional
+            If ``True``, positions where either sequence of a pair has a gap
+            character are not compared, and the distance is the proportion of
+            differing characters among the remaining positions.
+        ignore_degenerates : bool, optional
+            If ``True``, positions where either sequence of a pair has a
+            degenerate character are not compared, as with `ignore_gaps`.
+
+        Returns
+        -------
+        DistanceMatrix
+            Hamming distances between the sequences. The IDs are the MSA's
+            index labels, converted to strings.
+
+        Raises
+        ------
+        ValueError
+            If a pair of sequences has no positions to compare (e.g., if the
+            MSA has no positions).
+
+        See Also
+        --------
+        skbio.sequence.distance.hamming
+        skbio.tree.nj
+
+        Notes
+        -----
+        If no characters are ignored, the distances are the same as those
+        computed by ``skbio.sequence.distance.hamming`` on each pair of
+        sequences: characters that may be considered equivalent (e.g., `-` and
+        `.` as gap characters) are treated as distinct characters.
+
+        All of the distances are computed at once from the MSA's characters:
+        each distinct character is one-hot encoded, and the number of
+        positions where each pair of sequences share a character is obtained
+        with matrix products over blocks of positions.
+
+        Examples
+        --------
+        >>> from skbio import DNA, TabularMSA
+        >>> msa = TabularMSA([DNA('ACGT'), DNA('A-GA'), DNA('ACNA')],
+        ...                  index=['a', 'b', 'c'])
+        >>> dm = msa.hamming_distances()
+        >>> print(dm['a', 'b'])
+        0.5
+        >>> print(dm['b', 'c'])
+        0.5
+
+        Positions with gaps or degenerate characters can be ignored:
+
+        >>> dm = msa.hamming_distances(ignore_gaps=True,
+        ...                            ignore_degenerates=True)
+        >>> print(round(dm['a', 'b'], 3))
+        0.333
+        >>> print(dm['b', 'c'])
+        0.0
+
+        """
+        matrix = self._byte_matrix
+        compare = None
+        ignored_codes = []
+        if ignore_gaps:
+            ignored_codes.extend(self.dtype._gap_codes)
+        if ignore_degenerates:
+            ignored_codes.extend(self.dtype._degenerate_codes)
+        if ignored_codes:
+            compare = ~np.in1d(matrix, ignored_codes).reshape(matrix.shape)
+
+        distances = _pairwise_hamming_from_bytes(matrix, compare)
+        if np.isnan(distances).any():
+            raise ValueError(
+                "Cannot compute the Hamming distance between sequences with "
+                "no positions to compare.")
+
+        return DistanceMatrix(distances, [str(label) for label in self.index])
+
     @experimental(as_of='0.4.1')
     def reassign_index(self, mapping=None, minter=None):
         """Reassign index labels to sequences in this MSA.
@@ -1981,6 +2198,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
                                   stop=len(self) + len(sequences),
                                   step=1)
 
+        self._byte_matrix_cache = None
         if len(self):
             self._seqs = self._seqs.append(pd.Series(sequences, index=index))
         else:
@@ -2402,6 +2620,7 @@ class TabularMSA(MetadataMixin, PositionalMetadataMixin, SkbioObject):
         """
         series = self._seqs.sort_index(ascending=ascending, level=level)
         self._seqs = series
+        self._byte_matrix_cache = None
 
     @experimental(as_of='0.4.1')
     def to_dict(self):
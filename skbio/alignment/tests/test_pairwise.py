@@ -19,8 +19,10 @@ from skbio.alignment import (
     global_pairwise_align)
 from skbio.alignment._pairwise import (
     _init_matrices_sw, _init_matrices_nw,
-    _compute_score_and_traceback_matrices, _traceback, _first_largest,
-    _compute_substitution_score)
+    _init_matrices_nw_no_terminal_gap_penalty,
+    _compute_score_and_traceback_matrices, _traceback,
+    _compute_substitution_scores,
+    _compute_score, _init_edge)
 from skbio.sequence import GrammaredSequence
 from skbio.util import classproperty
 from skbio.util._decorator import overrides
@@ -314,6 +316,55 @@ class PairwiseAlignmentTests(TestCase):
                             "TTGGACC-AAGGTTAAAAAAAAAAAAAAAAAAAAAAAAAA")]))
         self.assertEqual(obs_score, 97.0)
 
+    def test_global_pairwise_align_score_only(self):
+        seq1 = DNA("ACCGTGGACCGTTAGGATTGGACCCAAGGTTG")
+        seq2 = DNA("T"*25 + "ACCGTGGACCGTAGGATTGGACCAAGGTTA" + "A"*25)
+        for penalize_terminal_gaps in True, False:
+            _, expected, _ = global_pairwise_align_nucleotide(
+                seq1, seq2, gap_open_penalty=5., gap_extend_penalty=0.5,
+                match_score=5, mismatch_score=-4,
+                penalize_terminal_gaps=penalize_terminal_gaps)
+            obs = global_pairwise_align_nucleotide(
+                seq1, seq2, gap_open_penalty=5., gap_extend_penalty=0.5,
+                match_score=5, mismatch_score=-4,
+                penalize_terminal_gaps=penalize_terminal_gaps,
+                score_only=True)
+            self.assertEqual(obs, expected)
+
+        obs = global_pairwise_align_protein(
+            Protein("HEAGAWGHEE"), Protein("PAWHEAE"), gap_open_penalty=10.,
+            gap_extend_penalty=5., penalize_terminal_gaps=True,
+            score_only=True)
+        self.assertEqual(obs, 1.0)
+
+    def test_global_pairwise_align_score_only_alignments(self):
+        aln1 = TabularMSA([DNA('GACCTTGACCAGGTACC'),
+                           DNA('GAACTTTGAC---TACC')])
+        aln2 = TabularMSA([DNA('GACCGTTGACCAGGTACC'),
+                           DNA('GACCATTGACCAGGTACC')])
+        _, expected, _ = global_pairwise_align_nucleotide(
+            aln1, aln2, gap_open_penalty=5, gap_extend_penalty=0.5)
+        obs = global_pairwise_align_nucleotide(
+            aln1, aln2, gap_open_penalty=5, gap_extend_penalty=0.5,
+            score_only=True)
+        self.assertEqual(obs, expected)
+
+    def test_local_pairwise_align_score_only(self):
+        _, expected, _ = local_pairwise_align_protein(
+            Protein("HEAGAWGHEE"), Protein("PAWHEAE"), gap_open_penalty=10.,
+            gap_extend_penalty=5.)
+        obs = local_pairwise_align_protein(
+            Protein("HEAGAWGHEE"), Protein("PAWHEAE"), gap_open_penalty=10.,
+            gap_extend_penalty=5., score_only=True)
+        self.assertEqual(obs, expected)
+
+        _, expected, _ = local_pairwise_align_nucleotide(
+            DNA("GACCTTGACCAGGTACC"), DNA("GAACTTTGACGTAAC"))
+        obs = local_pairwise_align_nucleotide(
+            DNA("GACCTTGACCAGGTACC"), DNA("GAACTTTGACGTAAC"),
+            score_only=True)
+        self.assertEqual(obs, expected)
+
     def test_local_pairwise_align_protein(self):
         obs_msa, obs_score, obs_start_end = local_pairwise_align_protein(
             Protein("HEAGAWGHEE"), Protein("PAWHEAE"), gap_open_penalty=10.,
@@ -565,43 +616,6 @@ class PairwiseAlignmentTests(TestCase):
         np.testing.assert_array_equal(actual_score_m, expected_score_m)
         np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
 
-    def test_compute_substitution_score(self):
-        # these results were computed manually
-        subs_m = make_identity_substitution_matrix(5, -4)
-        gap_chars = set('-.')
-
-        self.assertEqual(
-            _compute_substitution_score(['A'], ['A'], subs_m, 0, gap_chars),
-            5.0)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A'], subs_m, 0,
-                                        gap_chars),
-            5.0)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'C'], ['A'], subs_m, 0,
-                                        gap_chars),
-            0.5)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'C'], ['A', 'C'], subs_m, 0,
-                                        gap_chars),
-            0.5)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A', '-'], subs_m, 0,
-                                        gap_chars),
-            2.5)
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A', '-'], subs_m, 1,
-                                        gap_chars),
-            3)
-
-        # alt subs_m
-        subs_m = make_identity_substitution_matrix(1, -2)
-
-        self.assertEqual(
-            _compute_substitution_score(['A', 'A'], ['A', '-'], subs_m, 0,
-                                        gap_chars),
-            0.5)
-
     def test_compute_score_and_traceback_matrices(self):
         # these results were computed manually
         expected_score_m = [[0, -5, -7, -9],
@@ -661,6 +675,99 @@ class PairwiseAlignmentTests(TestCase):
         np.testing.assert_array_equal(actual_score_m, expected_score_m)
         np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
 
+    def test_compute_score_and_traceback_matrices_local(self):
+        expected_score_m = [[0, 0, 0, 0, 0, 0],
+                            [0, 0, 2, 0, 0, 0],
+                            [0, 0, 0, 4, 0, 0],
+                            [0, 0, 0, 0, 6, 2]]
+        expected_tback_m = [[0, 0, 0, 0, 0, 0],
+                            [0, 0, 1, 0, 0, 0],
+                            [0, 0, 0, 1, 0, 0],
+                            [0, 0, 0, 0, 1, 1]]
+        m = make_identity_substitution_matrix(2, -1)
+        actual_score_m, actual_tback_m = _compute_score_and_traceback_matrices(
+            TabularMSA([DNA('ACGTT')]), TabularMSA([DNA('CGT')]), 5, 2, m,
+            new_alignment_score=0.0, init_matrices_f=_init_matrices_sw)
+        np.testing.assert_array_equal(actual_score_m, expected_score_m)
+        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
+
+    def test_compute_score_and_traceback_matrices_no_terminal_gaps(self):
+        expected_score_m = [[0, 0, 0, 0, 0, 0],
+                            [0, -1, 2, -1, -1, 0],
+                            [0, -1, -2, 4, -1, 0],
+                            [0, 0, 0, 0, 6, 6]]
+        expected_tback_m = [[0, 3, 3, 3, 3, 3],
+                            [2, 1, 1, 1, 1, 2],
+                            [2, 1, 1, 1, 3, 2],
+                            [2, 3, 3, 3, 1, 3]]
+        m = make_identity_substitution_matrix(2, -1)
+        actual_score_m, actual_tback_m = _compute_score_and_traceback_matrices(
+            TabularMSA([DNA('ACGTT')]), TabularMSA([DNA('CGT')]), 5, 2, m,
+            init_matrices_f=_init_matrices_nw_no_terminal_gap_penalty,
+            penalize_terminal_gaps=False)
+        np.testing.assert_array_equal(actual_score_m, expected_score_m)
+        np.testing.assert_array_equal(actual_tback_m, expected_tback_m)
+
+    def test_init_edge(self):
+        aln1 = TabularMSA([DNA('ACGTT')])
+        aln2 = TabularMSA([DNA('CGT')])
+        for init_matrices_f in (_init_matrices_sw, _init_matrices_nw,
+                                _init_matrices_nw_no_terminal_gap_penalty):
+            score_m, tback_m = init_matrices_f(aln1, aln2, 5, 2)
+            scores, tback = _init_edge(5, 5, 2, init_matrices_f, 3)
+            np.testing.assert_array_equal(scores, score_m[0])
+            np.testing.assert_array_equal(tback, tback_m[0])
+            scores, tback = _init_edge(3, 5, 2, init_matrices_f, 2)
+            np.testing.assert_array_equal(scores, score_m[:, 0])
+            np.testing.assert_array_equal(tback, tback_m[:, 0])
+
+    def test_compute_score(self):
+        # the scores of the matrices tested in
+        # test_compute_score_and_traceback_matrices*
+        m = make_identity_substitution_matrix(2, -1)
+        self.assertEqual(
+            _compute_score(TabularMSA([DNA('ACG')]),
+                           TabularMSA([DNA('ACGT')]), 5, 2, m), 1)
+
+        aln1 = TabularMSA([DNA('ACGTT')])
+        aln2 = TabularMSA([DNA('CGT')])
+        self.assertEqual(
+            _compute_score(
+                aln1, aln2, 5, 2, m,
+                init_matrices_f=_init_matrices_nw_no_terminal_gap_penalty,
+                penalize_terminal_gaps=False), 6)
+        self.assertEqual(
+            _compute_score(aln1, aln2, 5, 2, m, new_alignment_score=0.0,
+                           init_matrices_f=_init_matrices_sw, local=True), 6)
+
+    def test_compute_score_empty(self):
+        m = make_identity_substitution_matrix(2, -1)
+        self.assertEqual(
+            _compute_score(TabularMSA([DNA('')]), TabularMSA([DNA('ACG')]),
+                           5, 2, m), -9)
+        self.assertEqual(
+            _compute_score(TabularMSA([DNA('')]), TabularMSA([DNA('')]),
+                           5, 2, m), 0)
+
+    def test_compute_substitution_scores(self):
+        m = make_identity_substitution_matrix(5, -4)
+        aln1 = TabularMSA([DNA('AAC-'), DNA('CA-.')])
+        aln2 = TabularMSA([DNA('AC'), DNA('-C'), DNA('GC')])
+
+        actual = _compute_substitution_scores(aln1, aln2, m, 1)
+
+        # these results were computed manually: each score is the average
+        # over the 6 pairs of characters at the two positions
+        expected = [[-5 / 6, 2 / 3, -2 / 3, 1],
+                    [0.5, -4, 3, 1]]
+        np.testing.assert_allclose(actual, expected)
+
+    def test_compute_substitution_scores_no_positions(self):
+        m = make_identity_substitution_matrix(5, -4)
+        actual = _compute_substitution_scores(
+            TabularMSA([DNA('')]), TabularMSA([DNA('ACG')]), m, 0)
+        self.assertEqual(actual.shape, (3, 0))
+
     def test_compute_score_and_traceback_matrices_invalid(self):
         # if the sequence contains a character that is not in the
         # substitution matrix, an informative error should be raised
@@ -743,20 +850,6 @@ class PairwiseAlignmentTests(TestCase):
                             3, 3)
         self.assertEqual(actual, expected)
 
-    def test_first_largest(self):
-        input = [(5, 'a'), (5, 'b'), (5, 'c')]
-        self.assertEqual(_first_largest(input), (5, 'a'))
-        input = [(5, 'c'), (5, 'b'), (5, 'a')]
-        self.assertEqual(_first_largest(input), (5, 'c'))
-        input = [(5, 'c'), (6, 'b'), (5, 'a')]
-        self.assertEqual(_first_largest(input), (6, 'b'))
-        # works for more than three entries
-        input = [(5, 'c'), (6, 'b'), (5, 'a'), (7, 'd')]
-        self.assertEqual(_first_largest(input), (7, 'd'))
-        # Note that max([(5, 'a'), (5, 'c')]) == max([(5, 'c'), (5, 'a')])
-        # but for the purposes needed here, we want the max to be the same
-        # regardless of what the second item in the tuple is.
-
 
 if __name__ == "__main__":
     main()
@@ -555,6 +555,45 @@ class TestStripedSmithWaterman(TestSSW):
         alignment = query("CGCGCGCCGCCGGGGGGCCGGCCGGCGCCGGGGGGCGCCCCGGGCGGGGC")
         self._check_alignment(alignment, expected)
 
+    def _check_align_many(self, query, target_sequences):
+        columns = ['optimal_alignment_score', 'suboptimal_alignment_score',
+                   'query_begin', 'query_end', 'target_begin',
+                   'target_end_optimal', 'target_end_suboptimal', 'cigar']
+        results = query.align_many(target_sequences)
+        self.assertEqual(list(results.columns), columns)
+        self.assertEqual(len(results), len(target_sequences))
+        for (_, row), target_sequence in zip(results.iterrows(),
+                                             target_sequences):
+            alignment = query(target_sequence)
+            for attribute in columns:
+                self.assertEqual(row[attribute], alignment[attribute])
+
+    def test_align_many(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        self._check_align_many(query, [
+            "TTATAATTTTCTTATTATTATCAATATTTATAATTTGATTTTGTTGTAAT",
+            "AGTCGAAGGGTAATATAGGCGTGTCACCTA",
+            "AGGGTAATTAGGCGTGTTCACCTA",
+            "TTTTTTTTTT"])
+
+    def test_align_many_protein(self):
+        query = StripedSmithWaterman(
+            "HEAGAWGHEE", protein=True, substitution_matrix=blosum50,
+            gap_open_penalty=10, gap_extend_penalty=1)
+        self._check_align_many(query, ["PAWHEAE", "HEAGAWGHEE", "WWWW"])
+
+    def test_align_many_args(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA",
+                                     zero_index=False, score_only=True)
+        self._check_align_many(query, ["AGTCGAAGGGTAATATAGGCGTGTCACCTA",
+                                       "TTTTTTTTTT"])
+
+    def test_align_many_empty(self):
+        query = StripedSmithWaterman("AGGGTAATTAGGCGTGTTCACCTA")
+        results = query.align_many([])
+        self.assertEqual(len(results), 0)
+        self.assertEqual(len(results.columns), 8)
+
 
 class TestAlignStripedSmithWaterman(TestSSW):
     def _check_TabularMSA_to_AlignmentStructure(self, alignment, structure,
@@ -12,13 +12,15 @@ import unittest
 import functools
 import itertools
 import types
+from unittest import mock
 
 import numpy as np
 import numpy.testing as npt
 import pandas as pd
 import scipy.stats
 
-from skbio import Sequence, DNA, RNA, Protein, TabularMSA
+from skbio import Sequence, DNA, RNA, Protein, TabularMSA, DistanceMatrix
+from skbio.sequence.distance import hamming
 from skbio.sequence import GrammaredSequence
 from skbio.util import classproperty
 from skbio.util._decorator import overrides
@@ -3044,6 +3046,23 @@ class TestConsensus(unittest.TestCase):
 
         self.assertTrue(cons in [DNA('T'), DNA('-')])
 
+    def test_ties_between_residue_and_gap(self):
+        msa = TabularMSA([DNA('A-T.'),
+                          DNA('-CG-')])
+
+        cons = msa.consensus()
+
+        self.assertEqual(cons, DNA('ACG-'))
+
+    def test_gap_majority(self):
+        msa = TabularMSA([DNA('-.'),
+                          DNA('.-'),
+                          DNA('GT')])
+
+        cons = msa.consensus()
+
+        self.assertEqual(cons, DNA('--'))
+
     def test_default_gap_char(self):
         msa = TabularMSA([DNA('.'),
                           DNA('.'),
@@ -3376,6 +3395,28 @@ class TestConservation(unittest.TestCase):
         with self.assertRaisesRegex(ValueError, 'xyz'):
             msa.conservation(gap_mode='xyz')
 
+    def test_first_error_position_reported(self):
+        msa = TabularMSA([DNA('A-AN'),
+                          DNA('AAAA')])
+        with self.assertRaisesRegex(ValueError, 'Gap'):
+            msa.conservation(gap_mode='error')
+
+        msa = TabularMSA([DNA('ARA-'),
+                          DNA('AYAA')])
+        with self.assertRaisesRegex(ValueError, 'observed: RY'):
+            msa.conservation(gap_mode='error')
+
+        msa = TabularMSA([DNA('AA-A'),
+                          DNA('AAAN')])
+        with self.assertRaisesRegex(ValueError, 'Gap'):
+            msa.conservation(degenerate_mode='nan', gap_mode='error')
+
+    def test_gap_mode_ignore_all_gaps(self):
+        msa = TabularMSA([DNA('A-'),
+                          DNA('A.')])
+        actual = msa.conservation(gap_mode='ignore')
+        npt.assert_array_equal(actual, np.array([1., 1.]))
+
     def test_bad_degenerate_mode(self):
         msa = TabularMSA([DNA('AA'),
                           DNA('A-')])
@@ -3635,6 +3676,66 @@ class TestGapFrequencies(unittest.TestCase):
         npt.assert_array_equal(np.array([0, 0, 2, 4, 4]), freqs)
 
 
+class TestHammingDistances(unittest.TestCase):
+    def test_matches_hamming(self):
+        msa = TabularMSA([DNA('ACGT-A'), DNA('A-GA.A'), DNA('ACNA-A'),
+                          DNA('TTTT-A')], index=['a', 'b', 'c', 'd'])
+
+        dm = msa.hamming_distances()
+
+        self.assertIsInstance(dm, DistanceMatrix)
+        self.assertEqual(dm.ids, ('a', 'b', 'c', 'd'))
+        for (id1, seq1), (id2, seq2) in itertools.product(
+                zip(msa.index, msa), repeat=2):
+            self.assertEqual(dm[id1, id2], hamming(seq1, seq2))
+
+    def test_ignore_gaps(self):
+        msa = TabularMSA([DNA('ACGT'), DNA('A-GA'), DNA('.CNA')])
+
+        dm = msa.hamming_distances(ignore_gaps=True)
+
+        npt.assert_almost_equal(dm.data, [[0, 1 / 3, 2 / 3],
+                                          [1 / 3, 0, 1 / 2],
+                                          [2 / 3, 1 / 2, 0]])
+
+    def test_ignore_degenerates(self):
+        msa = TabularMSA([DNA('ACGT'), DNA('A-GA'), DNA('.CNA')])
+
+        dm = msa.hamming_distances(ignore_degenerates=True)
+        npt.assert_almost_equal(dm.data, [[0, 2 / 4, 2 / 3],
+                                          [2 / 4, 0, 2 / 3],
+                                          [2 / 3, 2 / 3, 0]])
+
+        dm = msa.hamming_distances(ignore_gaps=True, ignore_degenerates=True)
+        npt.assert_almost_equal(dm.data, [[0, 1 / 3, 1 / 2],
+                                          [1 / 3, 0, 0],
+                                          [1 / 2, 0, 0]])
+
+    def test_many_positions(self):
+        # more positions than are one-hot encoded at once
+        seqs = [DNA(''.join(np.random.RandomState(i).choice(
+            list('ACGT-'), 1000))) for i in range(5)]
+        msa = TabularMSA(seqs)
+
+        with mock.patch('skbio.sequence.distance._HAMMING_BLOCK_SIZE', 7):
+            dm = msa.hamming_distances()
+
+        for i, j in itertools.combinations(range(5), 2):
+            self.assertEqual(dm[i, j], hamming(seqs[i], seqs[j]))
+
+    def test_single_sequence(self):
+        dm = TabularMSA([DNA('ACGT')]).hamming_distances()
+        self.assertEqual(dm, DistanceMatrix([[0]], ['0']))
+
+    def test_no_positions_to_compare(self):
+        with self.assertRaisesRegex(ValueError, 'no positions'):
+            TabularMSA([DNA(''), DNA('')]).hamming_distances()
+
+        with self.assertRaisesRegex(ValueError, 'no positions'):
+            TabularMSA([DNA('A-'), DNA('-G')]).hamming_distances(
+                ignore_gaps=True)
+
+
 class TestGetPosition(unittest.TestCase):
     def test_without_positional_metadata(self):
         msa = TabularMSA([DNA('ACG'),
@@ -3655,6 +3756,146 @@ class TestGetPosition(unittest.TestCase):
         self.assertEqual(position,
                          Sequence('C-', metadata={'foo': 43, 'bar': 'def'}))
 
+    def test_with_sequence_positional_metadata(self):
+        msa = TabularMSA([DNA('ACG', positional_metadata={'foo': [1, 2, 3]}),
+                          DNA('A-G')])
+
+        position = msa._get_position_(1)
+
+        self.assertEqual(position,
+                         Sequence('C-', positional_metadata={
+                             'foo': [2, np.nan]}))
+        self.assertEqual(msa._get_position_(1, ignore_metadata=True),
+                         Sequence('C-'))
+
+    def test_negative_index(self):
+        msa = TabularMSA([DNA('ACG'),
+                          DNA('A-T')])
+
+        self.assertEqual(msa._get_position_(-1), Sequence('GT'))
+        with self.assertRaises(IndexError):
+            msa._get_position_(3)
+
+
+class TestByteMatrix(unittest.TestCase):
+    def test_byte_matrix(self):
+        msa = TabularMSA([DNA('ACG'),
+                          DNA('A-T')])
+
+        obs = msa._byte_matrix
+
+        npt.assert_array_equal(obs, np.array([list(b'ACG'), list(b'A-T')],
+                                             dtype=np.uint8))
+        self.assertEqual(obs.dtype, np.uint8)
+        self.assertFalse(obs.flags.writeable)
+        self.assertIs(msa._byte_matrix, obs)
+
+    def test_no_sequences(self):
+        self.assertEqual(TabularMSA([])._byte_matrix.shape, (0, 0))
+
+    def test_no_positions(self):
+        msa = TabularMSA([DNA(''), DNA('')])
+
+        self.assertEqual(msa._byte_matrix.shape, (2, 0))
+
+    def test_reset_when_sequences_change(self):
+        msa = TabularMSA([DNA('ACG'), DNA('A-T')], index=['b', 'a'])
+        msa._byte_matrix
+
+        msa.append(DNA('TTT'), index='c')
+        npt.assert_array_equal(msa._byte_matrix[:, 2], list(b'GTT'))
+
+        msa.sort()
+        npt.assert_array_equal(msa._byte_matrix[:, 2], list(b'TGT'))
+
+        msa.extend([DNA('CCC')], index=['d'])
+        npt.assert_array_equal(msa._byte_matrix[:, 2], list(b'TGTC'))
+
+    def test_slice_positions_shares_matrix(self):
+        msa = TabularMSA([DNA('ACGT', metadata={'id': 'x'}),
+                          DNA('A-TT')],
+                         metadata={'foo': 'bar'},
+                         positional_metadata={'p': [1, 2, 3, 4]},
+                         index=['x', 'y'])
+
+        obs = msa.iloc[:, 1:3]
+
+        self.assertEqual(obs, TabularMSA([DNA('CG', metadata={'id': 'x'}),
+                                          DNA('-T')],
+                                         metadata={'foo': 'bar'},
+                                         positional_metadata={'p': [2, 3]},
+                                         index=['x', 'y']))
+        npt.assert_array_equal(obs._byte_matrix,
+                               np.array([list(b'CG'), list(b'-T')],
+                                        dtype=np.uint8))
+        self.assertTrue(all(np.shares_memory(seq._bytes, obs._byte_matrix)
+                            for seq in obs))
+        self.assertFalse(obs._byte_matrix.flags.writeable)
+
+    def test_slice_positions_with_sequence_positional_metadata(self):
+        msa = TabularMSA([DNA('ACGT', positional_metadata={'q': [1, 2, 3, 4]}),
+                          DNA('A-TT')])
+
+        obs = msa.iloc[:, [3, 0]]
+
+        self.assertEqual(obs, TabularMSA([
+            DNA('TA', positional_metadata={'q': [4, 1]}),
+            DNA('TA')]))
+
+
+class TestPositionCounts(unittest.TestCase):
+    def test_position_counts(self):
+        msa = TabularMSA([DNA('AC-'),
+                          DNA('AG.'),
+                          DNA('TG-')])
+
+        obs = msa._position_counts()
+
+        self.assertEqual(obs.shape, (3, 256))
+        exp = np.zeros((3, 256), dtype=int)
+        exp[0, ord('A')] = 2
+        exp[0, ord('T')] = 1
+        exp[1, ord('C')] = 1
+        exp[1, ord('G')] = 2
+        exp[2, ord('-')] = 2
+        exp[2, ord('.')] = 1
+        npt.assert_array_equal(obs, exp)
+
+    def test_no_positions(self):
+        msa = TabularMSA([DNA(''), DNA('')])
+
+        self.assertEqual(msa._position_counts().shape, (0, 256))
+
+    def test_counted_in_blocks(self):
+        msa = TabularMSA([DNA('ACGT'[i % 4] * 3) for i in range(10)])
+
+        with mock.patch('skbio.alignment._tabular_msa._COUNTS_BLOCK_SIZE', 4):
+            obs = msa._position_counts()
+
+        npt.assert_array_equal(obs[:, [ord(c) for c in 'ACGT']],
+                               [[3, 3, 2, 2]] * 3)
+        self.assertEqual(obs.sum(), 30)
+
+    def test_selected_codes(self):
+        msa = TabularMSA([DNA('AC-'),
+                          DNA('AG.'),
+                          DNA('TG-')])
+        codes = msa._present_codes()
+        npt.assert_array_equal(codes, sorted(map(ord, '-.ACGT')))
+
+        obs = msa._position_counts(codes)
+
+        npt.assert_array_equal(obs, msa._position_counts()[:, codes])
+        npt.assert_array_equal(msa._position_counts(codes[::-1]),
+                               obs[:, ::-1])
+
+        with mock.patch('skbio.alignment._tabular_msa._COUNTS_BLOCK_SIZE', 2):
+            npt.assert_array_equal(msa._position_counts(codes), obs)
+
+        msa = TabularMSA([DNA(''), DNA('')])
+        self.assertEqual(msa._present_codes().shape, (0,))
+        self.assertEqual(msa._position_counts([]).shape, (0, 0))
+
 
 class TestIsSequenceAxis(unittest.TestCase):
     def setUp(self):
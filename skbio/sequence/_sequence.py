@@ -1861,7 +1861,7 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         return chars, indices
 
     @stable(as_of="0.4.0")
-    def iter_kmers(self, k, overlap=True):
+    def iter_kmers(self, k, overlap=True, raw=False):
         """Generate kmers of length `k` from this sequence.
 
         Parameters
@@ -1870,10 +1870,16 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
             The kmer length.
         overlap : bool, optional
             Defines whether the kmers should be overlapping or not.
+        raw : bool, optional
+            If ``True``, yield each kmer as a read-only ``np.uint8`` array
+            viewing this sequence's underlying bytes instead of as a
+            ``Sequence`` object. No data is copied and no metadata is
+            attached, which is much faster when kmers only need to be hashed
+            (e.g., with ``kmer.tobytes()``) or compared.
 
         Yields
         ------
-        Sequence
+        Sequence or 1D np.ndarray (np.uint8)
             kmer of length `k` contained in this sequence.
 
         Raises
@@ -1900,36 +1906,59 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         'CGT'
         'GTT'
 
-        """
-        if k < 1:
-            raise ValueError("k must be greater than 0.")
+        Raw kmers are views of the sequence's bytes:
 
-        if overlap:
-            step = 1
-            count = len(self) - k + 1
-        else:
-            step = k
-            count = len(self) // k
+        >>> for kmer in s.iter_kmers(4, overlap=False, raw=True):
+        ...     kmer.tobytes()
+        b'ACAC'
+        b'GACG'
+
+        """
+        kmers = self._kmer_windows(k, overlap)
 
-        if len(self) == 0 or self.has_positional_metadata():
-            # Slower path when sequence is empty or positional metadata needs
-            # to be sliced.
-            for i in range(0, len(self) - k + 1, step):
+        if raw:
+            for s in kmers:
+                yield s
+        elif self.has_positional_metadata():
+            # Slower path when positional metadata needs to be sliced.
+            step = 1 if overlap else k
+            for i in range(0, step * len(kmers), step):
                 yield self[i:i+k]
         else:
             # Optimized path when positional metadata doesn't need slicing.
-            kmers = np.lib.stride_tricks.as_strided(
-                self._bytes, shape=(k, count), strides=(1, step)).T
-
             metadata = None
             if self.has_metadata():
                 metadata = self.metadata
 
             for s in kmers:
-                yield self._constructor(
-                    sequence=s,
-                    metadata=metadata,
-                    positional_metadata=None)
+                yield self._from_bytes(s, metadata=metadata)
+
+    def _kmer_windows(self, k, overlap):
+        """Return a read-only 2D view of all kmers of length `k`.
+
+        Returns
+        -------
+        2D np.ndarray (np.uint8)
+            Array of shape ``(n_kmers, k)`` whose rows are the kmers of this
+            sequence, in the order of ``iter_kmers``. The array is a strided
+            view of the sequence's bytes, so no data is copied.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        step = 1 if overlap else k
+        count = max(0, (len(self) - k) // step + 1)
+
+        kmers = np.lib.stride_tricks.as_strided(
+            self._bytes, shape=(count, k), strides=(step, 1))
+        kmers.flags.writeable = False
+        return kmers
 
     @stable(as_of="0.4.0")
     def kmer_frequencies(self, k, overlap=True, relative=False):
@@ -1968,8 +1997,10 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
         {'ACA': 0.25, 'CAT': 0.25, 'TTA': 0.5}
 
         """
-        kmers = self.iter_kmers(k, overlap=overlap)
-        freqs = dict(collections.Counter((str(seq) for seq in kmers)))
+        positions, counts = self._count_kmers(k, overlap)
+        string = str(self)
+        freqs = {string[i:i + k]: count
+                 for i, count in zip(positions.tolist(), counts.tolist())}
 
         if relative:
             if overlap:
@@ -1984,6 +2015,89 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
 
         return freqs
 
+    def _kmer_codes(self, k, overlap, alphabet=None):
+        """Encode each kmer of this sequence as integers.
+
+        The characters of the sequence are recoded as indices into the sorted
+        set of distinct characters it contains (or into `alphabet`, a sorted
+        array of character codes that must include all of them), using as few
+        bits as possible (e.g., two bits for a sequence containing only
+        ``ACGT``). Each kmer is then packed into as many 63-bit words as are
+        needed to hold its ``k`` characters, so that two kmers are equal if
+        and only if all of their words are equal. Kmers encoded with the same
+        `alphabet` sort in the same order as their strings.
+
+        Returns
+        -------
+        2D np.ndarray (uint64)
+            Array of shape ``(n_words, n_kmers)`` holding the words of each
+            kmer, in the order of ``iter_kmers``.
+        int
+            The distance between the start positions of consecutive kmers.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+
+        """
+        if k < 1:
+            raise ValueError("k must be greater than 0.")
+
+        step = 1 if overlap else k
+        count = max(0, (len(self) - k) // step + 1)
+
+        if alphabet is None:
+            alphabet, symbols = np.unique(self._bytes, return_inverse=True)
+        else:
+            symbols = np.searchsorted(alphabet, self._bytes)
+        symbols = symbols.astype(np.uint64)
+        bits = max(1, int(np.ceil(np.log2(max(1, len(alphabet))))))
+        chars_per_word = 63 // bits
+
+        words = []
+        for word_start in range(0, k, chars_per_word):
+            word = np.zeros(count, dtype=np.uint64)
+            for j in range(word_start, min(k, word_start + chars_per_word)):
+                word <<= np.uint64(bits)
+                word |= symbols[j:j + step * count:step]
+            words.append(word)
+        return np.vstack(words), step
+
+    def _count_kmers(self, k, overlap):
+        """Count the distinct kmers of this sequence.
+
+        Returns
+        -------
+        1D np.ndarray (int)
+            Start position of the first occurrence of each distinct kmer, in
+            the order in which the kmers first occur.
+        1D np.ndarray (int)
+            Number of occurrences of each distinct kmer.
+
+        Raises
+        ------
+        ValueError
+            If `k` is less than 1.
+
+        """
+        codes, step = self._kmer_codes(k, overlap)
+        count = codes.shape[1]
+
+        # lexsort is stable, so the first kmer of each group of equal kmers
+        # is its first occurrence
+        order = np.lexsort(codes[::-1])
+        sorted_codes = codes[:, order]
+        is_first = np.ones(count, dtype=bool)
+        is_first[1:] = (sorted_codes[:, 1:] != sorted_codes[:, :-1]).any(
+            axis=0)
+        group_starts = np.flatnonzero(is_first)
+        counts = np.diff(np.append(group_starts, count))
+
+        first = order[group_starts]
+        by_occurrence = np.argsort(first)
+        return first[by_occurrence] * step, counts[by_occurrence]
+
     @stable(as_of="0.4.0")
     def find_with_regex(self, regex, ignore=None):
         """Generate slices for patterns matched by a regular expression.
@@ -2105,6 +2219,24 @@ fuzzy=[(True, False)], metadata={'gene': 'foo'})
     def _constructor(self, **kwargs):
         return self.__class__(**kwargs)
 
+    def _from_bytes(self, sequence, metadata=None):
+        """Construct a sequence of this type directly from a uint8 array.
+
+        This is a lightweight alternative to ``_constructor`` for internal
+        slicing: `sequence` must be a contiguous 1D ``np.uint8`` array of
+        characters already known to be valid for this type (e.g., a view of
+        this sequence's bytes), so it is neither copied nor validated, and
+        positional and interval metadata are left empty.
+
+        """
+        seq = self.__class__.__new__(self.__class__)
+        seq._owns_bytes = False
+        seq._set_bytes(sequence)
+        MetadataMixin._init_(seq, metadata=metadata)
+        seq._positional_metadata = None
+        seq._interval_metadata = None
+        return seq
+
     def _munge_to_index_array(self, sliceable):
         """Return an index array from something isomorphic to a boolean vector.
 
@@ -18,6 +18,8 @@ Functions
 
    hamming
    kmer_distance
+   kmer_distances
+   kmer_profiles
 
 """
 
@@ -31,11 +33,17 @@ Functions
 
 import numpy as np
 import scipy.spatial.distance
+from scipy.sparse import coo_matrix
 
 import skbio
 from skbio.util._decorator import experimental
 
 
+# Maximum number of characters one-hot encoded at once by
+# `_pairwise_hamming_from_bytes`.
+_HAMMING_BLOCK_SIZE = 2 ** 20
+
+
 @experimental(as_of='0.4.2')
 def hamming(seq1, seq2):
     """Compute Hamming distance between two sequences.
@@ -163,6 +171,347 @@ def kmer_distance(seq1, seq2, k, overlap=True):
     return fraction_unique
 
 
+@experimental(as_of='0.5.3')
+def kmer_profiles(seqs, k, overlap=True):
+    """Count the kmers of each of many sequences
+
+    Parameters
+    ----------
+    seqs : iterable of Sequence
+        Sequences to count kmers in.
+    k : int
+        The kmer length.
+    overlap : bool, optional
+        Defines whether the kmers should be overlapping or not.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Matrix of shape ``(n_sequences, n_kmers)`` holding the number of
+        occurrences of each kmer in each sequence.
+    list of str
+        The kmer of each column of the matrix. The kmers are sorted and
+        include every kmer present in at least one of the sequences.
+
+    Raises
+    ------
+    ValueError
+        If `k` is less than 1.
+    TypeError
+        If `seqs` are not ``Sequence`` instances.
+    TypeError
+        If `seqs` are not all the same type.
+
+    See Also
+    --------
+    kmer_distances
+    skbio.sequence.Sequence.kmer_frequencies
+
+    Notes
+    -----
+    All of the kmers are encoded as integers over the characters present in
+    `seqs` and counted at once, without building a ``Sequence`` or string for
+    each kmer. Row ``i`` of the matrix holds the same counts as
+    ``seqs[i].kmer_frequencies(k, overlap)``.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence.distance import kmer_profiles
+    >>> counts, kmers = kmer_profiles([DNA('ACGTACG'), DNA('TTACG')], 3)
+    >>> kmers
+    ['ACG', 'CGT', 'GTA', 'TAC', 'TTA']
+    >>> counts.toarray().tolist()
+    [[2, 1, 1, 1, 0], [1, 0, 0, 1, 1]]
+
+    """
+    seqs = list(seqs)
+    counts, kmer_rows, kmer_positions = _kmer_count_matrix(seqs, k, overlap)
+    # only the bytes of each kmer are decoded, not the whole sequence
+    kmers = [seqs[row]._bytes[position:position + k].tobytes().decode('ascii')
+             for row, position in zip(kmer_rows, kmer_positions)]
+    return counts, kmers
+
+
+@experimental(as_of='0.5.3')
+def kmer_distances(seqs, k, overlap=True, metric='jaccard', ids=None):
+    """Compute the kmer distances between all pairs of sequences
+
+    Parameters
+    ----------
+    seqs : iterable of Sequence
+        Sequences to compute kmer distances between.
+    k : int
+        The kmer length.
+    overlap : bool, optional
+        Defines whether the kmers should be overlapping or not.
+    metric : {'jaccard', 'braycurtis'}, optional
+        If ``'jaccard'``, the distance between two sequences is the fraction
+        of their kmers that are unique to either sequence, ignoring kmer
+        counts, as computed by ``kmer_distance``. If ``'braycurtis'``, the
+        distance is the Bray-Curtis dissimilarity between their kmer counts.
+    ids : list of str, optional
+        The IDs of the sequences in the resulting distance matrix. If not
+        provided, the sequences are identified by their index in `seqs`.
+
+    Returns
+    -------
+    DistanceMatrix
+        The kmer distance between each pair of sequences.
+
+    Raises
+    ------
+    ValueError
+        If `k` is less than 1.
+    ValueError
+        If `metric` is not supported.
+    ValueError
+        If a pair of sequences has no kmers.
+    TypeError
+        If `seqs` are not ``Sequence`` instances.
+    TypeError
+        If `seqs` are not all the same type.
+
+    See Also
+    --------
+    kmer_distance
+    kmer_profiles
+    scipy.spatial.distance.braycurtis
+
+    Notes
+    -----
+    The kmers of all sequences are counted once, into the sparse matrix
+    returned by ``kmer_profiles``. The number of kmers shared by each pair of
+    sequences is then obtained with a single sparse matrix product instead of
+    by comparing the kmers of the sequences pair by pair. For
+    ``'braycurtis'``, the sums of the smaller of the two counts of each kmer
+    are obtained from one product per count threshold.
+
+    Examples
+    --------
+    >>> from skbio import DNA
+    >>> from skbio.sequence.distance import kmer_distances
+    >>> seqs = [DNA('ATCGGCGAT'), DNA('GCAGATGTG'), DNA('ATCGGCGTT')]
+    >>> dm = kmer_distances(seqs, 3, ids=['a', 'b', 'c'])
+    >>> print(round(dm['a', 'b'], 4))
+    0.9231
+    >>> dm = kmer_distances(seqs, 3, metric='braycurtis')
+    >>> print(round(dm['0', '2'], 4))
+    0.2857
+
+    """
+    if metric not in ('jaccard', 'braycurtis'):
+        raise ValueError("Unsupported metric %r. Must be 'jaccard' or "
+                         "'braycurtis'." % metric)
+
+    seqs = list(seqs)
+    counts, _, _ = _kmer_count_matrix(seqs, k, overlap)
+    distances = _kmer_profile_distances(counts, metric)
+    if np.isnan(distances).any():
+        raise ValueError(
+            "Cannot compute the kmer distance between sequences that have no "
+            "kmers.")
+
+    return skbio.DistanceMatrix(distances, ids)
+
+
+def _kmer_count_matrix(seqs, k, overlap):
+    """Count the kmers of each sequence into a sparse matrix.
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+        Counts of shape ``(len(seqs), n_kmers)``, with columns in sorted kmer
+        order.
+    1D np.ndarray (int)
+        Index of a sequence containing the kmer of each column.
+    1D np.ndarray (int)
+        Start position of the kmer of each column in that sequence.
+
+    """
+    if k < 1:
+        raise ValueError("k must be greater than 0.")
+    for seq in seqs:
+        _check_seqs(seqs[0], seq)
+
+    if seqs:
+        alphabet = np.unique(np.concatenate([seq._bytes for seq in seqs]))
+    else:
+        alphabet = np.empty(0, dtype=np.uint8)
+
+    codes = []
+    rows = [np.empty(0, dtype=int)]
+    positions = [np.empty(0, dtype=int)]
+    for i, seq in enumerate(seqs):
+        seq_codes, step = seq._kmer_codes(k, overlap, alphabet=alphabet)
+        codes.append(seq_codes)
+        rows.append(np.full(seq_codes.shape[1], i, dtype=int))
+        positions.append(np.arange(seq_codes.shape[1]) * step)
+    codes = np.hstack(codes) if codes else np.empty((1, 0), dtype=np.uint64)
+    rows = np.concatenate(rows)
+    positions = np.concatenate(positions)
+
+    # kmers encoded with the same alphabet sort like their strings, so the
+    # columns are in sorted kmer order
+    order = np.lexsort(codes[::-1])
+    sorted_codes = codes[:, order]
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = (sorted_codes[:, 1:] != sorted_codes[:, :-1]).any(axis=0)
+    columns = np.empty(len(order), dtype=int)
+    columns[order] = np.cumsum(is_first) - 1
+
+    first = order[is_first]
+    counts = coo_matrix(
+        (np.ones(len(order), dtype=int), (rows, columns)),
+        shape=(len(seqs), len(first))).tocsr()
+    return counts, rows[first], positions[first]
+
+
+def _kmer_profile_distances(counts, metric):
+    """Compute the distances between all pairs of rows of kmer counts.
+
+    Returns
+    -------
+    1D np.ndarray (float)
+        The distances in condensed form (see
+        ``scipy.spatial.distance.squareform``), or ``np.nan`` for pairs of
+        rows without kmers.
+
+    """
+    n = counts.shape[0]
+    if metric == 'jaccard':
+        presence = (counts > 0).astype(float)
+        shared = presence.dot(presence.T).toarray()
+        sizes = np.diag(shared)
+        total = sizes[:, np.newaxis] + sizes - shared
+    else:
+        # min(x, y) is the number of thresholds t >= 1 with x >= t and
+        # y >= t, so the sum of the smaller counts of each kmer is a sum of
+        # products of thresholded count matrices. Thresholds between two
+        # consecutive distinct counts select the same kmers, so there is one
+        # product per distinct count rather than per unit of the largest one.
+        shared = np.zeros((n, n))
+        above = counts.astype(float)
+        previous = 0
+        for level in np.unique(counts.data):
+            above.data[above.data < level] = 0
+            above.eliminate_zeros()
+            presence = above.copy()
+            presence.data[:] = 1
+            shared += (level - previous) * presence.dot(presence.T).toarray()
+            previous = level
+        sizes = np.asarray(counts.sum(axis=1), dtype=float).ravel()
+        total = sizes[:, np.newaxis] + sizes
+        shared = 2 * shared
+
+    rows, cols = np.triu_indices(n, 1)
+    total = total[rows, cols]
+    distances = np.full(len(rows), np.nan)
+    np.divide(total - shared[rows, cols], total, out=distances,
+              where=total > 0)
+    return distances
+
+
+def _pairwise_hamming(seqs):
+    """Compute the Hamming distances between all pairs of sequences.
+
+    Returns
+    -------
+    1D np.ndarray (float)
+        The distances in condensed form (see
+        ``scipy.spatial.distance.squareform``). Each distance is equal to
+        ``hamming(seqs[i], seqs[j])``.
+
+    """
+    for seq in seqs[1:]:
+        _check_seqs(seqs[0], seq)
+        if len(seq) != len(seqs[0]):
+            raise ValueError(
+                "Hamming distance can only be computed between sequences of "
+                "equal length (%d != %d)" % (len(seqs[0]), len(seq)))
+
+    if len(seqs) < 2:
+        return np.empty(0)
+    return _pairwise_hamming_from_bytes(
+        np.vstack([seq._bytes for seq in seqs]))
+
+
+def _pairwise_hamming_from_bytes(byte_matrix, compare=None):
+    """Compute the Hamming distances between all pairs of rows of bytes.
+
+    Parameters
+    ----------
+    byte_matrix : 2D np.ndarray (uint8)
+        One row of characters per sequence.
+    compare : 2D np.ndarray (bool), optional
+        Array of the same shape as `byte_matrix` that is ``False`` for
+        characters that must be ignored. The distance between two rows is
+        then the proportion of differing characters among the positions where
+        neither row has an ignored character. By default, all characters are
+        compared.
+
+    Returns
+    -------
+    1D np.ndarray (float)
+        The distances in condensed form (see
+        ``scipy.spatial.distance.squareform``). The distance is ``np.nan`` if
+        there are no positions to compare.
+
+    """
+    n, length = byte_matrix.shape
+    matches = np.zeros((n, n))
+    if compare is None:
+        compared = np.full((n, n), float(length))
+    else:
+        compared = np.zeros((n, n))
+
+    # Each distinct character is one-hot encoded, so that the number of
+    # positions where each pair of rows share that character is a matrix
+    # product. Positions are processed in blocks to bound the size of the
+    # one-hot encoding. float32 products of 0s and 1s are exact as long as
+    # the block is shorter than 2 ** 24 positions.
+    block_size = max(1, _HAMMING_BLOCK_SIZE // max(1, n))
+    for start in range(0, length, block_size):
+        block = byte_matrix[:, start:start + block_size]
+        if compare is None:
+            block_compare = None
+            codes = np.unique(block)
+        else:
+            block_compare = compare[:, start:start + block_size]
+            codes = np.unique(block[block_compare])
+            indicator = block_compare.astype(np.float32)
+            compared += indicator.dot(indicator.T)
+
+        for code in codes:
+            is_code = block == code
+            if block_compare is not None:
+                is_code &= block_compare
+            indicator = is_code.astype(np.float32)
+            matches += indicator.dot(indicator.T)
+
+    rows, cols = np.triu_indices(n, 1)
+    compared = compared[rows, cols]
+    distances = np.full(len(rows), np.nan)
+    np.divide(compared - matches[rows, cols], compared, out=distances,
+              where=compared > 0)
+    return distances
+
+
+def _pairwise_kmer_distance(seqs, k, overlap=True):
+    """Compute the kmer distances between all pairs of sequences.
+
+    Returns
+    -------
+    1D np.ndarray (float)
+        The distances in condensed form (see
+        ``scipy.spatial.distance.squareform``). Each distance is equal to
+        ``kmer_distance(seqs[i], seqs[j], k, overlap)``.
+
+    """
+    counts, _, _ = _kmer_count_matrix(seqs, k, overlap)
+    return _kmer_profile_distances(counts, 'jaccard')
+
+
 def _check_seqs(seq1, seq2):
     # Asserts both sequences are skbio.sequence objects
     for seq in seq1, seq2:
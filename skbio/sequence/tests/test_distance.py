@@ -12,8 +12,11 @@ import unittest
 import numpy as np
 import numpy.testing as npt
 
-from skbio import Sequence, DNA
-from skbio.sequence.distance import hamming, kmer_distance
+import scipy.spatial.distance
+
+from skbio import Sequence, DNA, DistanceMatrix
+from skbio.sequence.distance import (hamming, kmer_distance, kmer_profiles,
+                                     kmer_distances)
 
 
 class TestHamming(unittest.TestCase):
@@ -230,5 +233,95 @@ class TestKmerDistance(unittest.TestCase):
             kmer_distance(seq1, seq2, 3)
 
 
+class TestKmerProfiles(unittest.TestCase):
+    def test_counts(self):
+        seqs = [DNA('ACGTACG'), DNA('TTACG', metadata={'id': 'x'}), DNA('')]
+        counts, kmers = kmer_profiles(seqs, 3)
+
+        self.assertEqual(kmers, ['ACG', 'CGT', 'GTA', 'TAC', 'TTA'])
+        npt.assert_equal(counts.toarray(), [[2, 1, 1, 1, 0],
+                                            [1, 0, 0, 1, 1],
+                                            [0, 0, 0, 0, 0]])
+
+    def test_matches_kmer_frequencies(self):
+        seqs = [Sequence('AAAAAAAAAA'), Sequence('ABCDEFGHIJKLMNOPQRSTUV'),
+                Sequence('ABABABAB'), Sequence('AB')]
+        for k, overlap in itertools.product((1, 2, 3, 11, 25), (True, False)):
+            counts, kmers = kmer_profiles(seqs, k, overlap=overlap)
+            for seq, row in zip(seqs, counts.toarray()):
+                obs = {kmer: count for kmer, count in zip(kmers, row)
+                       if count}
+                self.assertEqual(obs, seq.kmer_frequencies(k, overlap))
+
+    def test_no_sequences(self):
+        counts, kmers = kmer_profiles([], 3)
+        self.assertEqual(counts.shape, (0, 0))
+        self.assertEqual(kmers, [])
+
+    def test_k_less_than_one_error(self):
+        with self.assertRaisesRegex(ValueError, 'k'):
+            kmer_profiles([Sequence('ATCG')], 0)
+
+    def test_type_mismatch_error(self):
+        with self.assertRaisesRegex(TypeError, 'matching type'):
+            kmer_profiles([DNA('ATCG'), Sequence('ATCG')], 3)
+
+    def test_non_sequence_error(self):
+        with self.assertRaisesRegex(TypeError, 'Sequence.*str'):
+            kmer_profiles(['ATCG'], 3)
+
+
+class TestKmerDistances(unittest.TestCase):
+    def setUp(self):
+        self.seqs = [DNA('ATCGGCGAT'), DNA('GCAGATGTG'), DNA('ATCGGCGTT'),
+                     DNA('AAAAAAAA'), DNA('GCAGAT')]
+
+    def test_jaccard(self):
+        for k, overlap in itertools.product((1, 2, 3, 5), (True, False)):
+            obs = kmer_distances(self.seqs, k, overlap=overlap)
+            self.assertIsInstance(obs, DistanceMatrix)
+            for i, j in itertools.combinations(range(len(self.seqs)), 2):
+                self.assertEqual(
+                    obs[i, j],
+                    kmer_distance(self.seqs[i], self.seqs[j], k, overlap))
+
+    def test_braycurtis(self):
+        counts, _ = kmer_profiles(self.seqs, 2)
+        counts = counts.toarray()
+
+        obs = kmer_distances(self.seqs, 2, metric='braycurtis')
+
+        for i, j in itertools.combinations(range(len(self.seqs)), 2):
+            self.assertAlmostEqual(
+                obs[i, j],
+                scipy.spatial.distance.braycurtis(counts[i], counts[j]))
+
+    def test_braycurtis_repeats(self):
+        # kmers with large and uneven counts
+        seqs = [DNA('A' * 500), DNA('A' * 300 + 'C' * 200), DNA('AC' * 150),
+                DNA('ACGT'), DNA('C' * 40 + 'A' * 7)]
+        counts, _ = kmer_profiles(seqs, 3)
+        counts = counts.toarray()
+
+        obs = kmer_distances(seqs, 3, metric='braycurtis')
+
+        for i, j in itertools.combinations(range(len(seqs)), 2):
+            self.assertAlmostEqual(
+                obs[i, j],
+                scipy.spatial.distance.braycurtis(counts[i], counts[j]))
+
+    def test_ids(self):
+        obs = kmer_distances(self.seqs[:2], 3, ids=['a', 'b'])
+        self.assertEqual(obs.ids, ('a', 'b'))
+
+    def test_no_kmers_error(self):
+        with self.assertRaisesRegex(ValueError, 'no kmers'):
+            kmer_distances([DNA('A'), DNA('AC')], 3)
+
+    def test_invalid_metric(self):
+        with self.assertRaisesRegex(ValueError, 'Unsupported metric'):
+            kmer_distances(self.seqs, 3, metric='euclidean')
+
+
 if __name__ == "__main__":
     unittest.main()
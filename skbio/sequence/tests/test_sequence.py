@@ -11,7 +11,7 @@ import functools
 import itertools
 import re
 from types import GeneratorType
-from collections import Hashable
+from collections import Counter, Hashable
 from unittest import TestCase, main
 
 import numpy as np
@@ -1817,6 +1817,66 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
         expected = []
         self._compare_kmers_results(seq.iter_kmers(3, overlap=False), expected)
 
+    def test_iter_kmers_longer_than_sequence(self):
+        seq = Sequence('GATTACA')
+        self._compare_kmers_results(seq.iter_kmers(9, overlap=True), [])
+        self._compare_kmers_results(seq.iter_kmers(9, overlap=False), [])
+
+    def test_iter_kmers_raw(self):
+        seq = Sequence('GATTACA', metadata={'id': 'x'},
+                       positional_metadata={'quality': range(7)})
+
+        obs = list(seq.iter_kmers(3, raw=True))
+        self.assertEqual([kmer.tobytes() for kmer in obs],
+                         [b'GAT', b'ATT', b'TTA', b'TAC', b'ACA'])
+        for kmer in obs:
+            self.assertEqual(kmer.dtype, np.uint8)
+            self.assertFalse(kmer.flags.writeable)
+            # kmers are views of the sequence's bytes
+            self.assertTrue(np.may_share_memory(kmer, seq._bytes))
+
+        obs = [kmer.tobytes() for kmer in seq.iter_kmers(3, overlap=False,
+                                                         raw=True)]
+        self.assertEqual(obs, [b'GAT', b'TAC'])
+        self.assertEqual(list(seq.iter_kmers(8, raw=True)), [])
+
+        with self.assertRaises(ValueError):
+            list(seq.iter_kmers(0, raw=True))
+
+    def test_iter_kmers_lightweight_kmers(self):
+        seq = DNA('GATTACA', metadata={'id': 'x'})
+        kmers = list(seq.iter_kmers(3, overlap=False))
+        self.assertEqual(kmers, [DNA('GAT', metadata={'id': 'x'}),
+                                 DNA('TAC', metadata={'id': 'x'})])
+
+        # kmers share their bytes with the sequence, but modifying them or
+        # their metadata does not affect it
+        kmer = kmers[0]
+        self.assertTrue(np.may_share_memory(kmer._bytes, seq._bytes))
+        kmer.metadata['id'] = 'y'
+        self.assertEqual(seq.metadata, {'id': 'x'})
+        with kmer._byte_ownership():
+            kmer._bytes[0] = ord('C')
+        self.assertEqual(str(kmer), 'CAT')
+        self.assertEqual(str(seq), 'GATTACA')
+
+        self.assertFalse(kmers[1].has_positional_metadata())
+        self.assertFalse(kmers[1].has_interval_metadata())
+        self.assertEqual(str(kmers[1].complement()), 'ATG')
+
+    def test_kmer_windows(self):
+        seq = Sequence('GATTACA')
+        obs = seq._kmer_windows(2, overlap=True)
+        self.assertEqual(obs.shape, (6, 2))
+        self.assertFalse(obs.flags.writeable)
+        npt.assert_equal(obs, np.array([list(b'GA'), list(b'AT'),
+                                        list(b'TT'), list(b'TA'),
+                                        list(b'AC'), list(b'CA')]))
+
+        obs = seq._kmer_windows(3, overlap=False)
+        self.assertEqual([kmer.tobytes() for kmer in obs], [b'GAT', b'TAC'])
+        self.assertEqual(seq._kmer_windows(8, overlap=False).shape, (0, 8))
+
     def test_kmer_frequencies_empty_sequence(self):
         seq = Sequence('')
 
@@ -1897,6 +1957,58 @@ class TestSequence(TestSequenceBase, ReallyEqualMixin):
         seq = Sequence('AAAAAAAAAA')
         self.assertEqual(seq.kmer_frequencies(1, relative=True), {'A': 1.0})
 
+    def test_kmer_frequencies_k_longer_than_sequence(self):
+        seq = Sequence('GATTACA')
+        self.assertEqual(seq.kmer_frequencies(20), {})
+        self.assertEqual(seq.kmer_frequencies(20, relative=True), {})
+
+    def test_kmer_frequencies_invalid_k(self):
+        seq = Sequence('GATTACA')
+        with self.assertRaisesRegex(ValueError, 'k must be greater than 0'):
+            seq.kmer_frequencies(0)
+
+    def test_kmer_frequencies_long_kmers(self):
+        # 94 distinct characters take 7 bits each, so each kmer spans several
+        # 63-bit words
+        chars = ''.join(chr(c) for c in range(33, 127))
+        seq = Sequence(chars * 3 + chars[:20])
+        for k in 9, 10, 94, 95:
+            for overlap in True, False:
+                exp = Counter(
+                    str(kmer) for kmer in seq.iter_kmers(k, overlap=overlap))
+                self.assertEqual(seq.kmer_frequencies(k, overlap=overlap),
+                                 dict(exp))
+
+    def test_kmer_codes(self):
+        seq = Sequence('ACGTAC')
+        codes, step = seq._kmer_codes(2, overlap=True)
+        self.assertEqual(step, 1)
+        # A, C, G, T are encoded as 0, 1, 2, 3 using 2 bits
+        npt.assert_equal(codes, [[1, 6, 11, 12, 1]])
+
+        codes, step = seq._kmer_codes(2, overlap=False)
+        self.assertEqual(step, 2)
+        npt.assert_equal(codes, [[1, 11, 1]])
+
+        # 40 characters of 2 bits need two 63-bit words
+        codes, _ = Sequence('ACGT' * 10)._kmer_codes(40, overlap=True)
+        self.assertEqual(codes.shape, (2, 1))
+
+    def test_count_kmers(self):
+        seq = Sequence('GATTACAGATT')
+        positions, counts = seq._count_kmers(3, overlap=True)
+        # GAT ATT TTA TAC ACA CAG AGA, in order of first occurrence
+        npt.assert_equal(positions, [0, 1, 2, 3, 4, 5, 6])
+        npt.assert_equal(counts, [2, 2, 1, 1, 1, 1, 1])
+
+        positions, counts = seq._count_kmers(3, overlap=False)
+        npt.assert_equal(positions, [0, 3, 6])
+        npt.assert_equal(counts, [1, 1, 1])
+
+        positions, counts = Sequence('')._count_kmers(3, overlap=True)
+        self.assertEqual(len(positions), 0)
+        self.assertEqual(len(counts), 0)
+
     def test_find_with_regex(self):
         seq = Sequence('GATTACA', positional_metadata={'quality': range(7)})
         pat = re.compile('(T+A)(CA)')
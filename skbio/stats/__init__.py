@@ -27,7 +27,10 @@ Functions
    :toctree: generated/
 
    subsample_counts
+   subsample_table
+   rarefaction_curves
    isubsample
+   isubsample_keys
 
 """
 
@@ -41,8 +44,10 @@ Functions
 
 from skbio.util import TestRunner
 
-from ._subsample import subsample_counts, isubsample
+from ._subsample import (subsample_counts, subsample_table,
+                         rarefaction_curves, isubsample, isubsample_keys)
 
-__all__ = ['subsample_counts', 'isubsample']
+__all__ = ['subsample_counts', 'subsample_table', 'rarefaction_curves',
+           'isubsample', 'isubsample_keys']
 
 test = TestRunner(__file__).test
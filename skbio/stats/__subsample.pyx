@@ -8,27 +8,229 @@
 
 import numpy as np
 cimport numpy as cnp
+cimport cython
+from libc.stdint cimport uint64_t
+
+
+cdef inline uint64_t _next_random(uint64_t *state) nogil:
+    """Advance a SplitMix64 generator and return its next 64 random bits"""
+    cdef uint64_t z
+    state[0] += <uint64_t>0x9E3779B97F4A7C15
+    z = state[0]
+    z = (z ^ (z >> 30)) * <uint64_t>0xBF58476D1CE4E5B9
+    z = (z ^ (z >> 27)) * <uint64_t>0x94D049BB133111EB
+    return z ^ (z >> 31)
+
+
+cdef inline uint64_t _random_below(uint64_t *state, uint64_t m) nogil:
+    """Draw an unbiased random integer in ``[0, m)``"""
+    cdef uint64_t r
+    # rejecting the lowest (2 ** 64) % m values leaves a multiple of m values
+    cdef uint64_t threshold = (<uint64_t>0 - m) % m
+    while True:
+        r = _next_random(state)
+        if r >= threshold:
+            return r % m
+
+
+def _random_seed():
+    """Draw a seed for the generator from NumPy's global random state"""
+    high, low = np.random.randint(0, 2 ** 32, size=2)
+    return (int(high) << 32) | int(low)
+
+
+cdef inline uint64_t _row_state(uint64_t seed, Py_ssize_t row) nogil:
+    """Derive the generator state of a row of a table from a single seed"""
+    cdef uint64_t s = <uint64_t>row
+    return seed ^ _next_random(&s)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _build_tree(cnp.int64_t[::1] counts,
+                            cnp.int64_t[::1] tree) nogil:
+    """Fill a Fenwick tree of `counts` and return its largest power of two
+
+    `tree` must have length ``len(counts) + 1``. The cumulative count of the
+    first i features is then the sum of O(log F) entries of `tree`.
+
+    """
+    cdef:
+        Py_ssize_t n_features = counts.shape[0]
+        Py_ssize_t i, j, mask
+
+    for i in range(n_features):
+        tree[i + 1] = counts[i]
+    for i in range(1, n_features + 1):
+        j = i + (i & -i)
+        if j <= n_features:
+            tree[j] += tree[i]
+
+    mask = 1
+    while mask * 2 <= n_features:
+        mask *= 2
+    return mask
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef Py_ssize_t _draw(cnp.int64_t[::1] tree, Py_ssize_t mask,
+                      cnp.int64_t remaining, bint replace,
+                      uint64_t *state) nogil:
+    """Draw one of the `remaining` items of a Fenwick tree of counts
+
+    Returns the index of the feature of the drawn item. Unless `replace` is
+    true, the item is removed from `tree`.
+
+    """
+    cdef:
+        Py_ssize_t n_features = tree.shape[0] - 1
+        Py_ssize_t i, pos = 0
+        cnp.int64_t r = <cnp.int64_t>_random_below(state, <uint64_t>remaining)
+
+    # descend the tree to the first feature whose cumulative count exceeds r
+    while mask > 0:
+        if pos + mask <= n_features and tree[pos + mask] <= r:
+            pos += mask
+            r -= tree[pos]
+        mask >>= 1
+
+    if not replace:
+        i = pos + 1
+        while i <= n_features:
+            tree[i] -= 1
+            i += i & -i
+    return pos
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef int _rarefy(cnp.int64_t[::1] counts, cnp.int64_t n, cnp.int64_t total,
+                 bint replace, cnp.int64_t[::1] result,
+                 cnp.int64_t[::1] tree, uint64_t *state) nogil:
+    """Subsample `n` of the `total` items in `counts`
+
+    Items are drawn one at a time, each uniformly among the items that have
+    not been drawn yet (or among all items if `replace` is true). The
+    remaining counts are kept in a Fenwick tree (`tree`, of length
+    ``len(counts) + 1``) so that the feature holding the r-th remaining item
+    is found, and its count decremented, in O(log F) time. When more than
+    half of the items are kept without replacement, the items to remove are
+    drawn instead. Only O(F) memory is used, however large `total` is.
+
+    """
+    cdef:
+        Py_ssize_t n_features = counts.shape[0]
+        Py_ssize_t i, mask
+        cnp.int64_t draws, remaining = total
+        bint complement = not replace and n > total - n
+
+    draws = total - n if complement else n
+
+    for i in range(n_features):
+        result[i] = 0
+    mask = _build_tree(counts, tree)
+
+    while draws > 0:
+        result[_draw(tree, mask, remaining, replace, state)] += 1
+        if not replace:
+            remaining -= 1
+        draws -= 1
+
+    if complement:
+        for i in range(n_features):
+            result[i] = counts[i] - result[i]
+    return 0
 
 
 def _subsample_counts_without_replacement(
     cnp.ndarray[cnp.int64_t, ndim=1] counts, n, counts_sum):
     cdef:
-        cnp.ndarray[cnp.int64_t, ndim=1] result, permuted, unpacked
-        cnp.int64_t cnt
-        Py_ssize_t unpacked_idx, i, j
+        cnp.int64_t[::1] counts_view, result, tree
+        cnp.int64_t n_ = n, total = counts_sum
+        uint64_t state = _random_seed()
+
+    counts_view = np.ascontiguousarray(counts)
+    result = np.empty(counts.shape[0], dtype=np.int64)
+    tree = np.empty(counts.shape[0] + 1, dtype=np.int64)
+
+    with nogil:
+        _rarefy(counts_view, n_, total, False, result, tree, &state)
+
+    return np.asarray(result)
+
 
-    unpacked = np.empty(counts_sum, dtype=int)
-    unpacked_idx = 0
-    for i in range(counts.shape[0]):
-        cnt = counts[i]
-        for j in range(cnt):
-            unpacked[unpacked_idx] = i
-            unpacked_idx += 1
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _subsample_rows(cnp.int64_t[::1] data, cnp.int64_t[::1] indptr,
+                    cnp.int64_t n, bint replace, uint64_t seed,
+                    Py_ssize_t row_offset):
+    """Subsample each row of a table in compressed sparse row layout
+
+    Row i of the table holds the counts ``data[indptr[i]:indptr[i + 1]]``
+    (``indptr[0]`` must be 0). The rows are subsampled without holding the
+    GIL, each with a generator derived from `seed` and its index
+    ``row_offset + i`` in the whole table, so the result of a row does not
+    depend on how the table is split into chunks.
+
+    """
+    cdef:
+        Py_ssize_t n_rows = indptr.shape[0] - 1
+        Py_ssize_t i, j, start, stop, max_length = 0
+        cnp.int64_t total
+        cnp.int64_t[::1] result, tree
+        uint64_t state
+
+    for i in range(n_rows):
+        max_length = max(max_length, indptr[i + 1] - indptr[i])
+    result = np.empty(data.shape[0], dtype=np.int64)
+    tree = np.empty(max_length + 1, dtype=np.int64)
+
+    with nogil:
+        for i in range(n_rows):
+            start = indptr[i]
+            stop = indptr[i + 1]
+            total = 0
+            for j in range(start, stop):
+                total += data[j]
+            state = _row_state(seed, row_offset + i)
+            _rarefy(data[start:stop], n, total, replace, result[start:stop],
+                    tree[:stop - start + 1], &state)
+
+    return np.asarray(result)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+def _subsample_depths(cnp.int64_t[::1] counts, cnp.int64_t[::1] depths,
+                      uint64_t seed, Py_ssize_t row):
+    """Subsample `counts` to each of the increasing `depths` in one pass
+
+    Items are drawn without replacement one at a time, and the counts drawn
+    so far are recorded each time one of the `depths` is reached, so each
+    row of the result is a subsample of the next one.
+
+    """
+    cdef:
+        Py_ssize_t n_features = counts.shape[0]
+        Py_ssize_t i, d, mask
+        cnp.int64_t total = 0, drawn = 0
+        cnp.int64_t[:, ::1] result
+        cnp.int64_t[::1] current, tree
+        uint64_t state = _row_state(seed, row)
 
-    permuted = np.random.permutation(unpacked)[:n]
+    result = np.empty((depths.shape[0], n_features), dtype=np.int64)
+    current = np.zeros(n_features, dtype=np.int64)
+    tree = np.empty(n_features + 1, dtype=np.int64)
 
-    result = np.zeros_like(counts)
-    for idx in range(permuted.shape[0]):
-        result[permuted[idx]] += 1
+    with nogil:
+        for i in range(n_features):
+            total += counts[i]
+        mask = _build_tree(counts, tree)
+        for d in range(depths.shape[0]):
+            while drawn < depths[d]:
+                current[_draw(tree, mask, total - drawn, False, &state)] += 1
+                drawn += 1
+            result[d, :] = current
 
-    return result
+    return np.asarray(result)
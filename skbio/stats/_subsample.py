@@ -6,15 +6,20 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import os
 import sys
+import itertools
+import tempfile
 from heapq import heappush, heappop
 from collections import defaultdict
 from copy import copy
 
 import numpy as np
+import scipy.sparse
 
 from skbio.util._decorator import experimental
-from .__subsample import _subsample_counts_without_replacement
+from .__subsample import (_subsample_counts_without_replacement,
+                          _subsample_rows, _subsample_depths, _random_seed)
 
 
 @experimental(as_of="0.4.0")
@@ -63,6 +68,7 @@ def isubsample(items, maximum, minimum=1, buf_size=1000, bin_f=None):
     See Also
     --------
     subsample_counts
+    isubsample_keys
 
     Notes
     -----
@@ -147,6 +153,237 @@ def isubsample(items, maximum, minimum=1, buf_size=1000, bin_f=None):
             yield (bin_, item)
 
 
+_RESERVOIR_DTYPE = np.dtype([('bin', np.int64), ('priority', np.float64),
+                             ('key', np.int64)])
+
+
+def _top_per_bin(rows, maximum):
+    """Keep the `maximum` rows with the highest priorities in each bin
+
+    The rows are returned sorted by bin.
+
+    """
+    rows = rows[np.lexsort((-rows['priority'], rows['bin']))]
+    if len(rows) <= maximum:
+        return rows
+    # a row is kept unless the row `maximum` positions before it is in the
+    # same bin
+    keep = np.ones(len(rows), dtype=bool)
+    keep[maximum:] = rows['bin'][maximum:] != rows['bin'][:-maximum]
+    return rows[keep]
+
+
+class _KeyReservoirs:
+    """Reservoirs of the keys with the highest priorities of many bins
+
+    Rows of bins, priorities and keys are buffered as they are added, either
+    in memory or appended to the file `path`. The buffer is reduced to the
+    `maximum` rows with the highest priorities of each bin once it holds as
+    many new rows as were kept by the previous reduction, so at most about
+    twice the size of the reservoirs (plus one chunk) is ever stored.
+
+    """
+
+    def __init__(self, maximum, path=None):
+        self.maximum = maximum
+        self.path = path
+        self._chunks = []
+        self._size = 0
+        self._reduced_size = 0
+
+    def add(self, bins, priorities, keys):
+        rows = np.empty(len(bins), dtype=_RESERVOIR_DTYPE)
+        rows['bin'] = bins
+        rows['priority'] = priorities
+        rows['key'] = keys
+
+        if self.path is None:
+            self._chunks.append(rows)
+        else:
+            with open(self.path, 'ab') as f:
+                rows.tofile(f)
+        self._size += len(rows)
+
+        if self._size - self._reduced_size >= max(self._reduced_size, 1):
+            self._reduce()
+
+    def _load(self):
+        if self.path is None:
+            return np.concatenate(
+                [np.empty(0, dtype=_RESERVOIR_DTYPE)] + self._chunks)
+        return np.fromfile(self.path, dtype=_RESERVOIR_DTYPE)
+
+    def _reduce(self):
+        rows = self._load()
+        self._chunks = []
+        rows = _top_per_bin(rows, self.maximum)
+        if self.path is None:
+            self._chunks = [rows]
+        else:
+            with open(self.path, 'wb') as f:
+                rows.tofile(f)
+        self._size = self._reduced_size = len(rows)
+        return rows
+
+    def result(self):
+        """Return the rows kept in each bin, sorted by bin"""
+        return self._reduce()
+
+
+@experimental(as_of="0.5.3")
+def isubsample_keys(items, maximum, minimum=1, bin_f=None, key_f=None,
+                    chunk_size=10000, spill_dir=None, n_partitions=64):
+    """Randomly subsample the keys of items from bins, without replacement.
+
+    Like ``isubsample``, but only an integer key of each item (e.g., its
+    position in the input, or its offset in a file for a second pass) is
+    kept, rather than a copy of the item, and the reservoirs of the bins can
+    be kept on disk. This bounds the memory used when subsampling very long
+    streams of large items into many bins.
+
+    Parameters
+    ----------
+    items : Iterable
+        The items to evaluate.
+    maximum : unsigned int
+        The maximum number of items per bin.
+    minimum : unsigned int, optional
+        The minimum number of items per bin. The default is 1.
+    bin_f : function, optional
+        Method to determine what bin an item is associated with. If None (the
+        default), then all items are considered to be part of the same bin.
+        This function will be provided with each entry in items, and must
+        return a hashable value indicating the bin that that entry should be
+        placed in.
+    key_f : function, optional
+        Method to determine the integer key of an item. If None (the
+        default), the key of an item is its position in `items`.
+    chunk_size : unsigned int, optional
+        The number of items that are read, and for which random values are
+        drawn, at once. The default is 10000.
+    spill_dir : str, optional
+        If provided, the reservoirs are kept in temporary files created in
+        this directory instead of in memory. The bins are spread over
+        `n_partitions` files, and only the reservoirs of one file are loaded
+        in memory at a time. The files are deleted once all bins have been
+        yielded.
+    n_partitions : unsigned int, optional
+        The number of files the reservoirs are spread over if `spill_dir` is
+        provided. The default is 64.
+
+    Returns
+    -------
+    generator
+        (bin, keys), where keys is a sorted 1-D ``np.ndarray`` of the keys
+        of the items sampled from the bin.
+
+    Raises
+    ------
+    ValueError
+        If ``minimum`` is > ``maximum``.
+    ValueError
+        If ``minimum`` < 1 or if ``maximum`` < 1.
+
+    See Also
+    --------
+    isubsample
+
+    Notes
+    -----
+    Every item is assigned a random value, and the ``maximum`` items with the
+    highest random values of each bin are kept, as in ``isubsample``, so all
+    items associated to a bin have an equal probability of being retained.
+    Random values are drawn for `chunk_size` items at once, and the
+    reservoirs are stored as arrays of 24 bytes per kept item (its bin,
+    random value and key). New items are buffered and merged into the
+    reservoirs once the buffer is as large as the reservoirs, so at most
+    about ``2 * maximum * N + chunk_size`` items are stored, where N is the
+    number of bins. With `spill_dir`, they are stored on disk and the memory
+    used is about ``1 / n_partitions`` of that.
+
+    Examples
+    --------
+    Randomly keep up to 2 sequences per sample from a set of demultiplexed
+    sequences, recording the positions of the sequences:
+
+    >>> from skbio.stats import isubsample_keys
+    >>> seqs = [('sampleA', 'AATTGG'),
+    ...         ('sampleB', 'ATATATAT'),
+    ...         ('sampleC', 'ATGGCC'),
+    ...         ('sampleB', 'ATGGCT'),
+    ...         ('sampleA', 'ATGGCA')]
+    >>> bin_f = lambda item: item[0]
+    >>> for bin_, keys in sorted(isubsample_keys(seqs, 2, bin_f=bin_f)):
+    ...     print(bin_, keys.tolist())
+    sampleA [0, 4]
+    sampleB [1, 3]
+    sampleC [2]
+
+    The keys can then be used to retrieve the sampled items in a second pass
+    over the input.
+
+    """
+    if minimum > maximum:
+        raise ValueError("minimum cannot be > maximum.")
+    if minimum < 1 or maximum < 1:
+        raise ValueError("minimum and maximum must be > 0.")
+    if bin_f is None:
+        def bin_f(x):
+            return True
+
+    if spill_dir is None:
+        paths = [None]
+    else:
+        paths = []
+        for _ in range(n_partitions):
+            fd, path = tempfile.mkstemp(suffix='.reservoir', dir=spill_dir)
+            os.close(fd)
+            paths.append(path)
+
+    try:
+        reservoirs = [_KeyReservoirs(maximum, path) for path in paths]
+        bin_ids = {}
+        items = iter(items)
+        position = 0
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            if not chunk:
+                break
+
+            bins = np.fromiter(
+                (bin_ids.setdefault(bin_f(item), len(bin_ids))
+                 for item in chunk), dtype=np.int64, count=len(chunk))
+            if key_f is None:
+                keys = np.arange(position, position + len(chunk))
+            else:
+                keys = np.fromiter((key_f(item) for item in chunk),
+                                   dtype=np.int64, count=len(chunk))
+            priorities = np.random.random_sample(len(chunk))
+            position += len(chunk)
+
+            if len(reservoirs) == 1:
+                reservoirs[0].add(bins, priorities, keys)
+            else:
+                partitions = bins % len(reservoirs)
+                for partition in np.unique(partitions):
+                    mask = partitions == partition
+                    reservoirs[partition].add(bins[mask], priorities[mask],
+                                              keys[mask])
+
+        bin_names = sorted(bin_ids, key=bin_ids.get)
+        for reservoir in reservoirs:
+            rows = reservoir.result()
+            starts = np.flatnonzero(np.diff(rows['bin'])) + 1
+            for group in np.split(rows, starts):
+                if len(group) < minimum:
+                    continue
+                yield (bin_names[group['bin'][0]], np.sort(group['key']))
+    finally:
+        for path in paths:
+            if path is not None and os.path.exists(path):
+                os.remove(path)
+
+
 @experimental(as_of="0.4.0")
 def subsample_counts(counts, n, replace=False):
     """Randomly subsample from a vector of counts, with or without replacement.
@@ -188,7 +425,10 @@ def subsample_counts(counts, n, replace=False):
     -----
     If subsampling is performed without replacement (``replace=False``), a copy
     of `counts` is returned if `n` is equal to the number of items in `counts`,
-    as all items will be chosen from the original vector.
+    as all items will be chosen from the original vector. Otherwise, items are
+    drawn one at a time from the counts themselves (or, if more than half of
+    the items are kept, the items to discard are drawn instead), so memory
+    use depends only on the length of `counts` and not on its sum.
 
     If subsampling is performed with replacement (``replace=True``) and `n` is
     equal to the number of items in `counts`, the subsampled vector that is
@@ -246,3 +486,254 @@ def subsample_counts(counts, n, replace=False):
             result = _subsample_counts_without_replacement(counts, n,
                                                            counts_sum)
     return result
+
+
+def _table_rows(table):
+    """Return the counts of a table in compressed sparse row layout
+
+    Returns the data, column indices, row pointers and shape of `table`,
+    which may be a 2-D array_like or a scipy sparse matrix. A sparse table is
+    copied before its duplicate entries are summed, so `table` is left
+    unchanged. For a dense table, the data is the flattened table, every row
+    holds all of its columns and the column indices are ``None``.
+
+    """
+    if scipy.sparse.issparse(table):
+        table = scipy.sparse.csr_matrix(table, copy=True)
+        table.sum_duplicates()
+        data = table.data.astype(np.int64, casting='safe')
+        indices = table.indices
+        indptr = table.indptr.astype(np.int64)
+        shape = table.shape
+    else:
+        table = np.asarray(table)
+        if table.ndim != 2:
+            raise ValueError("Only 2-D tables are supported.")
+        table = table.astype(np.int64, casting='safe')
+        data = np.ascontiguousarray(table).ravel()
+        indices = None
+        indptr = np.arange(table.shape[0] + 1, dtype=np.int64) * table.shape[1]
+        shape = table.shape
+    return data, indices, indptr, shape
+
+
+def _resolve_seed(seed):
+    if seed is None:
+        return _random_seed()
+    return int(seed) % 2 ** 64
+
+
+@experimental(as_of="0.5.3")
+def subsample_table(table, n, replace=False, seed=None, executor=None,
+                    chunk_size=None):
+    """Randomly subsample every row of a table of counts to the same depth.
+
+    Parameters
+    ----------
+    table : 2-D array_like or scipy.sparse matrix
+        Table of counts (integers) where each row (e.g., a sample) is a vector
+        of counts to randomly subsample from.
+    n : int
+        Number of items to subsample from each row. Must be less than or equal
+        to the sum of every row when `replace=False`.
+    replace : bool, optional
+        If ``True``, subsample with replacement. If ``False`` (the default),
+        subsample without replacement.
+    seed : int, optional
+        Seed of the random numbers. Each row is subsampled with its own
+        stream of random numbers derived from `seed` and the index of the
+        row. If not provided, the seed is drawn from NumPy's global random
+        state, so ``np.random.seed`` also makes the results reproducible.
+    executor : concurrent.futures.Executor, optional
+        If provided, chunks of rows are subsampled in tasks submitted to
+        `executor`. The subsampling does not hold the GIL, so a
+        ``ThreadPoolExecutor`` subsamples rows in parallel.
+    chunk_size : int, optional
+        The number of rows subsampled by each task submitted to `executor`.
+        By default, the rows are split into 64 tasks.
+
+    Returns
+    -------
+    subsampled : np.ndarray or scipy.sparse.csr_matrix
+        Table of the same shape as `table` where the sum of each row equals
+        `n`. A sparse matrix is returned if `table` is sparse.
+
+    Raises
+    ------
+    TypeError
+        If `table` cannot be safely converted to an integer datatype.
+    ValueError
+        If `table` is not 2-D.
+    ValueError
+        If `n` is less than zero, or if a row sums to less than `n` when
+        `replace=False` (or to zero when `replace=True`).
+
+    See Also
+    --------
+    subsample_counts
+    rarefaction_curves
+
+    Notes
+    -----
+    Each row is subsampled as ``subsample_counts`` would, drawing items one
+    at a time, so memory use does not depend on the sums of the rows. The
+    results of a row only depend on `seed` and on the index of the row, and
+    not on `executor` or `chunk_size`. Subsampling the table repeatedly with
+    different seeds (e.g., for jackknifed beta diversity) therefore yields
+    reproducible results.
+
+    Examples
+    --------
+    Rarefy each sample of a table to 4 items:
+
+    >>> import numpy as np
+    >>> from skbio.stats import subsample_table
+    >>> table = np.array([[4, 5, 0, 2, 1],
+    ...                   [0, 3, 0, 1, 0],
+    ...                   [1, 1, 1, 1, 6]])
+    >>> sub = subsample_table(table, 4, seed=42)
+    >>> sub.sum(axis=1).tolist()
+    [4, 4, 4]
+    >>> sub[1].tolist()
+    [0, 3, 0, 1, 0]
+
+    Rarefy a sparse table with a pool of threads:
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> from scipy.sparse import csr_matrix
+    >>> with ThreadPoolExecutor(max_workers=2) as executor:
+    ...     sparse_sub = subsample_table(csr_matrix(table), 4, seed=42,
+    ...                                  executor=executor, chunk_size=1)
+    >>> (sparse_sub.toarray() == sub).all()
+    True
+
+    """
+    if n < 0:
+        raise ValueError("n cannot be negative.")
+
+    data, indices, indptr, shape = _table_rows(table)
+
+    totals = np.add.reduceat(np.append(data, 0), indptr[:-1])
+    totals[indptr[:-1] == indptr[1:]] = 0
+    if not replace and (totals < n).any():
+        raise ValueError("Cannot subsample more items than exist in %d "
+                         "row(s) of the table when `replace=False`."
+                         % (totals < n).sum())
+    if replace and n > 0 and (totals == 0).any():
+        raise ValueError("Cannot subsample with replacement from %d empty "
+                         "row(s) of the table." % (totals == 0).sum())
+
+    seed = _resolve_seed(seed)
+    n_rows = shape[0]
+    if executor is None:
+        result = _subsample_rows(data, indptr, n, replace, seed, 0)
+    else:
+        if chunk_size is None:
+            chunk_size = -(-n_rows // 64)
+        starts = list(range(0, n_rows, max(chunk_size, 1)))
+        stops = starts[1:] + [n_rows]
+        results = executor.map(
+            _subsample_rows,
+            [data[indptr[start]:indptr[stop]]
+             for start, stop in zip(starts, stops)],
+            [indptr[start:stop + 1] - indptr[start]
+             for start, stop in zip(starts, stops)],
+            itertools.repeat(n), itertools.repeat(replace),
+            itertools.repeat(seed), starts)
+        result = np.concatenate([np.empty(0, dtype=np.int64)] +
+                                list(results))
+
+    if indices is not None:
+        result = scipy.sparse.csr_matrix((result, indices, indptr),
+                                         shape=shape)
+        result.eliminate_zeros()
+        return result
+    return result.reshape(shape)
+
+
+@experimental(as_of="0.5.3")
+def rarefaction_curves(table, depths, metric, seed=None, **kwargs):
+    """Compute an alpha diversity metric at many rarefaction depths.
+
+    Parameters
+    ----------
+    table : 2-D array_like or scipy.sparse matrix
+        Table of counts (integers) where each row (e.g., a sample) is a vector
+        of counts to rarefy.
+    depths : 1-D array_like of int
+        The numbers of items to subsample from each row.
+    metric : callable
+        Alpha diversity metric applied to each subsampled vector of counts,
+        such as ``skbio.diversity.alpha.observed_otus``.
+    seed : int, optional
+        Seed of the random numbers, as in ``subsample_table``.
+    kwargs : kwargs, optional
+        Additional keyword arguments passed to `metric`.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(n_rows, len(depths))`` holding the value of `metric`
+        for each row of `table` rarefied to each depth. The value is ``nan``
+        where a row sums to less than the depth.
+
+    Raises
+    ------
+    TypeError
+        If `table` cannot be safely converted to an integer datatype.
+    ValueError
+        If `table` is not 2-D, or if a depth is negative.
+
+    See Also
+    --------
+    subsample_table
+    skbio.diversity.alpha
+
+    Notes
+    -----
+    Rather than subsampling each row from scratch at every depth, the items
+    of each row are drawn without replacement one at a time, in a single
+    random order, up to the largest depth the row allows. The counts drawn
+    so far are recorded each time a depth is reached, so the subsample of a
+    row at each depth is nested in the subsamples at larger depths, as in a
+    single rarefaction curve of the sample.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from skbio.diversity.alpha import observed_otus
+    >>> from skbio.stats import rarefaction_curves
+    >>> table = np.array([[10, 0, 0, 0],
+    ...                   [5, 5, 5, 5]])
+    >>> curves = rarefaction_curves(table, [0, 1, 20], observed_otus,
+    ...                             seed=42)
+    >>> curves[0].tolist()
+    [0.0, 1.0, nan]
+    >>> curves[1].tolist()
+    [0.0, 1.0, 4.0]
+
+    """
+    depths = np.asarray(depths, dtype=np.int64)
+    if (depths < 0).any():
+        raise ValueError("depths cannot be negative.")
+
+    data, indices, indptr, shape = _table_rows(table)
+    seed = _resolve_seed(seed)
+
+    # the curves are computed at the sorted depths and reordered at the end
+    order = np.argsort(depths, kind='mergesort')
+    sorted_depths = depths[order]
+
+    curves = np.full((shape[0], len(depths)), np.nan)
+    for i in range(shape[0]):
+        row = data[indptr[i]:indptr[i + 1]]
+        row_depths = sorted_depths[sorted_depths <= row.sum()]
+        subsampled = _subsample_depths(row, row_depths, seed, i)
+        if indices is not None:
+            dense = np.zeros((len(row_depths), shape[1]), dtype=np.int64)
+            dense[:, indices[indptr[i]:indptr[i + 1]]] = subsampled
+            subsampled = dense
+        curves[i, order[:len(row_depths)]] = [
+            metric(counts, **kwargs) for counts in subsampled]
+
+    return curves
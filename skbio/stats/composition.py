@@ -54,6 +54,14 @@ Functions
    centralize
    ancom
 
+Classes
+-------
+
+.. autosummary::
+   :toctree: generated/
+
+   BalanceBasis
+
 References
 ----------
 .. [1] V. Pawlowsky-Glahn, J. J. Egozcue, R. Tolosana-Delgado (2015),
@@ -101,28 +109,110 @@ array([ 0.25,  0.25,  0.5 ])
 
 import numpy as np
 import pandas as pd
+import scipy.sparse
 import scipy.stats
 import skbio.util
-from skbio.util._decorator import experimental
+from skbio.util._decorator import experimental, classonlymethod
+
+
+# Maximum number of elements of the chunks of rows transformed at once
+_CHUNK_SIZE = 2 ** 22
+
+
+def _row_chunks(shape):
+    """Yield slices of consecutive rows of at most ``_CHUNK_SIZE`` elements"""
+    n_rows, n_cols = shape
+    step = max(1, _CHUNK_SIZE // max(1, n_cols))
+    for start in range(0, n_rows, step):
+        yield slice(start, min(start + step, n_rows))
+
+
+def _dense_rows(mat, rows):
+    """Return a slice of rows of a dense array or sparse matrix as an array"""
+    if scipy.sparse.issparse(mat):
+        return mat[rows].toarray()
+    return mat[rows]
+
+
+def _float_dtype(mat):
+    """Return the dtype of the transforms of `mat`
+
+    Floating point data keep their precision (e.g., ``np.float32``), and
+    other data are transformed to ``np.float64``.
+    """
+    if np.issubdtype(mat.dtype, np.floating):
+        return mat.dtype
+    return np.dtype(np.float64)
+
+
+def _check_composition(mat):
+    """Validate a matrix of proportions
+
+    Returns `mat` as a 2D array, or as a CSR matrix if it is sparse.
+    """
+    if scipy.sparse.issparse(mat):
+        mat = mat.tocsr()
+        if np.any(mat.data < 0):
+            raise ValueError("Cannot have negative proportions")
+        if np.any(np.asarray(mat.sum(axis=1)) == 0):
+            raise ValueError("Input matrix cannot have rows with all zeros")
+        return mat
+
+    mat = np.atleast_2d(mat)
+    if mat.ndim > 2:
+        if np.any(mat < 0):
+            raise ValueError("Cannot have negative proportions")
+        raise ValueError("Input matrix can only have two dimensions or less")
+    for rows in _row_chunks(mat.shape):
+        chunk = mat[rows]
+        if np.any(chunk < 0):
+            raise ValueError("Cannot have negative proportions")
+        if np.all(chunk == 0, axis=1).sum() > 0:
+            raise ValueError("Input matrix cannot have rows with all zeros")
+    return mat
+
+
+def _output_array(out, shape, dtype):
+    """Return a 2D view of `out`, or a new array if `out` is None"""
+    if out is None:
+        return np.empty(shape, dtype=dtype)
+    if out.size != shape[0] * shape[1]:
+        raise ValueError("`out` must have %d elements, not %d."
+                         % (shape[0] * shape[1], out.size))
+    view = out.view()
+    # raises an error rather than copying if `out` can't be reshaped in place
+    view.shape = shape
+    return view
+
+
+def _closure_rows(chunk, out):
+    """Close the rows of a 2D chunk of a matrix of proportions into `out`"""
+    return np.divide(chunk, chunk.sum(axis=1, keepdims=True), out=out)
 
 
 @experimental(as_of="0.4.0")
-def closure(mat):
+def closure(mat, out=None):
     """
     Performs closure to ensure that all elements add up to 1.
 
     Parameters
     ----------
-    mat : array_like
+    mat : array_like or scipy.sparse matrix
        a matrix of proportions where
        rows = compositions
        columns = components
+    out : numpy.ndarray, optional
+       array of the same size as `mat` in which the result is stored. It
+       can be `mat` itself to perform the closure in place. Not supported if
+       `mat` is sparse.
 
     Returns
     -------
     array_like, np.float64
        A matrix of proportions where all of the values
-       are nonzero and each composition (row) adds up to 1
+       are nonzero and each composition (row) adds up to 1. If `mat` is a
+       sparse matrix, a sparse CSR matrix with the same nonzero entries is
+       returned. If `out` is provided, `out` is returned.
 
     Raises
     ------
@@ -133,6 +223,13 @@ def closure(mat):
     ValueError
        Raises an error if there is a row that has all zeros.
 
+    Notes
+    -----
+    Floating point matrices keep their precision (e.g., a ``np.float32``
+    matrix is closed into a ``np.float32`` matrix). Large matrices are
+    processed in chunks of rows so that no full-size temporary arrays are
+    created.
+
     Examples
     --------
     >>> import numpy as np
@@ -143,19 +240,24 @@ def closure(mat):
            [ 0.4,  0.4,  0.2]])
 
     """
-    mat = np.atleast_2d(mat)
-    if np.any(mat < 0):
-        raise ValueError("Cannot have negative proportions")
-    if mat.ndim > 2:
-        raise ValueError("Input matrix can only have two dimensions or less")
-    if np.all(mat == 0, axis=1).sum() > 0:
-        raise ValueError("Input matrix cannot have rows with all zeros")
-    mat = mat / mat.sum(axis=1, keepdims=True)
-    return mat.squeeze()
+    mat = _check_composition(mat)
+
+    if scipy.sparse.issparse(mat):
+        if out is not None:
+            raise ValueError("`out` is not supported for sparse matrices.")
+        sums = np.asarray(mat.sum(axis=1)).ravel()
+        mat = mat.astype(_float_dtype(mat))
+        mat.data /= np.repeat(sums, np.diff(mat.indptr)).astype(mat.dtype)
+        return mat
+
+    result = _output_array(out, mat.shape, _float_dtype(mat))
+    for rows in _row_chunks(mat.shape):
+        _closure_rows(mat[rows], result[rows])
+    return result.squeeze() if out is None else out
 
 
 @experimental(as_of="0.4.0")
-def multiplicative_replacement(mat, delta=None):
+def multiplicative_replacement(mat, delta=None, out=None):
     r"""Replace all zeros with small non-zero values
 
     It uses the multiplicative replacement strategy [1]_ ,
@@ -165,7 +267,7 @@ def multiplicative_replacement(mat, delta=None):
 
     Parameters
     ----------
-    mat: array_like
+    mat: array_like or scipy.sparse matrix
        a matrix of proportions where
        rows = compositions and
        columns = components
@@ -174,12 +276,16 @@ def multiplicative_replacement(mat, delta=None):
        If delta is not specified, then the default delta is
        :math:`\delta = \frac{1}{N^2}` where :math:`N`
        is the number of components
+    out : numpy.ndarray, optional
+       array of the same size as `mat` in which the result is stored. It
+       can be `mat` itself to replace the zeros in place.
 
     Returns
     -------
     numpy.ndarray, np.float64
        A matrix of proportions where all of the values
-       are nonzero and each composition (row) adds up to 1
+       are nonzero and each composition (row) adds up to 1. If `out` is
+       provided, `out` is returned.
 
     Raises
     ------
@@ -191,6 +297,10 @@ def multiplicative_replacement(mat, delta=None):
     -----
     This method will result in negative proportions if a large delta is chosen.
 
+    The result is dense, since all zeros are replaced, but a sparse `mat` is
+    only densified a chunk of rows at a time. Floating point matrices keep
+    their precision.
+
     References
     ----------
     .. [1] J. A. Martin-Fernandez. "Dealing With Zeros and Missing Values in
@@ -207,21 +317,25 @@ def multiplicative_replacement(mat, delta=None):
            [ 0.0625,  0.4375,  0.4375,  0.0625]])
 
     """
-    mat = closure(mat)
-    z_mat = (mat == 0)
+    mat = _check_composition(mat)
 
     num_feats = mat.shape[-1]
-    tot = z_mat.sum(axis=-1, keepdims=True)
-
     if delta is None:
         delta = (1. / num_feats)**2
 
-    zcnts = 1 - tot * delta
-    if np.any(zcnts) < 0:
-        raise ValueError('The multiplicative replacement created negative '
-                         'proportions. Consider using a smaller `delta`.')
-    mat = np.where(z_mat, delta, zcnts * mat)
-    return mat.squeeze()
+    result = _output_array(out, mat.shape, _float_dtype(mat))
+    for rows in _row_chunks(mat.shape):
+        chunk = _closure_rows(_dense_rows(mat, rows), result[rows])
+        z_mat = (chunk == 0)
+        tot = z_mat.sum(axis=-1, keepdims=True)
+        zcnts = 1 - tot * delta
+        if np.any(zcnts < 0):
+            raise ValueError('The multiplicative replacement created '
+                             'negative proportions. Consider using a '
+                             'smaller `delta`.')
+        chunk *= zcnts
+        chunk[z_mat] = delta
+    return result.squeeze() if out is None else out
 
 
 @experimental(as_of="0.4.0")
@@ -415,7 +529,7 @@ def inner(x, y):
 
 
 @experimental(as_of="0.4.0")
-def clr(mat):
+def clr(mat, out=None):
     r"""
     Performs centre log ratio transformation.
 
@@ -438,15 +552,25 @@ def clr(mat):
 
     Parameters
     ----------
-    mat : array_like, float
+    mat : array_like or scipy.sparse matrix, float
        a matrix of proportions where
        rows = compositions and
        columns = components
+    out : numpy.ndarray, optional
+       array of the same size as `mat` in which the result is stored. It
+       can be `mat` itself to perform the transformation in place.
 
     Returns
     -------
     numpy.ndarray
-         clr transformed matrix
+         clr transformed matrix. If `out` is provided, `out` is returned.
+
+    Notes
+    -----
+    The matrix is transformed in chunks of rows, so that the only full-size
+    array created is the result (none if `out` is provided). A sparse `mat`
+    is only densified a chunk of rows at a time. Floating point matrices
+    keep their precision (e.g., ``np.float32``).
 
     Examples
     --------
@@ -457,10 +581,20 @@ def clr(mat):
     array([-0.79451346,  0.30409883,  0.5917809 , -0.10136628])
 
     """
-    mat = closure(mat)
-    lmat = np.log(mat)
-    gm = lmat.mean(axis=-1, keepdims=True)
-    return (lmat - gm).squeeze()
+    mat = _check_composition(mat)
+    result = _output_array(out, mat.shape, _float_dtype(mat))
+    for rows in _row_chunks(mat.shape):
+        _clr_rows(_dense_rows(mat, rows), result[rows])
+    return result.squeeze() if out is None else out
+
+
+def _clr_rows(chunk, out):
+    """Transform the rows of a 2D chunk of a matrix of proportions into `out`
+    """
+    _closure_rows(chunk, out)
+    np.log(out, out=out)
+    out -= out.mean(axis=-1, keepdims=True)
+    return out
 
 
 @experimental(as_of="0.4.0")
@@ -507,7 +641,7 @@ def clr_inv(mat):
 
 
 @experimental(as_of="0.4.0")
-def ilr(mat, basis=None, check=True):
+def ilr(mat, basis=None, check=True, out=None):
     r"""
     Performs isometric log ratio transformation.
 
@@ -536,13 +670,17 @@ def ilr(mat, basis=None, check=True):
        rows = compositions and
        columns = components
 
-    basis: numpy.ndarray, float, optional
+    basis: numpy.ndarray, float, or BalanceBasis, optional
         orthonormal basis for Aitchison simplex
         defaults to J.J.Egozcue orthonormal basis.
 
     check: bool
         Specifies if the basis is orthonormal.
 
+    out : numpy.ndarray, optional
+        array with one element per composition and basis vector in which the
+        result is stored.
+
     Examples
     --------
     >>> import numpy as np
@@ -557,10 +695,22 @@ def ilr(mat, basis=None, check=True):
     Aitchison simplex.  If there are `D-1` elements specified in `mat`, then
     the dimensions of the basis needs be `D-1 x D`, where rows represent
     basis vectors, and the columns represent proportions.
+
+    `mat` (which may be a sparse matrix) is transformed in chunks of rows,
+    so that the clr transform of the whole matrix is never stored.
+
+    The default basis is a `BalanceBasis`, which is applied in linear time
+    and memory in the number of components, without building the dense
+    basis matrix. `BalanceBasis.from_tree` defines the balances of a tree.
     """
-    mat = closure(mat)
+    mat = _check_composition(mat)
     if basis is None:
-        basis = clr_inv(_gram_schmidt_basis(mat.shape[-1]))
+        basis = BalanceBasis.gram_schmidt(mat.shape[-1])
+    if isinstance(basis, BalanceBasis):
+        if basis.n_parts != mat.shape[-1]:
+            raise ValueError("Basis has %d parts, but the compositions have "
+                             "%d." % (basis.n_parts, mat.shape[-1]))
+        n_balances = len(basis)
     else:
         if len(basis.shape) != 2:
             raise ValueError("Basis needs to be a 2D matrix, "
@@ -568,8 +718,19 @@ def ilr(mat, basis=None, check=True):
                              (len(basis.shape)))
         if check:
             _check_orthogonality(basis)
-
-    return inner(mat, basis)
+        clr_basis = np.atleast_2d(clr(basis))
+        n_balances = len(clr_basis)
+
+    dtype = _float_dtype(mat)
+    result = _output_array(out, (mat.shape[0], n_balances), dtype)
+    for rows in _row_chunks(mat.shape):
+        chunk = _dense_rows(mat, rows)
+        clr_chunk = _clr_rows(chunk, np.empty(chunk.shape, dtype=dtype))
+        if isinstance(basis, BalanceBasis):
+            result[rows] = _balance_rows(basis, clr_chunk)
+        else:
+            result[rows] = clr_chunk.dot(clr_basis.T)
+    return result.squeeze() if out is None else out
 
 
 @experimental(as_of="0.4.0")
@@ -602,7 +763,7 @@ def ilr_inv(mat, basis=None, check=True):
        rows = compositions and
        columns = components
 
-    basis: numpy.ndarray, float, optional
+    basis: numpy.ndarray, float, or BalanceBasis, optional
         orthonormal basis for Aitchison simplex
         defaults to J.J.Egozcue orthonormal basis
 
@@ -624,10 +785,19 @@ def ilr_inv(mat, basis=None, check=True):
     Aitchison simplex.  If there are `D-1` elements specified in `mat`, then
     the dimensions of the basis needs be `D-1 x D`, where rows represent
     basis vectors, and the columns represent proportions.
+
+    A `BalanceBasis` (including the default basis) is applied in linear time
+    and memory in the number of components.
     """
 
     if basis is None:
-        basis = _gram_schmidt_basis(mat.shape[-1] + 1)
+        basis = BalanceBasis.gram_schmidt(np.shape(mat)[-1] + 1)
+    if isinstance(basis, BalanceBasis):
+        if len(basis) != np.shape(mat)[-1]:
+            raise ValueError("Basis has %d balances, but the transformed "
+                             "compositions have %d."
+                             % (len(basis), np.shape(mat)[-1]))
+        return clr_inv(_balance_clr(basis, mat))
     else:
         if len(basis.shape) != 2:
             raise ValueError("Basis needs to be a 2D matrix, "
@@ -642,6 +812,243 @@ def ilr_inv(mat, basis=None, check=True):
     return clr_inv(np.dot(mat, basis))
 
 
+class BalanceBasis:
+    r"""Orthonormal basis of balances of a sequential binary partition
+
+    A balance contrasts two disjoint groups of parts of a composition. With
+    :math:`r` parts in the first group and :math:`s` in the second, it is
+
+    .. math::
+        b = \sqrt{\frac{rs}{r+s}} \ln\frac{g_m(x_{first})}{g_m(x_{second})}
+
+    where :math:`g_m` is the geometric mean. A sequential binary partition
+    (SBP) of :math:`D` parts defines :math:`D-1` balances that form an
+    orthonormal basis of the Aitchison simplex [1]_.
+
+    Once the parts are reordered by `order`, both groups of each balance are
+    contiguous: the first group holds the parts ``starts[j]`` to
+    ``splits[j] - 1`` and the second the parts ``splits[j]`` to
+    ``stops[j] - 1``. The basis is stored with these three integers per
+    balance, rather than as a dense :math:`(D-1) \times D` matrix, and
+    `ilr` and `ilr_inv` apply it in :math:`O(D)` time per composition using
+    cumulative sums of the log proportions.
+
+    Parameters
+    ----------
+    starts, splits, stops : array_like of int
+        The first part of the first group, the first part of the second
+        group and one past the last part of the second group of each
+        balance, in terms of the reordered parts.
+    order : array_like of int, optional
+        The column of the composition holding each reordered part. Defaults
+        to the columns in their original order.
+
+    Raises
+    ------
+    ValueError
+        If the balances do not form a sequential binary partition of the
+        parts, or if `order` is not a permutation of the parts.
+
+    See Also
+    --------
+    ilr
+    ilr_inv
+
+    References
+    ----------
+    .. [1] J. J. Egozcue, V. Pawlowsky-Glahn (2005), "Groups of Parts and
+       Their Balances in Compositional Data Analysis", Mathematical Geology,
+       37.7
+
+    Examples
+    --------
+    >>> from skbio.stats.composition import BalanceBasis, ilr
+    >>> basis = BalanceBasis(starts=[0, 0], splits=[2, 1], stops=[3, 2])
+    >>> basis.n_parts
+    3
+    >>> [round(v, 6) for v in ilr([.1, .3, .6], basis=basis)]
+    [-1.014459, -0.776836]
+
+    """
+
+    @experimental(as_of="0.5.3")
+    def __init__(self, starts, splits, stops, order=None):
+        starts, splits, stops = (np.asarray(a, dtype=np.intp).ravel()
+                                 for a in (starts, splits, stops))
+        if not len(starts) == len(splits) == len(stops):
+            raise ValueError("`starts`, `splits` and `stops` must have the "
+                             "same length.")
+        n_parts = len(starts) + 1
+        if not np.all((0 <= starts) & (starts < splits) & (splits < stops) &
+                      (stops <= n_parts)):
+            raise ValueError("Each balance must contrast two non-empty "
+                             "groups of parts.")
+
+        # each group of parts (and all the parts) is split at most once, and
+        # every balance but one splits the group of another balance
+        groups = set(zip(starts.tolist(), splits.tolist()))
+        groups.update(zip(splits.tolist(), stops.tolist()))
+        split = list(zip(starts.tolist(), stops.tolist()))
+        if (len(set(split)) != len(split) or
+                any(g not in groups for g in split if g != (0, n_parts))):
+            raise ValueError("The balances do not form a sequential binary "
+                             "partition of the parts.")
+
+        if order is None:
+            order = np.arange(n_parts)
+        order = np.asarray(order, dtype=np.intp).ravel()
+        if not np.array_equal(np.sort(order), np.arange(n_parts)):
+            raise ValueError("`order` must be a permutation of the %d parts."
+                             % n_parts)
+
+        self.starts = starts
+        self.splits = splits
+        self.stops = stops
+        self.order = order
+
+        # coefficients of the balances on the cumulative sums of the log
+        # proportions (with a leading zero) of the reordered parts
+        r = (splits - starts).astype(float)
+        s = (stops - splits).astype(float)
+        c = np.sqrt(r * s / (r + s))
+        rows = np.repeat(np.arange(len(starts)), 3)
+        cols = np.column_stack([starts, splits, stops]).ravel()
+        values = np.column_stack([-c / r, c / r + c / s, -c / s]).ravel()
+        self._coefficients = scipy.sparse.csr_matrix(
+            (values, (rows, cols)), shape=(len(starts), n_parts + 1))
+
+    @classonlymethod
+    @experimental(as_of="0.5.3")
+    def gram_schmidt(cls, n):
+        """Return the default basis of `ilr` and `ilr_inv`
+
+        Balance ``j`` contrasts the first ``j + 1`` parts with part ``j + 1``,
+        which is the J. J. Egozcue orthonormal basis derived from
+        Gram-Schmidt orthogonalization.
+
+        Parameters
+        ----------
+        n : int
+            The number of parts of the compositions.
+
+        Returns
+        -------
+        BalanceBasis
+            The basis of the ``n - 1`` balances.
+
+        """
+        splits = np.arange(1, n)
+        return cls(np.zeros(n - 1, dtype=np.intp), splits, splits + 1)
+
+    @classonlymethod
+    @experimental(as_of="0.5.3")
+    def from_tree(cls, tree, ids=None):
+        """Return the balances defined by the internal nodes of a tree
+
+        Each internal node contrasts the tips descending from its first
+        child with the tips descending from its second child.
+
+        Parameters
+        ----------
+        tree : skbio.TreeNode
+            A bifurcating tree whose tips are the parts of the compositions.
+        ids : list of str, optional
+            The name of the tip corresponding to each column of the
+            compositions. Defaults to the tips in the order of
+            ``tree.tips()``.
+
+        Returns
+        -------
+        BalanceBasis
+            One balance per internal node of `tree`, in preorder.
+
+        Raises
+        ------
+        ValueError
+            If `tree` is not bifurcating, or if its tips are not `ids`.
+
+        """
+        names = []
+        bounds = {}
+        for node in tree.postorder(include_self=True):
+            if node.is_tip():
+                bounds[id(node)] = (len(names), len(names))
+                names.append(node.name)
+            elif len(node.children) != 2:
+                raise ValueError("The tree must be bifurcating, but node %r "
+                                 "has %d children."
+                                 % (node.name, len(node.children)))
+            else:
+                first, second = node.children
+                bounds[id(node)] = (bounds[id(first)][0],
+                                    bounds[id(second)][1])
+
+        starts, splits, stops = [], [], []
+        for node in tree.preorder(include_self=True):
+            if not node.is_tip():
+                first, second = node.children
+                starts.append(bounds[id(first)][0])
+                splits.append(bounds[id(second)][0])
+                stops.append(bounds[id(second)][1] + 1)
+
+        if ids is None:
+            order = None
+            if len(set(names)) != len(names):
+                raise ValueError("The names of the tips must be unique.")
+        else:
+            columns = {name: i for i, name in enumerate(ids)}
+            if (len(columns) != len(ids) or len(names) != len(ids) or
+                    set(names) != set(columns)):
+                raise ValueError("The tips of the tree must be exactly "
+                                 "`ids`.")
+            order = [columns[name] for name in names]
+        return cls(starts, splits, stops, order)
+
+    @property
+    @experimental(as_of="0.5.3")
+    def n_parts(self):
+        """The number of parts of the compositions"""
+        return len(self.order)
+
+    @experimental(as_of="0.5.3")
+    def __len__(self):
+        return len(self.starts)
+
+    @experimental(as_of="0.5.3")
+    def to_array(self):
+        """Return the basis as a dense matrix of compositions
+
+        Returns
+        -------
+        numpy.ndarray
+            One row per balance, which can be passed as the `basis` of
+            `ilr` and `ilr_inv`. It has ``len(self) * self.n_parts``
+            elements, so it should only be built for small compositions.
+
+        """
+        clr_basis = _balance_clr(self, np.identity(len(self)))
+        return np.atleast_2d(clr_inv(clr_basis))
+
+
+def _balance_rows(basis, clr_chunk):
+    """Return the balances of a 2D chunk of clr transformed compositions"""
+    sums = np.zeros((clr_chunk.shape[0], basis.n_parts + 1))
+    np.cumsum(clr_chunk[:, basis.order], axis=1, dtype=np.float64,
+              out=sums[:, 1:])
+    return basis._coefficients.dot(sums.T).T
+
+
+def _balance_clr(basis, mat):
+    """Return the clr transformed compositions with the balances `mat`"""
+    mat = np.atleast_2d(mat)
+    # the clr coordinates of the reordered parts are the cumulative sums of
+    # the differences between consecutive parts
+    sums = np.cumsum(-basis._coefficients.T.dot(mat.T).T, axis=1)
+    result = np.empty((mat.shape[0], basis.n_parts))
+    result[:, basis.order] = sums[:, :-1]
+    return result
+
+
 @experimental(as_of="0.4.0")
 def centralize(mat):
     r"""Center data around its geometric average.
@@ -973,8 +1380,7 @@ def ancom(table, grouping,
 
     # Multiple comparisons
     if multiple_comparisons_correction == 'holm-bonferroni':
-        logratio_mat = np.apply_along_axis(_holm_bonferroni,
-                                           1, logratio_mat)
+        logratio_mat = _holm_bonferroni(logratio_mat)
     np.fill_diagonal(logratio_mat, 1)
     W = (logratio_mat < alpha).sum(axis=1)
     c_start = W.max() / n_feat
@@ -1026,26 +1432,29 @@ def _holm_bonferroni(p):
     Parameters
     ---------
     p: numpy.array
-        array of pvalues
+        array of pvalues. If 2D, each row is corrected separately.
 
     Returns
     -------
     numpy.array
         corrected pvalues
     """
-    K = len(p)
-    sort_index = -np.ones(K, dtype=np.int64)
-    sorted_p = np.sort(p)
-    sorted_p_adj = sorted_p*(K-np.arange(K))
-    for j in range(K):
-        idx = (p == sorted_p[j]) & (sort_index < 0)
-        num_ties = len(sort_index[idx])
-        sort_index[idx] = np.arange(j, (j+num_ties), dtype=np.int64)
+    p = np.asarray(p, dtype=np.float64)
+    K = p.shape[-1]
+    rows = p.reshape(-1, K)
+    row_index = np.arange(len(rows))[:, np.newaxis]
+    # tied pvalues are ranked in order of appearance, as by a stable sort
+    order = np.argsort(rows, axis=1, kind='mergesort')
+    sorted_p = rows[row_index, order]
+    sorted_holm_p = np.minimum(
+        np.maximum.accumulate(sorted_p * (K - np.arange(K)), axis=1), 1)
+    holm_p = np.empty_like(rows)
+    holm_p[row_index, order] = sorted_holm_p
+    return holm_p.reshape(p.shape)
+
 
-    sorted_holm_p = [min([max(sorted_p_adj[:k]), 1])
-                     for k in range(1, K+1)]
-    holm_p = [sorted_holm_p[sort_index[k]] for k in range(K)]
-    return holm_p
+# Maximum number of elements of the blocks of log ratios computed at once
+_LOG_RATIO_BLOCK_SIZE = 2 ** 22
 
 
 def _log_compare(mat, cats,
@@ -1068,12 +1477,23 @@ def _log_compare(mat, cats,
     --------
     log_ratio : np.array
         log ratio pvalue matrix
+
+    Notes
+    -----
+    If `significance_test` is ``scipy.stats.f_oneway``, or
+    ``scipy.stats.ttest_ind`` with two categories (which then yields the same
+    pvalues), the F statistics of all log ratios are computed with NumPy in
+    blocks instead of calling `significance_test` for each pair of features.
     """
     r, c = mat.shape
     log_ratio = np.zeros((c, c))
     log_mat = np.log(mat)
     cs = np.unique(cats)
 
+    if (significance_test is scipy.stats.f_oneway or
+            (significance_test is scipy.stats.ttest_ind and len(cs) == 2)):
+        return _log_compare_anova(log_mat, cats, cs)
+
     def func(x):
         return significance_test(*[x[cats == k] for k in cs])
 
@@ -1086,6 +1506,71 @@ def _log_compare(mat, cats,
     return log_ratio
 
 
+def _log_compare_anova(log_mat, cats, cs):
+    """ Computes the one-way ANOVA pvalues of all pairwise log ratios
+
+    The log ratios of each feature with all of the following features are
+    computed in blocks of rows of at most ``_LOG_RATIO_BLOCK_SIZE`` elements,
+    and the between and within group sums of squares are derived from the
+    group means of each block. Log ratios that are constant up to rounding
+    errors get a pvalue of ``nan``, as constant input does with
+    ``scipy.stats.f_oneway``.
+
+    Parameters
+    ----------
+    log_mat: np.array
+       log of the matrix whose rows correspond to samples and columns
+       correspond to features
+    cats: np.array
+       Vector of categories
+    cs: np.array
+       Unique categories
+
+    Returns
+    -------
+    log_ratio : np.array
+        log ratio pvalue matrix, with the pvalues in its upper triangle
+    """
+    r, c = log_mat.shape
+    log_ratio = np.zeros((c, c))
+    members = [cats == k for k in cs]
+    sizes = np.array([m.sum() for m in members], dtype=np.float64)
+    df_between = len(cs) - 1
+    df_within = r - len(cs)
+
+    rows_per_block = max(1, _LOG_RATIO_BLOCK_SIZE // max(1, r * c))
+    for start in range(0, c - 1, rows_per_block):
+        stop = min(start + rows_per_block, c - 1)
+        # ratios[:, i, j] is the log ratio of features start + i and
+        # start + 1 + j
+        ratios = (log_mat[:, start:stop, np.newaxis] -
+                  log_mat[:, np.newaxis, start + 1:])
+        grand_mean = ratios.mean(axis=0)
+        ss_between = np.zeros(ratios.shape[1:])
+        ss_within = np.zeros(ratios.shape[1:])
+        for member, size in zip(members, sizes):
+            group = ratios[member]
+            group_mean = group.mean(axis=0)
+            ss_between += size * (group_mean - grand_mean) ** 2
+            ss_within += ((group - group_mean) ** 2).sum(axis=0)
+
+        # log ratios that are constant up to rounding errors (i.e., of
+        # proportional features) have no variance, and no pvalue
+        tolerance = r * (16 * np.finfo(np.float64).eps *
+                         np.abs(ratios).max(axis=0)) ** 2
+        constant = ss_between + ss_within <= tolerance
+        ss_between[constant] = 0
+        ss_within[constant] = 0
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            f = (ss_between / df_between) / (ss_within / df_within)
+        p = scipy.stats.f.sf(f, df_between, df_within)
+
+        for i in range(start, stop):
+            log_ratio[i, i+1:] = p[i - start, i - start:]
+    return log_ratio
+
+
 def _gram_schmidt_basis(n):
     """
     Builds clr transformed basis derived from
@@ -7,6 +7,7 @@
 # ----------------------------------------------------------------------------
 
 import itertools
+import functools
 from copy import deepcopy
 
 from IPython.core.pylabtools import print_figure
@@ -734,7 +735,7 @@ class DistanceMatrix(DissimilarityMatrix):
     @classonlymethod
     @experimental(as_of="0.4.1")
     def from_iterable(cls, iterable, metric, key=None, keys=None,
-                      validate=True):
+                      validate=True, executor=None, chunk_size=None):
         """Create DistanceMatrix from all pairs in an iterable given a metric.
 
         Parameters
@@ -761,6 +762,17 @@ class DistanceMatrix(DissimilarityMatrix):
             (excluding the diagonal) is computed. Pass ``validate=False`` if
             you are sure `metric` is hollow and symmetric for improved
             performance.
+        executor : concurrent.futures.Executor, optional
+            If provided (and `validate` is ``False``), the pairwise distances
+            are computed in tasks submitted to `executor`, such as a
+            ``ThreadPoolExecutor`` or ``ProcessPoolExecutor``. `metric` and the
+            elements of `iterable` must be picklable to use a
+            ``ProcessPoolExecutor``.
+        chunk_size : int, optional
+            The approximate number of pairwise distances computed by each task
+            submitted to `executor`. Each task computes the distances of
+            consecutive rows of the lower triangle of the matrix. By default,
+            the distances are split into 64 tasks.
 
         Returns
         -------
@@ -772,6 +784,40 @@ class DistanceMatrix(DissimilarityMatrix):
         ValueError
             If `key` and `keys` are both provided.
 
+        Notes
+        -----
+        If `validate` is ``False`` and `metric` is
+        ``skbio.sequence.distance.hamming`` or a ``functools.partial`` of
+        ``skbio.sequence.distance.kmer_distance`` (e.g.,
+        ``functools.partial(kmer_distance, k=5)``), a specialized
+        implementation that computes all of the distances at once is used
+        instead of calling `metric` for each pair of elements, and `executor`
+        is ignored. The Hamming distances are computed by comparing the
+        sequences' bytes with NumPy, and the kmers of each sequence are only
+        extracted once.
+
+        Examples
+        --------
+        Compute the Hamming distances between sequences, using the
+        specialized implementation:
+
+        >>> from skbio import DNA, DistanceMatrix
+        >>> from skbio.sequence.distance import hamming
+        >>> seqs = [DNA('ACGT'), DNA('ACGA'), DNA('TTTT')]
+        >>> dm = DistanceMatrix.from_iterable(seqs, hamming, validate=False)
+        >>> print(dm['0', '1'])
+        0.25
+
+        Compute the distances with a thread pool:
+
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> with ThreadPoolExecutor(max_workers=2) as executor:
+        ...     dm = DistanceMatrix.from_iterable(
+        ...         range(4), lambda a, b: abs(a - b), validate=False,
+        ...         executor=executor, chunk_size=2)
+        >>> print(dm['0', '3'])
+        3.0
+
         """
         if validate:
             return super(DistanceMatrix, cls).from_iterable(iterable, metric,
@@ -788,10 +834,35 @@ class DistanceMatrix(DissimilarityMatrix):
         elif keys is not None:
             keys_ = keys
 
-        dm = np.zeros((len(iterable),) * 2)
-        for i, a in enumerate(iterable):
-            for j, b in enumerate(iterable[:i]):
-                dm[i, j] = dm[j, i] = metric(a, b)
+        n = len(iterable)
+        dm = np.zeros((n, n))
+
+        condensed = _pairwise_fast_path(iterable, metric)
+        if condensed is not None:
+            dm[np.triu_indices(n, 1)] = condensed
+            dm += dm.T
+            return cls(dm, keys_)
+
+        if executor is None:
+            values = _lower_triangle_rows(metric, iterable, 0, n)
+        else:
+            # split the rows so that each task computes about `chunk_size`
+            # distances (row i of the lower triangle has i distances)
+            n_pairs = n * (n - 1) // 2
+            if chunk_size is None:
+                chunk_size = -(-n_pairs // 64)
+            row_starts = np.arange(n) * (np.arange(n) - 1) // 2
+            bounds = np.unique(np.searchsorted(
+                row_starts, np.arange(0, n_pairs, max(chunk_size, 1))))
+            bounds = np.append(bounds, n).tolist()
+            starts, stops = bounds[:-1], bounds[1:]
+            results = executor.map(
+                _lower_triangle_rows, itertools.repeat(metric),
+                [iterable[:stop] for stop in stops], starts, stops)
+            values = list(itertools.chain.from_iterable(results))
+
+        dm[np.tril_indices(n, -1)] = values
+        dm += dm.T
 
         return cls(dm, keys_)
 
@@ -985,6 +1056,39 @@ def randdm(num_objects, ids=None, constructor=None, random_fn=None):
 
 # helper functions for anosim and permanova
 
+def _pairwise_fast_path(items, metric):
+    """Compute all distances at once if `metric` has a specialized version.
+
+    Returns the distances in condensed form, or ``None`` if `metric` must be
+    applied to each pair of `items`.
+
+    """
+    # imported here so that skbio.stats does not depend on skbio.sequence
+    from skbio.sequence.distance import (hamming, kmer_distance,
+                                         _pairwise_hamming,
+                                         _pairwise_kmer_distance)
+
+    if metric is hamming:
+        return _pairwise_hamming(items)
+    if (isinstance(metric, functools.partial) and
+            metric.func is kmer_distance and not metric.args and
+            'k' in metric.keywords and
+            set(metric.keywords) <= {'k', 'overlap'}):
+        return _pairwise_kmer_distance(items, **metric.keywords)
+    return None
+
+
+def _lower_triangle_rows(metric, items, start, stop):
+    """Apply `metric` to the pairs of rows `start` to `stop` of the triangle.
+
+    Returns the distances between ``items[i]`` and ``items[j]`` for each row
+    ``i`` and ``j < i``, in the order of ``np.tril_indices``.
+
+    """
+    return [metric(items[i], items[j])
+            for i in range(start, stop) for j in range(i)]
+
+
 def _preprocess_input(distance_matrix, grouping, column):
     """Compute intermediate results not affected by permutations.
 
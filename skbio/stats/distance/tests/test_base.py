@@ -6,7 +6,9 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import functools
 import io
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase, main
 
 import matplotlib as mpl
@@ -17,7 +19,7 @@ import scipy.spatial.distance
 from IPython.core.display import Image, SVG
 
 import skbio.sequence.distance
-from skbio import DistanceMatrix, Sequence
+from skbio import DistanceMatrix, Sequence, DNA
 from skbio.stats.distance import (
     DissimilarityMatrixError, DistanceMatrixError, MissingIDError,
     DissimilarityMatrix, randdm)
@@ -743,6 +745,63 @@ class DistanceMatrixTests(DissimilarityMatrixTestData):
 
         self.assertEqual(dm, exp)
 
+    def test_from_iterable_validate_false_executor(self):
+        iterable = list(range(7))
+        exp = DistanceMatrix.from_iterable(iterable, lambda a, b: abs(b - a))
+        for chunk_size in None, 1, 4, 100:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                res = DistanceMatrix.from_iterable(
+                    iterable, lambda a, b: abs(b - a), validate=False,
+                    executor=executor, chunk_size=chunk_size)
+            self.assertEqual(res, exp)
+
+    def test_from_iterable_validate_false_executor_argument_order(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            res = DistanceMatrix.from_iterable(
+                (x for x in range(4)), lambda a, b: a - b, validate=False,
+                executor=executor, chunk_size=2)
+        exp = DistanceMatrix([[0, 1, 2, 3],
+                              [1, 0, 1, 2],
+                              [2, 1, 0, 1],
+                              [3, 2, 1, 0]])
+        self.assertEqual(res, exp)
+
+    def test_from_iterable_validate_false_executor_single(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            res = DistanceMatrix.from_iterable(
+                ["boo"], lambda a, b: 0, validate=False, executor=executor)
+        self.assertEqual(res, DistanceMatrix([[0]]))
+
+    def test_from_iterable_validate_false_hamming(self):
+        seqs = [DNA('ACGT'), DNA('ACGA', metadata={'id': 'seq1'}),
+                DNA('AAAA'), DNA('TTTT'), DNA('ACGT')]
+        exp = DistanceMatrix.from_iterable(
+            seqs, lambda a, b: skbio.sequence.distance.hamming(a, b))
+        res = DistanceMatrix.from_iterable(
+            seqs, skbio.sequence.distance.hamming, validate=False)
+        self.assertEqual(res, exp)
+
+    def test_from_iterable_validate_false_hamming_invalid(self):
+        with self.assertRaisesRegex(ValueError, 'equal length'):
+            DistanceMatrix.from_iterable(
+                [DNA('ACGT'), DNA('ACG')], skbio.sequence.distance.hamming,
+                validate=False)
+        with self.assertRaisesRegex(TypeError, 'matching type'):
+            DistanceMatrix.from_iterable(
+                [DNA('ACGT'), Sequence('ACGT')],
+                skbio.sequence.distance.hamming, validate=False)
+
+    def test_from_iterable_validate_false_kmer_distance(self):
+        seqs = [DNA('ACGTACGT'), DNA('ACGAACGTT'), DNA('AAAA'),
+                DNA('TTTTACGT'), DNA('GGCC')]
+        for kwargs in {'k': 3}, {'k': 2, 'overlap': False}:
+            metric = functools.partial(skbio.sequence.distance.kmer_distance,
+                                       **kwargs)
+            exp = DistanceMatrix.from_iterable(seqs,
+                                               lambda a, b: metric(a, b))
+            res = DistanceMatrix.from_iterable(seqs, metric, validate=False)
+            self.assertEqual(res, exp)
+
     def test_condensed_form(self):
         for dm, condensed in zip(self.dms, self.dm_condensed_forms):
             obs = dm.condensed_form()
@@ -11,11 +11,12 @@ from warnings import warn
 import pandas as pd
 import numpy as np
 from scipy.linalg import eigh
+from scipy.sparse.linalg import eigsh
 
 from skbio.stats.distance import DistanceMatrix
 from skbio.util._decorator import experimental
 from ._ordination_results import OrdinationResults
-from ._utils import e_matrix, f_matrix
+from ._utils import center_distance_matrix, _row_tiles
 
 # - In cogent, after computing eigenvalues/vectors, the imaginary part
 #   is dropped, if any. We know for a fact that the eigenvalues are
@@ -27,7 +28,8 @@ from ._utils import e_matrix, f_matrix
 
 
 @experimental(as_of="0.4.0")
-def pcoa(distance_matrix):
+def pcoa(distance_matrix, method='eigh', number_of_dimensions=None,
+         inplace=False):
     r"""Perform Principal Coordinate Analysis.
 
     Principal Coordinate Analysis (PCoA) is a method similar to PCA
@@ -47,7 +49,22 @@ def pcoa(distance_matrix):
     Parameters
     ----------
     distance_matrix : DistanceMatrix
-        A distance matrix.
+        A distance matrix. Anything accepted by the ``DistanceMatrix``
+        constructor, such as a 2-D (possibly memory-mapped) array or 1-D array
+        of distances in condensed form, can also be passed.
+    method : {'eigh', 'eigsh'}, optional
+        ``'eigh'`` computes all the eigenvalues and eigenvectors of the
+        centred matrix, which takes :math:`O(n^3)` time for :math:`n`
+        samples. ``'eigsh'`` only computes the largest
+        `number_of_dimensions` of them with the Lanczos method, which only
+        requires products of the centred matrix with vectors.
+    number_of_dimensions : int, optional
+        The number of principal coordinates to return. Defaults to all
+        of them (the number of samples), and is required for ``'eigsh'``.
+    inplace : bool, optional
+        If ``True``, the distances are overwritten by the centred matrix
+        instead of copying them. The distance matrix must not be used
+        afterwards.
 
     Returns
     -------
@@ -56,6 +73,12 @@ def pcoa(distance_matrix):
         proportion explained by each of them, and transformed sample
         coordinates.
 
+    Raises
+    ------
+    ValueError
+        If `method` is unknown, or if `number_of_dimensions` is not between
+        1 and the number of samples (or is not provided for ``'eigsh'``).
+
     See Also
     --------
     OrdinationResults
@@ -76,20 +99,79 @@ def pcoa(distance_matrix):
        However, a warning is raised whenever negative eigenvalues
        appear, allowing the user to decide if they can be safely
        ignored.
+
+    With ``'eigh'``, the proportion explained by each principal coordinate
+    is relative to the sum of the positive eigenvalues, however many
+    coordinates are returned. ``'eigsh'`` does not compute the smaller
+    eigenvalues, so its proportions are relative to the sum of all the
+    eigenvalues instead (the trace of the centred matrix), which includes
+    the negative ones. This is also the case when ``'eigsh'`` falls back
+    to the full decomposition because `number_of_dimensions` is at least the
+    number of samples minus one. Both are the same if no eigenvalue is
+    negative, and otherwise the proportions explained with ``'eigsh'`` are
+    larger.
+
+    The centred matrix is computed without the intermediate E matrix, so
+    that only one matrix of the size of the distance matrix is allocated
+    (none if `inplace` is ``True``). With ``'eigsh'`` and a few dimensions,
+    PCoA of tens of thousands of samples is then limited by the memory used
+    by the distance matrix rather than by the eigendecomposition.
+
+    Examples
+    --------
+    >>> from skbio import DistanceMatrix
+    >>> from skbio.stats.ordination import pcoa
+    >>> dm = DistanceMatrix([[0, 3, 4, 5],
+    ...                      [3, 0, 5, 4],
+    ...                      [4, 5, 0, 3],
+    ...                      [5, 4, 3, 0]], ids=['a', 'b', 'c', 'd'])
+    >>> ordination = pcoa(dm, method='eigsh', number_of_dimensions=2)
+    >>> [round(v, 4) for v in ordination.eigvals]
+    [16.0, 9.0]
+    >>> [round(v, 4) for v in ordination.proportion_explained]
+    [0.64, 0.36]
+
     """
     distance_matrix = DistanceMatrix(distance_matrix)
+    n = distance_matrix.shape[0]
 
-    E_matrix = e_matrix(distance_matrix.data)
+    if method not in ('eigh', 'eigsh'):
+        raise ValueError("Unknown method %r. Use 'eigh' or 'eigsh'." %
+                         method)
+    if number_of_dimensions is None:
+        if method == 'eigsh':
+            raise ValueError("number_of_dimensions must be provided with "
+                             "method 'eigsh'.")
+        number_of_dimensions = n
+    if not 1 <= number_of_dimensions <= n:
+        raise ValueError("number_of_dimensions must be between 1 and the "
+                         "number of samples (%d), not %r." %
+                         (n, number_of_dimensions))
 
     # If the used distance was euclidean, pairwise distances
     # needn't be computed from the data table Y because F_matrix =
     # Y.dot(Y.T) (if Y has been centred).
-    F_matrix = f_matrix(E_matrix)
+    F_matrix = center_distance_matrix(distance_matrix.data, inplace=inplace)
+
+    # ARPACK can't compute all the eigenvalues of a matrix, and it would be
+    # slower than a full decomposition for nearly all of them.
+    if method == 'eigsh' and number_of_dimensions < n - 1:
+        # a fixed starting vector makes the results reproducible (a constant
+        # vector can't be used, as it is in the null space of F_matrix)
+        v0 = np.random.RandomState(0).uniform(-1, 1, n)
+        eigvals, eigvecs = eigsh(F_matrix, k=number_of_dimensions,
+                                 which='LA', v0=v0)
+    else:
+        eigvals, eigvecs = eigh(F_matrix)
 
-    # If the eigendecomposition ever became a bottleneck, it could
-    # be replaced with an iterative version that computes the
-    # largest k eigenvectors.
-    eigvals, eigvecs = eigh(F_matrix)
+    if method == 'eigsh':
+        # the sum of the eigenvalues that eigsh does not compute is unknown,
+        # so they are all summed by the trace. This is also done when eigh is
+        # used for (nearly) all the dimensions, so that the proportions
+        # explained do not depend on number_of_dimensions.
+        total = np.trace(F_matrix)
+    else:
+        total = None
 
     # eigvals might not be ordered, so we order them (at least one
     # is zero). cogent makes eigenvalues positive by taking the
@@ -98,6 +180,8 @@ def pcoa(distance_matrix):
     # in that case. First, we make values close to 0 equal to 0.
     negative_close_to_zero = np.isclose(eigvals, 0)
     eigvals[negative_close_to_zero] = 0
+    if total is None:
+        total = eigvals[eigvals > 0].sum()
     if np.any(eigvals < 0):
         warn(
             "The result contains negative eigenvalues."
@@ -110,7 +194,7 @@ def pcoa(distance_matrix):
                                                   eigvals.max()),
             RuntimeWarning
             )
-    idxs_descending = eigvals.argsort()[::-1]
+    idxs_descending = eigvals.argsort()[::-1][:number_of_dimensions]
     eigvals = eigvals[idxs_descending]
     eigvecs = eigvecs[:, idxs_descending]
 
@@ -131,7 +215,7 @@ def pcoa(distance_matrix):
     eigvals[num_positive:] = np.zeros(eigvals[num_positive:].shape)
 
     coordinates = eigvecs * np.sqrt(eigvals)
-    proportion_explained = eigvals / eigvals.sum()
+    proportion_explained = eigvals / total
 
     axis_labels = ['PC%d' % i for i in range(1, eigvals.size + 1)]
     return OrdinationResults(
@@ -142,3 +226,136 @@ def pcoa(distance_matrix):
                              columns=axis_labels),
         proportion_explained=pd.Series(proportion_explained,
                                        index=axis_labels))
+
+
+@experimental(as_of="0.5.3")
+def pcoa_project(ordination, distances, distance_matrix=None):
+    r"""Place new samples into an existing Principal Coordinate Analysis.
+
+    The new samples are projected onto the principal coordinates of
+    `ordination` with Gower's add-a-point formula [1]_, from their distances
+    to the samples of the ordination, without recomputing the
+    eigendecomposition.
+
+    Parameters
+    ----------
+    ordination : OrdinationResults
+        The results of `pcoa`.
+    distances : pd.DataFrame or array_like
+        The distances from each new sample (rows) to each sample of
+        `ordination` (columns). The columns of a ``pd.DataFrame`` are
+        matched to the samples of `ordination` by ID, and its index gives
+        the IDs of the new samples. The columns of an array must be in the
+        order of ``ordination.samples``. A 1-D array holds the distances
+        of a single new sample.
+    distance_matrix : DistanceMatrix, optional
+        The distance matrix from which `ordination` was computed. It is
+        required when `ordination` has fewer principal coordinates than
+        samples (e.g., with ``pcoa(..., method='eigsh')``), and makes the
+        projection exact when the distances are not Euclidean (see Notes).
+
+    Returns
+    -------
+    pd.DataFrame
+        The coordinates of the new samples on the principal coordinates of
+        `ordination`.
+
+    Raises
+    ------
+    ValueError
+        If the distances to some samples of `ordination` are missing.
+    ValueError
+        If `ordination` has fewer principal coordinates than samples and
+        `distance_matrix` is not provided.
+
+    See Also
+    --------
+    pcoa
+
+    Notes
+    -----
+    Let :math:`Y` be the :math:`n \times k` coordinates of the samples of
+    the ordination and :math:`\Lambda` the diagonal matrix of its
+    eigenvalues. The coordinates of a new sample whose squared distances to
+    these samples are :math:`d^2` are
+
+    .. math::
+        y = \frac{1}{2} \Lambda^{-1} Y^T (r - d^2)
+
+    where :math:`r_i` is the mean squared distance from sample :math:`i`
+    to all samples, which is computed from `distance_matrix` if provided.
+    Otherwise, it is replaced by the squared norm of the coordinates of
+    sample :math:`i`, which gives the same result (the two vectors differ
+    by a constant, which is orthogonal to the centred coordinates) if
+    `ordination` has all the principal coordinates of a Euclidean distance.
+    The squared norms of truncated coordinates are too small, so
+    `distance_matrix` must be provided in that case.
+    The coordinates of all new samples are computed with a single matrix
+    product, and the coordinates on axes with a zero eigenvalue are zero.
+
+    References
+    ----------
+    .. [1] Gower, J. C. (1968). Adding a point to vector diagrams in
+       multivariate analysis. Biometrika, 55(3), 582-585.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from skbio import DistanceMatrix
+    >>> from skbio.stats.ordination import pcoa, pcoa_project
+    >>> dm = DistanceMatrix([[0, 3, 4, 5],
+    ...                      [3, 0, 5, 4],
+    ...                      [4, 5, 0, 3],
+    ...                      [5, 4, 3, 0]], ids=['a', 'b', 'c', 'd'])
+    >>> ordination = pcoa(dm)
+
+    Projecting a sample at the same distances as sample ``'a'`` places it
+    at the coordinates of ``'a'``:
+
+    >>> projected = pcoa_project(ordination, dm['a'])
+    >>> np.allclose(projected.iloc[0], ordination.samples.loc['a'])
+    True
+
+    """
+    samples = ordination.samples
+    if isinstance(distances, pd.DataFrame):
+        missing = samples.index.difference(distances.columns)
+        if len(missing) > 0:
+            raise ValueError("Distances to %d samples of the ordination are "
+                             "missing (e.g., %r)." %
+                             (len(missing), missing[0]))
+        index = distances.index
+        distances = distances[samples.index].values
+    else:
+        distances = np.atleast_2d(np.asarray(distances, dtype=float))
+        if distances.shape[1] != samples.shape[0]:
+            raise ValueError("Distances to the %d samples of the ordination "
+                             "are required, not %d." %
+                             (samples.shape[0], distances.shape[1]))
+        index = None
+
+    coordinates = samples.values
+    if distance_matrix is None:
+        if samples.shape[1] < samples.shape[0]:
+            raise ValueError(
+                "The ordination has %d principal coordinates for %d samples. "
+                "The distance matrix it was computed from must be provided "
+                "to project samples onto some of the principal coordinates."
+                % (samples.shape[1], samples.shape[0]))
+        mean_squares = np.einsum('ij,ij->i', coordinates, coordinates)
+    else:
+        data = distance_matrix.data
+        mean_squares = np.empty(data.shape[0])
+        for rows in _row_tiles(data.shape):
+            tile = data[rows]
+            mean_squares[rows] = np.einsum('ij,ij->i', tile, tile)
+        mean_squares /= data.shape[1]
+        mean_squares = mean_squares[[distance_matrix.index(id_)
+                                     for id_ in samples.index]]
+
+    eigvals = ordination.eigvals.values
+    projected = (mean_squares - distances ** 2).dot(coordinates) / 2
+    np.divide(projected, eigvals, out=projected, where=eigvals > 0)
+    projected[:, eigvals <= 0] = 0
+
+    return pd.DataFrame(projected, index=index, columns=samples.columns)
@@ -11,6 +11,20 @@ import numpy as np
 from skbio.util._decorator import experimental
 
 
+# Maximum number of elements of the tiles of rows of a distance matrix that
+# are centred at once
+_CENTER_BLOCK_SIZE = 2 ** 22
+
+
+def _row_tiles(shape):
+    """Yield slices of consecutive rows of at most ``_CENTER_BLOCK_SIZE``
+    elements"""
+    n_rows, n_cols = shape
+    step = max(1, _CENTER_BLOCK_SIZE // max(1, n_cols))
+    for start in range(0, n_rows, step):
+        yield slice(start, min(start + step, n_rows))
+
+
 @experimental(as_of="0.4.0")
 def mean_and_std(a, axis=None, weights=None, with_mean=True, with_std=True,
                  ddof=0):
@@ -195,4 +209,90 @@ def f_matrix(E_matrix):
     row_means = E_matrix.mean(axis=1, keepdims=True)
     col_means = E_matrix.mean(axis=0, keepdims=True)
     matrix_mean = E_matrix.mean()
-    return E_matrix - row_means - col_means + matrix_mean
+    F_matrix = E_matrix - row_means
+    F_matrix -= col_means
+    F_matrix += matrix_mean
+    return F_matrix
+
+
+@experimental(as_of="0.5.3")
+def center_distance_matrix(distance_matrix, inplace=False, out=None):
+    """Compute the F matrix of a symmetric distance matrix.
+
+    Equivalent to ``f_matrix(e_matrix(distance_matrix))`` (Eqs. 9.20 and
+    9.21 in Legendre & Legendre 1998), but without the intermediate E
+    matrix. As the matrix is symmetric, its column means are its row means.
+
+    Parameters
+    ----------
+    distance_matrix : 2-D numpy.ndarray
+        A symmetric matrix of distances. It can be a ``numpy.memmap``.
+    inplace : bool, optional
+        If ``True``, `distance_matrix` (which must then be a writeable
+        floating point array) is overwritten with the result, so that no
+        other matrix is allocated.
+    out : 2-D numpy.ndarray, optional
+        Floating point array of the same shape as `distance_matrix` in which
+        the result is stored (e.g., a ``numpy.memmap``). Cannot be combined
+        with `inplace`.
+
+    Returns
+    -------
+    numpy.ndarray
+        The centred matrix, which is `distance_matrix` itself if `inplace`
+        is ``True``, or `out` if provided.
+
+    Raises
+    ------
+    ValueError
+        If `out` is provided with `inplace`, or does not have the shape of
+        `distance_matrix`.
+
+    Notes
+    -----
+    The matrix is read in tiles of consecutive rows, twice: once to compute
+    the row means of the E matrix, and once to write the centred rows. Apart
+    from the result, memory use is therefore bounded by the size of a tile,
+    so that a memory-mapped distance matrix larger than the available
+    memory can be centred in place (or into a memory-mapped `out`).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from skbio.stats.ordination import (center_distance_matrix,
+    ...                                     e_matrix, f_matrix)
+    >>> dm = np.array([[0., 3., 4.],
+    ...                [3., 0., 5.],
+    ...                [4., 5., 0.]])
+    >>> np.allclose(center_distance_matrix(dm), f_matrix(e_matrix(dm)))
+    True
+
+    """
+    if inplace:
+        if out is not None:
+            raise ValueError("`out` cannot be provided if `inplace` is True.")
+        centered = distance_matrix
+    elif out is None:
+        centered = np.empty(distance_matrix.shape, dtype=np.float64)
+    elif out.shape != distance_matrix.shape:
+        raise ValueError("`out` must have shape %r, not %r." %
+                         (distance_matrix.shape, out.shape))
+    else:
+        centered = out
+
+    # row means of the E matrix (which are also its column means)
+    row_means = np.empty(distance_matrix.shape[0])
+    for rows in _row_tiles(distance_matrix.shape):
+        tile = np.asarray(distance_matrix[rows], dtype=np.float64)
+        row_means[rows] = np.einsum('ij,ij->i', tile, tile)
+    row_means /= -2 * distance_matrix.shape[1]
+    matrix_mean = row_means.mean()
+
+    for rows in _row_tiles(distance_matrix.shape):
+        tile = centered[rows]
+        np.multiply(distance_matrix[rows], distance_matrix[rows], out=tile)
+        tile /= -2
+        tile -= row_means[rows, np.newaxis]
+        tile -= row_means
+        tile += matrix_mean
+    return centered
@@ -13,7 +13,8 @@ from unittest import TestCase, main
 
 from skbio import DistanceMatrix, OrdinationResults
 from skbio.stats.distance import DissimilarityMatrixError
-from skbio.stats.ordination import pcoa
+from skbio.stats.ordination import (pcoa, pcoa_project,
+                                    center_distance_matrix)
 from skbio.util import get_data_path, assert_ordination_results_equal
 
 
@@ -125,6 +126,156 @@ class TestPCoA(TestCase):
         with npt.assert_raises(DissimilarityMatrixError):
             pcoa([[1, 2], [3, 4]])
 
+    def test_invalid_method_and_dimensions(self):
+        with self.assertRaisesRegex(ValueError, 'Unknown method'):
+            pcoa(self.dm, method='svd')
+        with self.assertRaisesRegex(ValueError, 'must be provided'):
+            pcoa(self.dm, method='eigsh')
+        for number_of_dimensions in 0, 15:
+            with self.assertRaisesRegex(ValueError, 'between 1 and'):
+                pcoa(self.dm, number_of_dimensions=number_of_dimensions)
+
+    def test_number_of_dimensions(self):
+        data = np.loadtxt(get_data_path('PCoA_sample_data_2'))
+        full = pcoa(data)
+        for method in 'eigh', 'eigsh':
+            results = pcoa(data, method=method, number_of_dimensions=3)
+            npt.assert_allclose(results.eigvals, full.eigvals[:3])
+            # there are no negative eigenvalues, so both methods agree
+            npt.assert_allclose(results.proportion_explained,
+                                full.proportion_explained[:3])
+            npt.assert_allclose(np.abs(results.samples),
+                                np.abs(full.samples.iloc[:, :3]), atol=1e-7)
+            self.assertEqual(list(results.samples.columns),
+                             ['PC1', 'PC2', 'PC3'])
+
+        # the full decomposition is used for (nearly) all the dimensions
+        results = pcoa(data, method='eigsh', number_of_dimensions=6)
+        assert_ordination_results_equal(results, full,
+                                        ignore_directionality=True)
+
+    def test_proportion_explained_negative_eigenvalues(self):
+        full = npt.assert_warns(RuntimeWarning, pcoa, self.dm)
+        npt.assert_allclose(full.proportion_explained.sum(), 1)
+
+        # eigh divides by the sum of the positive eigenvalues, however many
+        # dimensions are returned
+        for number_of_dimensions in 3, 13:
+            results = npt.assert_warns(
+                RuntimeWarning, pcoa, self.dm,
+                number_of_dimensions=number_of_dimensions)
+            npt.assert_allclose(
+                results.proportion_explained,
+                full.proportion_explained[:number_of_dimensions])
+
+        # eigsh divides by the trace, which includes the negative eigenvalues
+        trace = np.trace(center_distance_matrix(self.dm.data))
+        results = pcoa(self.dm, method='eigsh', number_of_dimensions=3)
+        npt.assert_allclose(results.proportion_explained,
+                            full.eigvals[:3] / trace)
+        self.assertTrue((results.proportion_explained.values >
+                         full.proportion_explained.values[:3]).all())
+
+        # even when it falls back to the full decomposition
+        for number_of_dimensions in 13, 14:
+            results = npt.assert_warns(
+                RuntimeWarning, pcoa, self.dm, method='eigsh',
+                number_of_dimensions=number_of_dimensions)
+            npt.assert_allclose(
+                results.proportion_explained,
+                full.eigvals[:number_of_dimensions] / trace)
+
+    def test_condensed_and_inplace(self):
+        data = np.loadtxt(get_data_path('PCoA_sample_data_2'))
+        exp = pcoa(data)
+        condensed = DistanceMatrix(data).condensed_form()
+        assert_ordination_results_equal(pcoa(condensed), exp,
+                                        ignore_directionality=True)
+
+        dm = DistanceMatrix(data.copy())
+        obs = pcoa(dm, inplace=True)
+        assert_ordination_results_equal(obs, exp, ignore_directionality=True)
+        npt.assert_allclose(dm.data, center_distance_matrix(data))
+
+
+class TestPCoAProject(TestCase):
+    def setUp(self):
+        x = np.random.RandomState(0).rand(12, 3)
+        self.points = x[:9]
+        self.new_points = x[9:]
+        self.dm = DistanceMatrix(self._distances(self.points, self.points),
+                                 ids=['s%d' % i for i in range(9)])
+        self.distances = self._distances(self.new_points, self.points)
+
+    def _distances(self, x, y):
+        return np.sqrt(((x[:, np.newaxis] - y) ** 2).sum(axis=2))
+
+    def test_original_samples(self):
+        ordination = pcoa(self.dm)
+        for distance_matrix in None, self.dm:
+            obs = pcoa_project(ordination, self.dm.data, distance_matrix)
+            npt.assert_allclose(obs.values, ordination.samples.values,
+                                atol=1e-10)
+            self.assertEqual(list(obs.columns),
+                             list(ordination.samples.columns))
+
+    def test_new_samples(self):
+        ordination = pcoa(self.dm)
+        obs = pcoa_project(ordination, self.distances)
+        self.assertEqual(obs.shape, (3, 9))
+
+        # the distances are Euclidean, so the projected samples are at the
+        # same distances from the samples of the ordination
+        npt.assert_allclose(
+            self._distances(obs.values, ordination.samples.values),
+            self.distances)
+
+        single = pcoa_project(ordination, self.distances[0])
+        npt.assert_allclose(single.values, obs.values[:1])
+
+    def test_truncated_ordination(self):
+        ordination = pcoa(self.dm, method='eigsh', number_of_dimensions=2)
+        obs = pcoa_project(ordination, self.dm.data, self.dm)
+        npt.assert_allclose(obs.values, ordination.samples.values,
+                            atol=1e-10)
+
+        full = pcoa_project(pcoa(self.dm), self.distances)
+        obs = pcoa_project(ordination, self.distances, self.dm)
+        npt.assert_allclose(np.abs(obs.values), np.abs(full.values[:, :2]),
+                            atol=1e-10)
+
+        # the squared norms of the truncated coordinates would give wrong
+        # coordinates
+        with self.assertRaisesRegex(ValueError, '2 principal coordinates'):
+            pcoa_project(ordination, self.distances)
+
+    def test_non_euclidean(self):
+        dm = DistanceMatrix(
+            np.loadtxt(get_data_path('PCoA_sample_data_2')))
+        ordination = pcoa(dm)
+        obs = pcoa_project(ordination, dm.data, dm)
+        npt.assert_allclose(obs.values, ordination.samples.values,
+                            atol=1e-10)
+        # the last axis has a zero eigenvalue
+        npt.assert_array_equal(obs.values[:, -1], np.zeros(6))
+
+    def test_data_frame(self):
+        ordination = pcoa(self.dm)
+        exp = pcoa_project(ordination, self.distances)
+        df = pd.DataFrame(self.distances, index=['a', 'b', 'c'],
+                          columns=self.dm.ids).iloc[:, ::-1]
+        obs = pcoa_project(ordination, df)
+        self.assertEqual(list(obs.index), ['a', 'b', 'c'])
+        npt.assert_allclose(obs.values, exp.values)
+
+        with self.assertRaisesRegex(ValueError, 'missing'):
+            pcoa_project(ordination, df.iloc[:, 1:])
+
+    def test_invalid_shape(self):
+        ordination = pcoa(self.dm)
+        with self.assertRaisesRegex(ValueError, 'are required'):
+            pcoa_project(ordination, self.distances[:, 1:])
+
 
 if __name__ == "__main__":
     main()
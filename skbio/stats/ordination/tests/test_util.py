@@ -6,12 +6,17 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
+
 import numpy as np
 import numpy.testing as npt
 
-from unittest import TestCase, main
+from unittest import TestCase, main, mock
 
-from skbio.stats.ordination import corr, mean_and_std, e_matrix, f_matrix
+from skbio.stats.ordination import (corr, mean_and_std, e_matrix, f_matrix,
+                                    center_distance_matrix)
 
 
 class TestUtils(TestCase):
@@ -61,6 +66,66 @@ class TestUtils(TestCase):
         # Note that `test_make_F_matrix` in cogent is wrong
         npt.assert_almost_equal(F, expected_F)
 
+    def test_center_distance_matrix(self):
+        dm = np.array([[0, 3, 4, 5],
+                       [3, 0, 5, 4],
+                       [4, 5, 0, 3],
+                       [5, 4, 3, 0]])
+        exp = f_matrix(e_matrix(dm))
+        obs = center_distance_matrix(dm)
+        npt.assert_almost_equal(obs, exp)
+        self.assertEqual(obs.dtype, np.float64)
+        npt.assert_array_equal(dm[0], [0, 3, 4, 5])
+
+        dm = dm.astype(float)
+        obs = center_distance_matrix(dm, inplace=True)
+        self.assertIs(obs, dm)
+        npt.assert_almost_equal(dm, exp)
+
+    def test_center_distance_matrix_tiles(self):
+        x = np.random.RandomState(0).rand(11, 3)
+        dm = np.sqrt(((x[:, np.newaxis] - x) ** 2).sum(axis=2))
+        exp = f_matrix(e_matrix(dm))
+        with mock.patch('skbio.stats.ordination._utils._CENTER_BLOCK_SIZE',
+                        25):
+            npt.assert_allclose(center_distance_matrix(dm), exp, atol=1e-12)
+            out = np.empty_like(dm)
+            self.assertIs(center_distance_matrix(dm, out=out), out)
+            npt.assert_allclose(out, exp, atol=1e-12)
+            center_distance_matrix(dm, inplace=True)
+            npt.assert_allclose(dm, exp, atol=1e-12)
+
+    def test_center_distance_matrix_memmap(self):
+        dm = np.array([[0, 3, 4, 5],
+                       [3, 0, 5, 4],
+                       [4, 5, 0, 3],
+                       [5, 4, 3, 0]], dtype=float)
+        exp = f_matrix(e_matrix(dm))
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(tmp_dir, 'dm.dat')
+            data = np.memmap(path, dtype=float, mode='w+', shape=dm.shape)
+            data[:] = dm
+            out = np.memmap(os.path.join(tmp_dir, 'out.dat'), dtype=float,
+                            mode='w+', shape=dm.shape)
+            center_distance_matrix(data, out=out)
+            npt.assert_almost_equal(out, exp)
+            npt.assert_array_equal(data, dm)
+
+            center_distance_matrix(data, inplace=True)
+            data.flush()
+            del data, out
+            npt.assert_almost_equal(np.fromfile(path).reshape(dm.shape), exp)
+        finally:
+            shutil.rmtree(tmp_dir)
+
+    def test_center_distance_matrix_errors(self):
+        dm = np.zeros((3, 3))
+        with self.assertRaisesRegex(ValueError, 'inplace'):
+            center_distance_matrix(dm, inplace=True, out=np.zeros((3, 3)))
+        with self.assertRaisesRegex(ValueError, 'shape'):
+            center_distance_matrix(dm, out=np.zeros((3, 4)))
+
 
 if __name__ == '__main__':
     main()
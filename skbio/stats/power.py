@@ -149,10 +149,15 @@ import scipy.stats
 from skbio.util._decorator import experimental
 
 
+# Maximum number of random keys drawn at once to subsample many times for the
+# tests applied to all subsamples at once
+_POWER_BLOCK_SIZE = 2 ** 22
+
+
 @experimental(as_of="0.4.0")
 def subsample_power(test, samples, draw_mode='ind', alpha_pwr=0.05, ratio=None,
                     max_counts=50, counts_interval=10, min_counts=None,
-                    num_iter=500, num_runs=10):
+                    num_iter=500, num_runs=10, executor=None):
     r"""Subsamples data to iteratively calculate power
 
     Parameters
@@ -160,7 +165,9 @@ def subsample_power(test, samples, draw_mode='ind', alpha_pwr=0.05, ratio=None,
     test : function
         The statistical test which accepts a list of arrays of values
         (sample ids or numeric values) and returns a p value or one-dimensional
-        array of p values.
+        array of p values. It can also be ``scipy.stats.f_oneway`` or
+        ``scipy.stats.ttest_ind`` (for two groups), which are then applied to
+        many subsamples of numeric values at once.
     samples : array_like
         `samples` can be a list of lists or a list of arrays where each
         sublist or row in the array corresponds to a sampled group.
@@ -194,6 +201,10 @@ def subsample_power(test, samples, draw_mode='ind', alpha_pwr=0.05, ratio=None,
         on the curve.
     num_runs : positive int, optional
         The number of times to calculate each curve.
+    executor : concurrent.futures.Executor, optional
+        Executor (e.g., a ``concurrent.futures.ProcessPoolExecutor``) to
+        which the calculation of the power of each run at each count is
+        submitted. `test` must be picklable to use a process pool.
 
     Returns
     -------
@@ -222,6 +233,19 @@ def subsample_power(test, samples, draw_mode='ind', alpha_pwr=0.05, ratio=None,
     TypeError
         `test` does not return a float or a 1-dimensional numpy array.
 
+    Notes
+    -----
+    With an `executor`, each run at each count draws its subsamples from its
+    own ``np.random.RandomState``, seeded from NumPy's global random state.
+    The results are therefore reproducible with ``np.random.seed`` and do not
+    depend on the executor used, but they differ from the results obtained
+    without an executor.
+
+    When `test` is ``scipy.stats.f_oneway`` or ``scipy.stats.ttest_ind``,
+    the positions of all ``num_iter`` subsamples of a run are drawn at once
+    and the F statistics (a two-sided Student's t-test with equal variances
+    is equivalent to an F-test of two groups) of all subsamples are computed
+    with array operations, instead of calling the test once per subsample.
 
     Examples
     --------
@@ -361,16 +385,25 @@ def subsample_power(test, samples, draw_mode='ind', alpha_pwr=0.05, ratio=None,
     power = np.zeros((num_runs, len(sample_counts), num_p))
 
     # Calculates the power instances
-    for id2, c in enumerate(sample_counts):
-        count = np.round(c * ratio, 0).astype(int)
-        for id1 in range(num_runs):
-            ps = _compare_distributions(test=test,
-                                        samples=samples,
-                                        num_p=num_p,
-                                        counts=count,
-                                        num_iter=num_iter,
-                                        mode=draw_mode)
-            power[id1, id2, :] = _calculate_power(ps, alpha_pwr)
+    if executor is None:
+        for id2, c in enumerate(sample_counts):
+            count = np.round(c * ratio, 0).astype(int)
+            for id1 in range(num_runs):
+                ps = _compare_distributions(test=test,
+                                            samples=samples,
+                                            num_p=num_p,
+                                            counts=count,
+                                            num_iter=num_iter,
+                                            mode=draw_mode)
+                power[id1, id2, :] = _calculate_power(ps, alpha_pwr)
+    else:
+        seeds = _task_seeds(power.shape[:2])
+        tasks = [(test, samples, num_p, np.round(c * ratio, 0).astype(int),
+                  num_iter, draw_mode, alpha_pwr, seeds[id1, id2])
+                 for id1 in range(num_runs)
+                 for id2, c in enumerate(sample_counts)]
+        results = executor.map(_power_task, tasks)
+        power[:] = np.array(list(results)).reshape(power.shape)
 
     power = power.squeeze()
 
@@ -381,7 +414,7 @@ def subsample_power(test, samples, draw_mode='ind', alpha_pwr=0.05, ratio=None,
 def subsample_paired_power(test, meta, cat, control_cats, order=None,
                            strict_match=True, alpha_pwr=0.05,
                            max_counts=50, counts_interval=10, min_counts=None,
-                           num_iter=500, num_runs=10):
+                           num_iter=500, num_runs=10, executor=None):
     r"""Estimates power iteratively using samples with matching metadata
 
     Parameters
@@ -424,6 +457,12 @@ def subsample_paired_power(test, meta, cat, control_cats, order=None,
         The number of p-values to generate for each point on the curve.
     num_runs : positive int, optional
         The number of times to calculate each curve.
+    executor : concurrent.futures.Executor, optional
+        Executor (e.g., a ``concurrent.futures.ProcessPoolExecutor``) to
+        which the calculation of the power of each run at each count is
+        submitted. `test` must be picklable to use a process pool. As in
+        `subsample_power`, each run then draws its subsamples from its own
+        random state.
 
     Returns
     -------
@@ -550,13 +589,20 @@ def subsample_paired_power(test, meta, cat, control_cats, order=None,
     power = np.zeros((num_runs, len(sample_counts), num_p))
 
     # Calculates power instances
-    for id2, c in enumerate(sample_counts):
-        for id1 in range(num_runs):
-            ps = np.zeros((num_p, num_iter))
-            for id3 in range(num_iter):
-                subs = _draw_paired_samples(meta_pairs, index, c)
-                ps[:, id3] = test(subs)
-            power[id1, id2, :] = _calculate_power(ps, alpha_pwr)
+    if executor is None:
+        for id2, c in enumerate(sample_counts):
+            for id1 in range(num_runs):
+                ps = _compare_paired_samples(test, meta_pairs, index, c,
+                                             num_p, num_iter)
+                power[id1, id2, :] = _calculate_power(ps, alpha_pwr)
+    else:
+        seeds = _task_seeds(power.shape[:2])
+        tasks = [(test, meta_pairs, index, c, num_p, num_iter, alpha_pwr,
+                  seeds[id1, id2])
+                 for id1 in range(num_runs)
+                 for id2, c in enumerate(sample_counts)]
+        results = executor.map(_paired_power_task, tasks)
+        power[:] = np.array(list(results)).reshape(power.shape)
 
     power = power.squeeze()
 
@@ -762,7 +808,7 @@ def _calculate_power(p_values, alpha=0.05):
 
 
 def _compare_distributions(test, samples, num_p, counts=5, mode="ind",
-                           num_iter=100):
+                           num_iter=100, random_state=None):
     r"""Compares two distribution arrays iteratively
 
     Parameters
@@ -792,6 +838,9 @@ def _compare_distributions(test, samples, num_p, counts=5, mode="ind",
     num_iter : positive int, optional
         Default 1000. The number of p-values to generate for each point on the
         curve.
+    random_state : numpy.random.RandomState, optional
+        The random state from which subsamples are drawn. Defaults to NumPy's
+        global random state.
 
     Returns
     -------
@@ -811,6 +860,9 @@ def _compare_distributions(test, samples, num_p, counts=5, mode="ind",
 
     """
 
+    if random_state is None:
+        random_state = np.random
+
     # Prealocates the pvalue matrix
     p_values = np.zeros((num_p, num_iter))
 
@@ -821,13 +873,18 @@ def _compare_distributions(test, samples, num_p, counts=5, mode="ind",
     if isinstance(counts, int):
         counts = np.array([counts] * num_groups)
 
+    if _is_vectorized_test(test):
+        return _compare_distributions_at_once(test, samples, counts, mode,
+                                              num_iter, random_state)
+
     for idx in range(num_iter):
         if mode == "matched":
-            pos = np.random.choice(np.arange(0, samp_lens[0]), counts[0],
-                                   replace=False)
+            pos = random_state.choice(np.arange(0, samp_lens[0]), counts[0],
+                                      replace=False)
             subs = [sample[pos] for sample in samples]
         else:
-            subs = [np.random.choice(np.array(pop), counts[i], replace=False)
+            subs = [random_state.choice(np.array(pop), counts[i],
+                                        replace=False)
                     for i, pop in enumerate(samples)]
 
         p_values[:, idx] = test(subs)
@@ -838,6 +895,113 @@ def _compare_distributions(test, samples, num_p, counts=5, mode="ind",
     return p_values
 
 
+def _is_vectorized_test(test):
+    """Return whether `test` is applied to many subsamples at once"""
+    return test is scipy.stats.f_oneway or test is scipy.stats.ttest_ind
+
+
+def _compare_distributions_at_once(test, samples, counts, mode, num_iter,
+                                   random_state):
+    r"""Compares subsamples of distributions with a vectorized test
+
+    Parameters
+    ----------
+    test : {scipy.stats.f_oneway, scipy.stats.ttest_ind}
+        The statistical test. The two-sided p value of a Student's t-test
+        with equal variances is the p value of an F-test of two groups.
+    samples : list of arrays
+        A list where each 1-d array of numeric values represents a sample.
+    counts : 1-D array
+        The number of observations to draw from each sample.
+    mode : {"ind", "matched"}
+        Whether the same positions are drawn from all samples.
+    num_iter : positive int
+        The number of subsamples to test.
+    random_state : numpy.random.RandomState or module
+        The random state from which subsamples are drawn.
+
+    Returns
+    -------
+    p_values : 1-D array
+        The p-value of each subsample.
+
+    Raises
+    ------
+    ValueError
+        If `test` is ``scipy.stats.ttest_ind`` and there are not two samples.
+    ValueError
+        If more observations are drawn from a sample than it holds.
+
+    """
+    if test is scipy.stats.ttest_ind and len(samples) != 2:
+        raise ValueError("scipy.stats.ttest_ind compares exactly two "
+                         "samples, not %d." % len(samples))
+    samples = [np.asarray(sample, dtype=float) for sample in samples]
+    for count, sample in zip(counts, samples):
+        if count > len(sample):
+            raise ValueError("Cannot draw %d observations from a sample of "
+                             "%d." % (count, len(sample)))
+
+    p_values = np.empty(num_iter)
+    step = max(1, _POWER_BLOCK_SIZE // max(len(s) for s in samples))
+    for start in range(0, num_iter, step):
+        num_draws = min(step, num_iter - start)
+        if mode == "matched":
+            pos = _draw_positions(random_state, num_draws, len(samples[0]),
+                                  counts[0])
+            subs = [sample[pos] for sample in samples]
+        else:
+            subs = [sample[_draw_positions(random_state, num_draws,
+                                           len(sample), count)]
+                    for sample, count in zip(samples, counts)]
+        p_values[start:start + num_draws] = _f_test_rows(subs)
+
+    return p_values
+
+
+def _draw_positions(random_state, num_draws, size, count):
+    """Draws `num_draws` rows of `count` distinct positions below `size`"""
+    keys = random_state.random_sample((num_draws, size))
+    return np.argpartition(keys, count - 1, axis=1)[:, :count]
+
+
+def _f_test_rows(groups):
+    """Returns the one-way ANOVA p value of each row of 2-D groups"""
+    sizes = np.array([group.shape[1] for group in groups])
+    means = np.column_stack([group.mean(axis=1) for group in groups])
+    grand_mean = means.dot(sizes) / sizes.sum()
+    ss_between = ((means - grand_mean[:, np.newaxis]) ** 2).dot(sizes)
+    ss_within = sum(((group - means[:, [i]]) ** 2).sum(axis=1)
+                    for i, group in enumerate(groups))
+
+    df_between = len(groups) - 1
+    df_within = sizes.sum() - len(groups)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        f = (ss_between / df_between) / (ss_within / df_within)
+    return scipy.stats.f.sf(f, df_between, df_within)
+
+
+def _task_seeds(shape):
+    """Draws a seed for the random state of each task of a power analysis"""
+    return np.random.randint(np.iinfo(np.int32).max, size=shape)
+
+
+def _power_task(args):
+    """Calculates the power of one run at one count of `subsample_power`
+
+    Takes a single tuple of arguments, for ``Executor.map``.
+    """
+    test, samples, num_p, counts, num_iter, mode, alpha, seed = args
+    ps = _compare_distributions(test=test,
+                                samples=samples,
+                                num_p=num_p,
+                                counts=counts,
+                                num_iter=num_iter,
+                                mode=mode,
+                                random_state=np.random.RandomState(seed))
+    return _calculate_power(ps, alpha)
+
+
 def _check_subsample_power_inputs(test, samples, draw_mode='ind', ratio=None,
                                   max_counts=50, counts_interval=10,
                                   min_counts=None):
@@ -939,7 +1103,10 @@ def _check_subsample_power_inputs(test, samples, draw_mode='ind', ratio=None,
     largest = ratio_counts.min()
 
     # Determines the number of p values returned by the test
-    p_return = test(samples)
+    if _is_vectorized_test(test):
+        p_return = 1.0
+    else:
+        p_return = test(samples)
     if isinstance(p_return, float):
         num_p = 1
     elif isinstance(p_return, np.ndarray) and len(p_return.shape) == 1:
@@ -1040,7 +1207,7 @@ def _identify_sample_groups(meta, cat, control_cats, order, strict_match):
     return meta_pairs, index
 
 
-def _draw_paired_samples(meta_pairs, index, num_samps):
+def _draw_paired_samples(meta_pairs, index, num_samps, random_state=None):
     """Draws a random set of ids from a matched list
 
     Parameters
@@ -1055,20 +1222,25 @@ def _draw_paired_samples(meta_pairs, index, num_samps):
         The first array is an index array. The second gives an integer
         corresponding to the `control_cat`-group, and the third lists the
         position of the reference group sample in the list of samples.
+    random_state : numpy.random.RandomState, optional
+        The random state from which ids are drawn. Defaults to NumPy's global
+        random state.
 
     Returns
     -------
     ids : list
         A set of randomly selected ids groups from each group.
     """
+    if random_state is None:
+        random_state = np.random
 
     # Handles an empty paired vector
     if 'no' in meta_pairs:
         return [np.array([]) for o in meta_pairs['no']]
 
     # Identifies the absolute positions of the control group being drawn
-    set_pos = np.random.choice(index, int(num_samps),
-                               replace=False).astype(int)
+    set_pos = random_state.choice(index, int(num_samps),
+                                  replace=False).astype(int)
 
     subs = []
 
@@ -1087,7 +1259,7 @@ def _draw_paired_samples(meta_pairs, index, num_samps):
     # now set_list is ordered and we can iterate over it to get counter obj
     for set_ in set_list:
         num_ = counter[set_]
-        r2 = [np.random.choice(col, num_, replace=False) for col in
+        r2 = [random_state.choice(col, num_, replace=False) for col in
               meta_pairs[set_]]
         subs.append(r2)
 
@@ -1096,6 +1268,36 @@ def _draw_paired_samples(meta_pairs, index, num_samps):
     return ids
 
 
+def _compare_paired_samples(test, meta_pairs, index, num_samps, num_p,
+                            num_iter, random_state=None):
+    """Applies `test` to `num_iter` random sets of paired ids
+
+    Returns
+    -------
+    p_values : array
+        The `num_p` by `num_iter` p values of the tests.
+    """
+    p_values = np.zeros((num_p, num_iter))
+    for idx in range(num_iter):
+        subs = _draw_paired_samples(meta_pairs, index, num_samps,
+                                    random_state=random_state)
+        p_values[:, idx] = test(subs)
+    return p_values
+
+
+def _paired_power_task(args):
+    """Calculates the power of one run at one count of
+    `subsample_paired_power`
+
+    Takes a single tuple of arguments, for ``Executor.map``.
+    """
+    test, meta_pairs, index, num_samps, num_p, num_iter, alpha, seed = args
+    ps = _compare_paired_samples(test, meta_pairs, index, num_samps, num_p,
+                                 num_iter,
+                                 random_state=np.random.RandomState(seed))
+    return _calculate_power(ps, alpha)
+
+
 def _calculate_power_curve(test, samples, sample_counts, ratio=None,
                            mode='ind', num_iter=1000, alpha=0.05):
     r"""Generates an empirical power curve for the samples.
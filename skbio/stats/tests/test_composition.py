@@ -7,19 +7,24 @@
 # ----------------------------------------------------------------------------
 
 import functools
-from unittest import TestCase, main
+from unittest import TestCase, main, mock
 import numpy as np
 import numpy.testing as npt
 import pandas.util.testing as pdt
 from numpy.random import normal
 import pandas as pd
 import scipy
+import scipy.sparse
+from scipy.sparse import csr_matrix
 import copy
+from skbio import TreeNode
 from skbio.util import assert_data_frame_almost_equal
 from skbio.stats.composition import (closure, multiplicative_replacement,
                                      perturb, perturb_inv, power, inner,
                                      clr, clr_inv, ilr, ilr_inv,
-                                     centralize, _holm_bonferroni, ancom)
+                                     centralize, _holm_bonferroni, ancom,
+                                     _log_compare, BalanceBasis,
+                                     _gram_schmidt_basis)
 
 
 class CompositionTests(TestCase):
@@ -85,6 +90,50 @@ class CompositionTests(TestCase):
             closure([[0., 0., 0.],
                      [0., 5., 5.]])
 
+    def test_closure_sparse(self):
+        mat = csr_matrix(self.cdata3)
+        obs = closure(mat)
+        self.assertTrue(scipy.sparse.isspmatrix_csr(obs))
+        self.assertEqual(obs.nnz, mat.nnz)
+        npt.assert_allclose(obs.toarray(), closure(self.cdata3))
+        # the input is not modified
+        npt.assert_equal(mat.toarray(), self.cdata3)
+
+        with self.assertRaises(ValueError):
+            closure(csr_matrix([[1, 2, -1]]))
+        with self.assertRaises(ValueError):
+            closure(csr_matrix([[0, 0, 0], [0, 5, 5]]))
+        with self.assertRaises(ValueError):
+            closure(mat, out=np.empty((3, 5)))
+
+    def test_closure_out(self):
+        mat = np.array(self.cdata1, dtype=np.float64)
+        obs = closure(mat, out=mat)
+        self.assertIs(obs, mat)
+        npt.assert_allclose(mat, [[.2, .2, .6], [.4, .4, .2]])
+
+        out = np.empty(3)
+        self.assertIs(closure(self.cdata2, out=out), out)
+        npt.assert_allclose(out, [.2, .2, .6])
+
+        with self.assertRaises(ValueError):
+            closure(self.cdata1, out=np.empty(5))
+
+    def test_closure_float32(self):
+        obs = closure(np.array(self.cdata1, dtype=np.float32))
+        self.assertEqual(obs.dtype, np.float32)
+        npt.assert_allclose(obs, [[.2, .2, .6], [.4, .4, .2]], rtol=1e-6)
+
+    def test_transforms_chunks(self):
+        mat = np.exp(normal(size=(10, 4)))
+        exp = [closure(mat), clr(mat), ilr(mat),
+               multiplicative_replacement(mat)]
+        with mock.patch('skbio.stats.composition._CHUNK_SIZE', 9):
+            obs = [closure(mat), clr(mat), ilr(mat),
+                   multiplicative_replacement(mat)]
+        for o, e in zip(obs, exp):
+            npt.assert_allclose(o, e)
+
     def test_perturb(self):
         pmat = perturb(closure(self.cdata1),
                        closure(np.array([1, 1, 1])))
@@ -224,6 +273,32 @@ class CompositionTests(TestCase):
         with self.assertRaises(ValueError):
             multiplicative_replacement([0, 1, 2], delta=1)
 
+    def test_multiplicative_replacement_large_delta(self):
+        with self.assertRaises(ValueError):
+            multiplicative_replacement([0, 1, 2], delta=2)
+        with self.assertRaises(ValueError):
+            multiplicative_replacement([[1, 1, 1], [0, 0, 2]], delta=0.6)
+
+    def test_multiplicative_replacement_sparse(self):
+        exp = multiplicative_replacement(self.cdata3)
+        obs = multiplicative_replacement(csr_matrix(self.cdata3))
+        self.assertIsInstance(obs, np.ndarray)
+        npt.assert_allclose(obs, exp)
+
+    def test_multiplicative_replacement_out(self):
+        mat = closure(self.cdata3)
+        exp = multiplicative_replacement(mat)
+        obs = multiplicative_replacement(mat, out=mat)
+        self.assertIs(obs, mat)
+        npt.assert_allclose(mat, exp)
+
+    def test_multiplicative_replacement_float32(self):
+        mat = np.array(self.cdata3, dtype=np.float32)
+        obs = multiplicative_replacement(mat)
+        self.assertEqual(obs.dtype, np.float32)
+        npt.assert_allclose(obs, multiplicative_replacement(self.cdata3),
+                            rtol=1e-6)
+
     def test_clr(self):
         cmat = clr(closure(self.cdata1))
         A = np.array([.2, .2, .6])
@@ -287,6 +362,21 @@ class CompositionTests(TestCase):
                             np.array([[2, 2, 6],
                                       [4, 4, 2]]))
 
+    def test_clr_out(self):
+        mat = closure(self.cdata1)
+        exp = clr(mat)
+        obs = clr(mat, out=mat)
+        self.assertIs(obs, mat)
+        npt.assert_allclose(mat, exp)
+
+    def test_clr_sparse_and_float32(self):
+        exp = clr(self.cdata1)
+        npt.assert_allclose(clr(csr_matrix(self.cdata1)), exp)
+
+        obs = clr(np.array(self.cdata1, dtype=np.float32))
+        self.assertEqual(obs.dtype, np.float32)
+        npt.assert_allclose(obs, exp, rtol=1e-5)
+
     def test_ilr(self):
         mat = closure(self.cdata7)
         npt.assert_array_almost_equal(ilr(mat),
@@ -305,6 +395,18 @@ class CompositionTests(TestCase):
                             np.array([[2, 2, 6],
                                       [4, 4, 2]]))
 
+    def test_ilr_out_sparse_and_float32(self):
+        exp = ilr(self.cdata1)
+        out = np.empty((2, 2))
+        self.assertIs(ilr(self.cdata1, out=out), out)
+        npt.assert_allclose(out, exp)
+
+        npt.assert_allclose(ilr(csr_matrix(self.cdata1)), exp)
+
+        obs = ilr(np.array(self.cdata1, dtype=np.float32))
+        self.assertEqual(obs.dtype, np.float32)
+        npt.assert_allclose(obs, exp, rtol=1e-5, atol=1e-6)
+
     def test_ilr_basis(self):
         table = np.array([[1., 10.],
                           [1.14141414, 9.90909091],
@@ -394,6 +496,88 @@ class CompositionTests(TestCase):
             ilr_inv(table, basis=basis)
 
 
+class BalanceBasisTests(TestCase):
+    def setUp(self):
+        np.random.seed(0)
+        self.mat = closure(np.random.uniform(0.1, 1, size=(6, 5)))
+        self.tree = TreeNode.read(['((a,(b,c)),(d,e));'])
+
+    def test_gram_schmidt(self):
+        for n in 2, 3, 8:
+            npt.assert_allclose(BalanceBasis.gram_schmidt(n).to_array(),
+                                np.atleast_2d(clr_inv(_gram_schmidt_basis(n))))
+
+        basis = BalanceBasis.gram_schmidt(5)
+        self.assertEqual(len(basis), 4)
+        self.assertEqual(basis.n_parts, 5)
+        npt.assert_allclose(ilr(self.mat, basis=basis),
+                            ilr(self.mat, basis=basis.to_array()))
+        npt.assert_allclose(ilr(self.mat), ilr(self.mat, basis=basis))
+
+    def test_from_tree(self):
+        basis = BalanceBasis.from_tree(self.tree)
+        self.assertEqual(len(basis), 4)
+        npt.assert_array_equal(basis.order, np.arange(5))
+
+        # balances of the internal nodes, in preorder
+        r2, r6, r30 = np.sqrt(2), np.sqrt(6), np.sqrt(30)
+        exp = np.array([[r30 / 15] * 3 + [-r30 / 10] * 2,
+                        [r6 / 3, -r6 / 6, -r6 / 6, 0, 0],
+                        [0, r2 / 2, -r2 / 2, 0, 0],
+                        [0, 0, 0, r2 / 2, -r2 / 2]])
+        npt.assert_allclose(clr(basis.to_array()), exp, atol=1e-12)
+        npt.assert_allclose(ilr(self.mat, basis=basis),
+                            clr(self.mat).dot(exp.T))
+
+    def test_from_tree_ids(self):
+        ids = ['e', 'c', 'a', 'd', 'b']
+        basis = BalanceBasis.from_tree(self.tree, ids=ids)
+        exp = BalanceBasis.from_tree(self.tree).to_array()
+        npt.assert_allclose(basis.to_array(), exp[:, [4, 2, 0, 3, 1]])
+
+        obs = ilr(self.mat, basis=basis)
+        npt.assert_allclose(obs, ilr(self.mat, basis=basis.to_array()))
+        npt.assert_allclose(ilr_inv(obs, basis=basis), self.mat)
+        npt.assert_allclose(ilr_inv(obs, basis=basis.to_array()), self.mat)
+
+    def test_from_tree_errors(self):
+        with self.assertRaisesRegex(ValueError, 'bifurcating'):
+            BalanceBasis.from_tree(TreeNode.read(['(a,b,c);']))
+        with self.assertRaisesRegex(ValueError, 'unique'):
+            BalanceBasis.from_tree(TreeNode.read(['((a,b),(a,c));']))
+        with self.assertRaisesRegex(ValueError, 'exactly'):
+            BalanceBasis.from_tree(self.tree, ids=list('abcdf'))
+        with self.assertRaisesRegex(ValueError, 'exactly'):
+            BalanceBasis.from_tree(self.tree, ids=list('abcd'))
+
+    def test_init_errors(self):
+        with self.assertRaisesRegex(ValueError, 'same length'):
+            BalanceBasis([0, 0], [1, 2], [2])
+        with self.assertRaisesRegex(ValueError, 'non-empty'):
+            BalanceBasis([0, 0], [2, 1], [2, 3])
+        with self.assertRaisesRegex(ValueError, 'partition'):
+            BalanceBasis([0, 0], [1, 1], [2, 2])
+        with self.assertRaisesRegex(ValueError, 'partition'):
+            BalanceBasis([0, 0, 1], [2, 1, 2], [4, 2, 3])
+        with self.assertRaisesRegex(ValueError, 'permutation'):
+            BalanceBasis([0, 0], [2, 1], [3, 2], order=[0, 1, 1])
+
+    def test_ilr_dimension_errors(self):
+        basis = BalanceBasis.gram_schmidt(4)
+        with self.assertRaisesRegex(ValueError, '4 parts'):
+            ilr(self.mat, basis=basis)
+        with self.assertRaisesRegex(ValueError, '3 balances'):
+            ilr_inv(ilr(self.mat), basis=basis)
+
+    def test_transforms_in_chunks(self):
+        basis = BalanceBasis.from_tree(self.tree, ids=list('edcba'))
+        exp = ilr(self.mat, basis=basis)
+        with mock.patch('skbio.stats.composition._CHUNK_SIZE', 7):
+            obs = ilr(csr_matrix(self.mat), basis=basis)
+        npt.assert_allclose(obs, exp)
+        npt.assert_allclose(ilr_inv(obs, basis=basis), self.mat)
+
+
 class AncomTests(TestCase):
     def setUp(self):
         # Basic count data with 2 groupings
@@ -1063,6 +1247,51 @@ class AncomTests(TestCase):
         for a, b in zip(corrected_p, guessed_p):
             self.assertAlmostEqual(a, b)
 
+    def test_holm_bonferroni_ties_and_rows(self):
+        p = np.array([0.04, 0.01, 0.04, 0.5, 0.01])
+        npt.assert_almost_equal(_holm_bonferroni(p),
+                                [0.12, 0.05, 0.12, 0.5, 0.05])
+
+        mat = np.array([[0.005, 0.011, 0.02, 0.04, 0.13],
+                        [0.13, 0.04, 0.02, 0.011, 0.005],
+                        [0.9, 0.8, 0.7, 0.3, 0.6]])
+        obs = _holm_bonferroni(mat)
+        npt.assert_almost_equal(obs[0], [0.025, 0.044, 0.06, 0.08, 0.13])
+        npt.assert_almost_equal(obs[1], [0.13, 0.08, 0.06, 0.044, 0.025])
+        npt.assert_almost_equal(obs[2], [1, 1, 1, 1, 1])
+
+    def test_log_compare_fast_path(self):
+        # the vectorized one-way ANOVA matches calling the test for each pair
+        # of features
+        mat = self.table2.values
+        cats = self.cats2.values
+        for test in (scipy.stats.f_oneway, scipy.stats.ttest_ind):
+            exp = _log_compare(mat, cats, lambda *a: test(*a))
+            npt.assert_allclose(_log_compare(mat, cats, test), exp)
+
+        mat = self.table4.values
+        cats = self.cats4.values
+        exp = _log_compare(mat, cats, lambda *a: scipy.stats.f_oneway(*a))
+        npt.assert_allclose(_log_compare(mat, cats, scipy.stats.f_oneway),
+                            exp)
+
+    def test_log_compare_fast_path_blocks(self):
+        mat = np.exp(normal(size=(12, 9)))
+        cats = np.array([0, 1, 2] * 4)
+        exp = _log_compare(mat, cats, scipy.stats.f_oneway)
+        with mock.patch('skbio.stats.composition._LOG_RATIO_BLOCK_SIZE', 30):
+            obs = _log_compare(mat, cats, scipy.stats.f_oneway)
+        npt.assert_allclose(obs, exp)
+        npt.assert_equal(np.tril(obs), 0)
+
+    def test_log_compare_fast_path_proportional_features(self):
+        mat = np.exp(normal(size=(8, 3)))
+        mat[:, 2] = mat[:, 0] * 3
+        cats = np.array([0, 1] * 4)
+        obs = _log_compare(mat, cats, scipy.stats.f_oneway)
+        self.assertTrue(np.isnan(obs[0, 2]))
+        self.assertFalse(np.isnan(obs[0, 1]))
+
 
 if __name__ == "__main__":
     main()
@@ -6,12 +6,13 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase, main
 
 import numpy as np
 import numpy.testing as npt
 import pandas as pd
-from scipy.stats import kruskal
+from scipy.stats import kruskal, f_oneway, ttest_ind
 
 from skbio.stats.power import (subsample_power,
                                subsample_paired_power,
@@ -24,6 +25,7 @@ from skbio.stats.power import (subsample_power,
                                _identify_sample_groups,
                                _draw_paired_samples,
                                _get_min_size,
+                               _f_test_rows,
                                paired_subsamples
                                )
 
@@ -148,6 +150,45 @@ class PowerAnalysisTest(TestCase):
         self.assertEqual(test_p.shape, (5, 4, 2))
         npt.assert_array_equal(np.array([10, 20, 30, 40]), test_c)
 
+    def test_subsample_power_executor(self):
+        # the results depend on the seed, but not on the executor
+        np.random.seed(3)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            exp, exp_c = subsample_power(self.f, self.pop, num_iter=10,
+                                         num_runs=5, executor=pool)
+        np.random.seed(3)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            obs, obs_c = subsample_power(self.f, self.pop, num_iter=10,
+                                         num_runs=5, executor=pool)
+        self.assertEqual(obs.shape, (5, 4))
+        npt.assert_array_equal(obs, exp)
+        npt.assert_array_equal(obs_c, np.array([10, 20, 30, 40]))
+
+    def test_subsample_power_executor_multi_p(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            test_p, test_c = subsample_power(lambda x: np.array([0.5, 0.01]),
+                                             samples=self.pop,
+                                             num_iter=10,
+                                             num_runs=3,
+                                             executor=pool)
+        npt.assert_array_equal(test_p[..., 0], np.zeros((3, 4)))
+        npt.assert_array_equal(test_p[..., 1], np.ones((3, 4)))
+
+    def test_subsample_power_vectorized_tests(self):
+        for test in f_oneway, ttest_ind:
+            np.random.seed(5)
+            test_p, test_c = subsample_power(test, self.pop, num_iter=100,
+                                             num_runs=3)
+            np.random.seed(5)
+            exp, _ = subsample_power(lambda x: ttest_ind(*x)[1], self.pop,
+                                     num_iter=100, num_runs=3)
+            self.assertEqual(test_p.shape, (3, 4))
+            npt.assert_allclose(test_p.mean(axis=0), exp.mean(axis=0),
+                                atol=0.15)
+
+        with self.assertRaisesRegex(ValueError, 'exactly two'):
+            subsample_power(ttest_ind, self.pop + self.pop, num_iter=10)
+
     def test_subsample_paired_power(self):
         known_c = np.array([1, 2, 3, 4])
         # Sets up the handling values
@@ -181,6 +222,21 @@ class PowerAnalysisTest(TestCase):
                                                 num_runs=2)
         self.assertEqual(test_p.shape, (2, 4, 3))
 
+    def test_subsample_paired_power_executor(self):
+        kwargs = dict(meta=self.meta, cat='INT', control_cats=['SEX'],
+                      counts_interval=1, num_iter=10, num_runs=2)
+        np.random.seed(7)
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            exp, exp_c = subsample_paired_power(self.meta_f, executor=pool,
+                                                **kwargs)
+        np.random.seed(7)
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            obs, obs_c = subsample_paired_power(self.meta_f, executor=pool,
+                                                **kwargs)
+        self.assertEqual(obs.shape, (2, 4))
+        npt.assert_array_equal(obs, exp)
+        npt.assert_array_equal(obs_c, exp_c)
+
     def test_check_nans_str(self):
         self.assertTrue(_check_nans('string'))
 
@@ -293,6 +349,36 @@ class PowerAnalysisTest(TestCase):
         npt.assert_allclose(known_std, test.std(), rtol=0.1, atol=0.02)
         self.assertEqual(known_shape, test.shape)
 
+    def test__compare_distributions_vectorized(self):
+        test = _compare_distributions(f_oneway, self.samps, 1, num_iter=50)
+        npt.assert_array_equal(test, np.zeros(50))
+
+        test = _compare_distributions(ttest_ind, self.pop, 1, counts=10,
+                                      mode='matched', num_iter=30,
+                                      random_state=np.random.RandomState(0))
+        self.assertEqual(test.shape, (30,))
+        self.assertTrue(((test >= 0) & (test <= 1)).all())
+
+        with self.assertRaises(ValueError):
+            _compare_distributions(f_oneway, [self.pop[0][:5], self.pop[1]],
+                                   1, counts=25)
+
+    def test__compare_distributions_random_state(self):
+        exp = _compare_distributions(self.f, self.pop, 1, num_iter=10,
+                                     random_state=np.random.RandomState(2))
+        obs = _compare_distributions(self.f, self.pop, 1, num_iter=10,
+                                     random_state=np.random.RandomState(2))
+        npt.assert_array_equal(obs, exp)
+
+    def test__f_test_rows(self):
+        rs = np.random.RandomState(0)
+        groups = [rs.randn(20, 4), rs.randn(20, 6) + 1, rs.randn(20, 5)]
+        exp = [f_oneway(*[g[i] for g in groups])[1] for i in range(20)]
+        npt.assert_allclose(_f_test_rows(groups), exp)
+
+        exp = [ttest_ind(groups[0][i], groups[1][i])[1] for i in range(20)]
+        npt.assert_allclose(_f_test_rows(groups[:2]), exp)
+
     def test__compare_distributions_draw_mode(self):
         draw_mode = 'Ultron'
         with self.assertRaises(ValueError):
@@ -6,13 +6,20 @@
 # The full license is in the file COPYING.txt, distributed with this software.
 # ----------------------------------------------------------------------------
 
+import os
+import shutil
+import tempfile
 import unittest
 import warnings
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 import numpy.testing as npt
+from scipy.sparse import csr_matrix, csc_matrix
 
-from skbio.stats import subsample_counts, isubsample
+from skbio.stats import (subsample_counts, subsample_table, rarefaction_curves,
+                         isubsample, isubsample_keys)
 
 
 def setup():
@@ -59,6 +66,37 @@ class SubsampleCountsTests(unittest.TestCase):
         self.assertTrue(np.array_equal(obs, np.array([1, 0, 1])) or
                         np.array_equal(obs, np.array([2, 0, 0])))
 
+    def test_subsample_counts_without_replacement_complement(self):
+        # When most items are kept, the removed items are drawn instead.
+        a = np.array([2, 0, 1, 3])
+        actual = set()
+        for i in range(1000):
+            obs = subsample_counts(a, 5)
+            self.assertEqual(obs.sum(), 5)
+            self.assertTrue((obs <= a).all())
+            actual.add(tuple(obs))
+        self.assertEqual(actual, {(1, 0, 1, 3), (2, 0, 0, 3), (2, 0, 1, 2)})
+
+    def test_subsample_counts_without_replacement_large_counts(self):
+        # The counts are never unpacked into one element per item, so the
+        # memory used does not depend on the number of items.
+        a = np.array([2 ** 40, 0, 3, 2 ** 40])
+        obs = subsample_counts(a, 1000)
+        self.assertEqual(obs.sum(), 1000)
+        self.assertEqual(obs[1], 0)
+        self.assertTrue(obs[0] > 0 and obs[3] > 0)
+
+        obs = subsample_counts(a, a.sum() - 2)
+        self.assertEqual(obs.sum(), a.sum() - 2)
+        self.assertTrue((obs <= a).all())
+
+    def test_subsample_counts_without_replacement_reproducible(self):
+        a = np.arange(50)
+        np.random.seed(42)
+        exp = subsample_counts(a, 100)
+        np.random.seed(42)
+        npt.assert_equal(subsample_counts(a, 100), exp)
+
     def test_subsample_counts_with_replacement(self):
         # Can choose from all in first bin, all in last bin (since we're
         # sampling with replacement), or split across bins.
@@ -113,6 +151,197 @@ class SubsampleCountsTests(unittest.TestCase):
         subsample_counts([0, 5, 0], 6, replace=True)
 
 
+class SubsampleTableTests(unittest.TestCase):
+    def setUp(self):
+        self.table = np.array([[4, 5, 0, 2, 1],
+                               [0, 3, 0, 1, 0],
+                               [1, 1, 1, 1, 6],
+                               [0, 0, 0, 0, 4]])
+
+    def test_subsample_table(self):
+        obs = subsample_table(self.table, 4, seed=0)
+        self.assertEqual(obs.shape, self.table.shape)
+        npt.assert_equal(obs.sum(axis=1), [4, 4, 4, 4])
+        self.assertTrue((obs <= self.table).all())
+        # rows with exactly n items are kept
+        npt.assert_equal(obs[1], self.table[1])
+        npt.assert_equal(obs[3], self.table[3])
+
+    def test_subsample_table_rows_like_subsample_counts(self):
+        # Each row can yield every possible subsample, like subsample_counts.
+        table = np.array([[2, 0, 1], [1, 1, 1]])
+        actual = [set(), set()]
+        for seed in range(200):
+            obs = subsample_table(table, 2, seed=seed)
+            for row, subsamples in zip(obs, actual):
+                subsamples.add(tuple(row))
+        self.assertEqual(actual[0], {(1, 0, 1), (2, 0, 0)})
+        self.assertEqual(actual[1], {(1, 1, 0), (1, 0, 1), (0, 1, 1)})
+
+    def test_subsample_table_with_replacement(self):
+        table = np.array([[2, 0, 1], [0, 5, 0]])
+        actual = set()
+        for seed in range(200):
+            obs = subsample_table(table, 2, replace=True, seed=seed)
+            npt.assert_equal(obs[1], [0, 2, 0])
+            actual.add(tuple(obs[0]))
+        self.assertEqual(actual, {(1, 0, 1), (2, 0, 0), (0, 0, 2)})
+
+        obs = subsample_table(table, 7, replace=True, seed=0)
+        npt.assert_equal(obs.sum(axis=1), [7, 7])
+
+    def test_subsample_table_seed(self):
+        npt.assert_equal(subsample_table(self.table, 3, seed=7),
+                         subsample_table(self.table, 3, seed=7))
+
+        np.random.seed(42)
+        exp = subsample_table(self.table, 3)
+        np.random.seed(42)
+        npt.assert_equal(subsample_table(self.table, 3), exp)
+
+        # the rows of a table do not depend on the other rows
+        npt.assert_equal(subsample_table(self.table, 3, seed=7)[:2],
+                         subsample_table(self.table[:2], 3, seed=7))
+
+    def test_subsample_table_sparse(self):
+        exp = subsample_table(self.table, 4, seed=3)
+        obs = subsample_table(csr_matrix(self.table), 4, seed=3)
+        self.assertIsInstance(obs, csr_matrix)
+        npt.assert_equal(obs.toarray(), exp)
+        self.assertTrue((obs.data > 0).all())
+
+        obs = subsample_table(csr_matrix(self.table).tocoo(), 4, seed=3)
+        npt.assert_equal(obs.toarray(), exp)
+
+    def test_subsample_table_sparse_duplicates(self):
+        dense = np.array([[0, 5, 0, 2, 0],
+                          [1, 0, 0, 0, 3],
+                          [0, 0, 1, 0, 0]])
+        # cell (0, 1) is stored as two entries, 2 and 3
+        csr = csr_matrix((np.array([2, 3, 2, 1, 3, 1]),
+                          np.array([1, 1, 3, 0, 4, 2]),
+                          np.array([0, 3, 5, 6])), shape=(3, 5))
+        csc = csc_matrix((np.array([1, 2, 3, 1, 2, 3]),
+                          np.array([1, 0, 0, 2, 0, 1]),
+                          np.array([0, 1, 3, 4, 5, 6])), shape=(3, 5))
+        npt.assert_equal(csr.toarray(), dense)
+        npt.assert_equal(csc.toarray(), dense)
+
+        exp = subsample_table(dense, 1, seed=4)
+        for table in (csr, csc):
+            obs = subsample_table(table, 1, seed=4)
+            self.assertIsInstance(obs, csr_matrix)
+            npt.assert_equal(obs.toarray(), exp)
+
+            # the input table is not modified
+            self.assertEqual(table.nnz, 6)
+            self.assertFalse(table.has_canonical_format)
+
+    def test_subsample_table_executor(self):
+        table = np.random.randint(0, 20, size=(50, 30))
+        exp = subsample_table(table, 100, seed=11)
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            for chunk_size in (None, 1, 7, 100):
+                obs = subsample_table(table, 100, seed=11, executor=executor,
+                                      chunk_size=chunk_size)
+                npt.assert_equal(obs, exp)
+                obs = subsample_table(csr_matrix(table), 100, seed=11,
+                                      executor=executor,
+                                      chunk_size=chunk_size)
+                npt.assert_equal(obs.toarray(), exp)
+
+    def test_subsample_table_empty(self):
+        obs = subsample_table(np.zeros((0, 3), dtype=int), 5)
+        self.assertEqual(obs.shape, (0, 3))
+        obs = subsample_table(np.zeros((2, 0), dtype=int), 0)
+        self.assertEqual(obs.shape, (2, 0))
+
+    def test_subsample_table_invalid_input(self):
+        with self.assertRaisesRegex(ValueError, 'negative'):
+            subsample_table(self.table, -1)
+
+        with self.assertRaises(TypeError):
+            subsample_table([[1, 2.3, 3]], 2)
+
+        with self.assertRaisesRegex(ValueError, '2-D'):
+            subsample_table([1, 2, 3], 2)
+
+        with self.assertRaisesRegex(ValueError, '2 row'):
+            subsample_table(self.table, 5)
+
+        with self.assertRaisesRegex(ValueError, 'empty'):
+            subsample_table([[0, 0], [1, 1]], 1, replace=True)
+
+
+class RarefactionCurvesTests(unittest.TestCase):
+    def setUp(self):
+        self.table = np.array([[10, 0, 0, 0],
+                               [5, 5, 5, 5],
+                               [0, 1, 2, 3]])
+
+    def observed(self, counts):
+        return (counts > 0).sum()
+
+    def test_rarefaction_curves(self):
+        obs = rarefaction_curves(self.table, [0, 1, 6, 20], self.observed,
+                                 seed=1)
+        self.assertEqual(obs.shape, (3, 4))
+        npt.assert_equal(obs[0], [0, 1, 1, np.nan])
+        npt.assert_equal(obs[1, [0, 1, 3]], [0, 1, 4])
+        npt.assert_equal(obs[2, :3], [0, 1, 3])
+        npt.assert_equal(obs[2, 3], np.nan)
+
+    def test_rarefaction_curves_nested(self):
+        # the subsample at each depth is a subsample of the next one
+        subsamples = []
+
+        def metric(counts):
+            subsamples.append(counts)
+            return 0
+
+        rarefaction_curves(self.table[1:2], [3, 1, 15, 7], metric, seed=5)
+        self.assertEqual([s.sum() for s in subsamples], [1, 3, 7, 15])
+        for smaller, larger in zip(subsamples, subsamples[1:]):
+            self.assertTrue((smaller <= larger).all())
+
+    def test_rarefaction_curves_depth_order(self):
+        exp = rarefaction_curves(self.table, [1, 6, 8], self.observed, seed=2)
+        obs = rarefaction_curves(self.table, [8, 1, 6], self.observed, seed=2)
+        npt.assert_equal(obs, exp[:, [2, 0, 1]])
+
+    def test_rarefaction_curves_sparse_and_kwargs(self):
+        def metric(counts, scale):
+            return scale * len(counts)
+
+        obs = rarefaction_curves(csr_matrix(self.table), [2, 12], metric,
+                                 seed=0, scale=2)
+        npt.assert_equal(obs, [[8, np.nan], [8, 8], [8, np.nan]])
+
+        exp = rarefaction_curves(self.table, [2, 5], self.observed, seed=3)
+        obs = rarefaction_curves(csr_matrix(self.table), [2, 5],
+                                 self.observed, seed=3)
+        npt.assert_equal(obs, exp)
+
+    def test_rarefaction_curves_sparse_duplicates(self):
+        # cells (0, 0) and (2, 3) are each stored as two entries
+        table = csc_matrix((np.array([4, 6, 5, 5, 1, 5, 2, 5, 1, 2]),
+                            np.array([0, 0, 1, 1, 2, 1, 2, 1, 2, 2]),
+                            np.array([0, 3, 5, 7, 10])), shape=(3, 4))
+        npt.assert_equal(table.toarray(), self.table)
+
+        exp = rarefaction_curves(self.table, [1, 6], self.observed, seed=9)
+        obs = rarefaction_curves(table, [1, 6], self.observed, seed=9)
+        npt.assert_equal(obs, exp)
+        self.assertEqual(table.nnz, 10)
+
+    def test_rarefaction_curves_invalid_input(self):
+        with self.assertRaisesRegex(ValueError, 'negative'):
+            rarefaction_curves(self.table, [-1, 2], self.observed)
+
+        with self.assertRaises(TypeError):
+            rarefaction_curves([[1, 2.3, 3]], [2], self.observed)
+
+
 class ISubsampleTests(unittest.TestCase):
     def setUp(self):
         np.random.seed(123)
@@ -219,6 +448,77 @@ class ISubsampleTests(unittest.TestCase):
         self.assertEqual(list(obs), exp)
 
 
+class ISubsampleKeysTests(unittest.TestCase):
+    def setUp(self):
+        np.random.seed(123)
+        self.items = [('a', 10), ('b', 20), ('a', 30), ('c', 40), ('a', 50),
+                      ('b', 60), ('a', 70)]
+        self.spill_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.spill_dir)
+
+    def bin_f(self, item):
+        return item[0]
+
+    def test_isubsample_keys_all_items(self):
+        obs = dict(isubsample_keys(self.items, 10, bin_f=self.bin_f))
+        self.assertEqual(sorted(obs), ['a', 'b', 'c'])
+        npt.assert_equal(obs['a'], [0, 2, 4, 6])
+        npt.assert_equal(obs['b'], [1, 5])
+        npt.assert_equal(obs['c'], [3])
+
+    def test_isubsample_keys_key_f(self):
+        obs = dict(isubsample_keys(self.items, 10, bin_f=self.bin_f,
+                                   key_f=lambda item: item[1]))
+        npt.assert_equal(obs['a'], [10, 30, 50, 70])
+
+    def test_isubsample_keys_maximum_minimum(self):
+        obs = dict(isubsample_keys(self.items, 2, 2, bin_f=self.bin_f,
+                                   chunk_size=2))
+        self.assertEqual(sorted(obs), ['a', 'b'])
+        self.assertEqual(len(obs['a']), 2)
+        self.assertTrue(set(obs['a']) <= {0, 2, 4, 6})
+        npt.assert_equal(obs['b'], [1, 5])
+
+    def test_isubsample_keys_uniform(self):
+        # every item of a bin is retained with the same probability
+        counts = np.zeros(20)
+        for i in range(2000):
+            for _, keys in isubsample_keys(range(20), 5, chunk_size=3):
+                counts[keys] += 1
+        npt.assert_allclose(counts / 2000, 0.25, atol=0.05)
+
+    def test_isubsample_keys_spill_dir(self):
+        items = [(i % 7, i) for i in range(1000)]
+        np.random.seed(0)
+        exp = dict(isubsample_keys(items, 5, bin_f=self.bin_f,
+                                   chunk_size=50))
+        np.random.seed(0)
+        obs = isubsample_keys(items, 5, bin_f=self.bin_f, chunk_size=50,
+                              spill_dir=self.spill_dir, n_partitions=3)
+        # the reservoirs are stored in the spill directory while sampling
+        bin_, keys = next(obs)
+        self.assertEqual(len(os.listdir(self.spill_dir)), 3)
+        obs = dict(obs)
+        obs[bin_] = keys
+
+        self.assertEqual(sorted(obs), sorted(exp))
+        for bin_ in exp:
+            npt.assert_equal(obs[bin_], exp[bin_])
+            self.assertTrue((obs[bin_] % 7 == bin_).all())
+        self.assertEqual(os.listdir(self.spill_dir), [])
+
+    def test_isubsample_keys_empty(self):
+        self.assertEqual(list(isubsample_keys([], 2)), [])
+
+    def test_isubsample_keys_invalid_input(self):
+        with self.assertRaises(ValueError):
+            next(isubsample_keys([1, 2, 3], maximum=2, minimum=10))
+        with self.assertRaises(ValueError):
+            next(isubsample_keys([1, 2, 3], maximum=0, minimum=-10))
+
+
 if __name__ == '__main__':
     import nose
     nose.runmodule()
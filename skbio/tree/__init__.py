@@ -33,6 +33,7 @@ Utility Functions
    :toctree: generated/
 
     majority_rule
+    rf_dists
 
 Exceptions
 ----------
@@ -186,10 +187,12 @@ from skbio.util import TestRunner
 from ._tree import TreeNode
 from ._nj import nj
 from ._majority_rule import majority_rule
+from ._compare import rf_dists
 from ._exception import (TreeError, NoLengthError, DuplicateNodeError,
                          MissingNodeError, NoParentError)
 
-__all__ = ['TreeNode', 'nj', 'majority_rule', 'TreeError', 'NoLengthError',
-           'DuplicateNodeError', 'MissingNodeError', 'NoParentError']
+__all__ = ['TreeNode', 'nj', 'majority_rule', 'rf_dists', 'TreeError',
+           'NoLengthError', 'DuplicateNodeError', 'MissingNodeError',
+           'NoParentError']
 
 test = TestRunner(__file__).test
@@ -0,0 +1,132 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+from scipy.sparse import coo_matrix
+
+from skbio.stats.distance import DistanceMatrix
+from skbio.util._decorator import experimental
+from ._util import _tip_name_index, _n_words, _clade_bitsets, _popcount
+
+
+def _subset_bitsets(tree, tip_index, n_words):
+    """Encode the subsets of a tree as hashable bitsets
+
+    Parameters
+    ----------
+    tree : TreeNode
+        The tree to encode
+    tip_index : dict
+        Keyed by tip name and valued by the bit representing the tip
+    n_words : int
+        The number of 64-bit words of each bitset
+
+    Returns
+    -------
+    set of bytes
+        The buffers of the bitsets of the same clades that are returned by
+        ``TreeNode.subsets``
+
+    Raises
+    ------
+    ValueError
+        If the tips of `tree` are not exactly the tips in `tip_index`.
+
+    """
+    try:
+        _, bits = _clade_bitsets(tree, tip_index, n_words)
+    except KeyError as e:
+        raise ValueError("Tip %r is not present in all trees." % e.args[0])
+
+    sizes = _popcount(bits)
+    if sizes[-1] != len(tip_index):
+        raise ValueError("All trees must have the same set of tips.")
+
+    # the last row is the root, which is not part of the subsets
+    return {clade.tobytes() for clade in bits[:-1][sizes[:-1] > 1]}
+
+
+@experimental(as_of="0.5.3")
+def rf_dists(trees, ids=None, proportion=False):
+    """Compute the Robinson-Foulds distances between all pairs of trees
+
+    Parameters
+    ----------
+    trees : list of TreeNode
+        The trees to compare. All trees must have the same set of tip names.
+    ids : list of str, optional
+        The IDs of the trees in the resulting distance matrix. If not
+        provided, the trees are identified by their index in `trees`.
+    proportion : bool, optional
+        Return proportional differences, as ``TreeNode.compare_rfd`` does.
+
+    Returns
+    -------
+    DistanceMatrix
+        The Robinson-Foulds distance between each pair of trees. Each distance
+        is equal to ``trees[i].compare_rfd(trees[j], proportion)``.
+
+    Raises
+    ------
+    ValueError
+        If the trees do not all have the same set of tips.
+
+    See Also
+    --------
+    TreeNode.compare_rfd
+    TreeNode.subsets
+
+    Notes
+    -----
+    The subsets of each tree are computed only once, with the clades encoded
+    as fixed-width bitsets over the shared tips. Each distinct clade is then
+    assigned a column of a sparse tree-by-clade incidence matrix, so that the
+    number of clades shared by every pair of trees is obtained with a single
+    sparse matrix product rather than by comparing the trees pair by pair.
+
+    Examples
+    --------
+    >>> from skbio import TreeNode
+    >>> from skbio.tree import rf_dists
+    >>> trees = [TreeNode.read(["((a,b),(c,d));"]),
+    ...          TreeNode.read(["(((a,b),c),d);"]),
+    ...          TreeNode.read(["(((a,c),b),d);"])]
+    >>> dm = rf_dists(trees, ids=['t1', 't2', 't3'])
+    >>> print(dm['t1', 't2'])
+    2.0
+    >>> print(dm['t1', 't3'])
+    4.0
+    >>> print(dm['t2', 't3'])
+    2.0
+
+    """
+    trees = list(trees)
+    tip_index = _tip_name_index(trees[:1])
+    n_words = _n_words(len(tip_index))
+
+    clade_ids = {}
+    rows = []
+    cols = []
+    for i, tree in enumerate(trees):
+        for clade in _subset_bitsets(tree, tip_index, n_words):
+            rows.append(i)
+            cols.append(clade_ids.setdefault(clade, len(clade_ids)))
+
+    incidence = coo_matrix((np.ones(len(rows)), (rows, cols)),
+                           shape=(len(trees), len(clade_ids))).tocsr()
+    shared = incidence.dot(incidence.T).toarray()
+    n_subsets = np.diag(shared)
+
+    total = n_subsets[:, np.newaxis] + n_subsets
+    dists = total - 2 * shared
+
+    if proportion:
+        dists = np.divide(dists, total, out=np.zeros_like(dists),
+                          where=total > 0)
+
+    return DistanceMatrix(dists, ids)
@@ -12,6 +12,8 @@ import numpy as np
 
 from skbio.tree import TreeNode
 from skbio.util._decorator import experimental
+from ._util import (_tip_name_index, _n_words, _clade_bitsets, _popcount,
+                    _bitset_to_names)
 
 
 def _walk_clades(trees, weights):
@@ -67,6 +69,74 @@ def _walk_clades(trees, weights):
     return clade_counts, edge_lengths
 
 
+def _walk_clades_bitset(trees, weights):
+    """Walk all the clades of all the trees using bitset encoded clades
+
+    Parameters
+    ----------
+    trees : list of TreeNode
+        The trees to walk
+    weights : np.array
+        Tree weights
+
+    Returns
+    -------
+    list of tuple
+        The clades and support values sorted by clade size such that the
+        largest clade is index 0. The tuples are of the form:
+        (bytes, float), where the bytes are the buffer of the clade bitset.
+    defaultdict(float)
+        The edge lengths, keyed by the bytes of the clade bitset, and valued by
+        the weighted average length of the clade by the trees the clade was
+        observed in.
+    dict
+        The number of tips in each clade, keyed by the bytes of the clade
+        bitset.
+    list
+        The tip names in bit order.
+
+    Notes
+    -----
+    This walks the trees in the same order as ``_walk_clades``, but clades are
+    represented as fixed-width arrays of ``np.uint64`` with one bit per tip
+    rather than as frozensets of tip names.
+
+    """
+    clade_counts = defaultdict(float)
+    edge_lengths = defaultdict(float)
+    clade_sizes = {}
+    total = weights.sum()
+
+    tip_index = _tip_name_index(trees)
+    n_words = _n_words(len(tip_index))
+
+    for tree, weight in zip(trees, weights):
+        nodes, bits = _clade_bitsets(tree, tip_index, n_words)
+        sizes = _popcount(bits)
+
+        for node, clade_bits, size in zip(nodes, bits, sizes):
+            clade = clade_bits.tobytes()
+            clade_sizes[clade] = size
+
+            # if node.length is not None, fetch it and weight it
+            length = node.length * weight if node.length is not None else None
+
+            clade_counts[clade] += weight
+
+            if length is None:
+                edge_lengths[clade] = None
+            else:
+                edge_lengths[clade] += length / total
+
+    # sort clades by number of tips
+    clade_counts = sorted(clade_counts.items(),
+                          key=lambda x: clade_sizes[x[0]], reverse=True)
+
+    tip_names = sorted(tip_index, key=tip_index.get)
+
+    return clade_counts, edge_lengths, clade_sizes, tip_names
+
+
 def _filter_clades(clade_counts, cutoff_threshold):
     """Filter clades that not well supported or are contradicted
 
@@ -113,6 +183,65 @@ def _filter_clades(clade_counts, cutoff_threshold):
     return accepted_clades
 
 
+def _filter_clades_bitset(clade_counts, clade_sizes, cutoff_threshold):
+    """Filter bitset encoded clades that not well supported or are contradicted
+
+    Parameters
+    ----------
+    clade_counts : list of tuple
+        Where the first element in each tuple is the bytes of the clade
+        bitset, and the second element is the support value. It is expected
+        that this list is sorted in the same manner as for ``_filter_clades``.
+    clade_sizes : dict
+        The number of tips in each clade, keyed by the bytes of the clade
+        bitset.
+    cutoff_threshold : float
+        The minimum weighted observation count that a clade must have to be
+        considered supported.
+
+    Returns
+    -------
+    dict
+        A dict of the accepted clades, keyed by the bytes of the clade bitset
+        and valued by the support value.
+
+    Notes
+    -----
+    Each candidate clade is checked against all accepted clades at once.
+
+    """
+    candidates = [(clade, count) for clade, count in clade_counts
+                  if count > cutoff_threshold]
+    accepted_clades = {}
+    if not candidates:
+        return accepted_clades
+
+    n_words = len(candidates[0][0]) // 8
+    accepted = np.zeros((len(candidates), n_words), dtype=np.uint64)
+    n_accepted = 0
+
+    for clade, count in candidates:
+        bits = np.frombuffer(clade, dtype=np.uint64)
+
+        if clade_sizes[clade] > 1 and n_accepted:
+            # same conflict definition as in _filter_clades: the clades are
+            # not disjoint and neither clade is a subset of the other
+            others = accepted[:n_accepted]
+            intersect = others & bits
+            overlap = intersect.any(axis=1)
+            subset = (intersect == bits).all(axis=1)
+            superset = (intersect == others).all(axis=1)
+
+            if (overlap & ~(subset | superset)).any():
+                continue
+
+        accepted[n_accepted] = bits
+        n_accepted += 1
+        accepted_clades[clade] = count
+
+    return accepted_clades
+
+
 def _build_trees(clade_counts, edge_lengths, support_attr, tree_node_class):
     """Construct the trees with support
 
@@ -181,7 +310,7 @@ def _build_trees(clade_counts, edge_lengths, support_attr, tree_node_class):
 
 @experimental(as_of="0.4.0")
 def majority_rule(trees, weights=None, cutoff=0.5, support_attr='support',
-                  tree_node_class=TreeNode):
+                  tree_node_class=TreeNode, bitset=False):
     r"""Determines consensus trees from a list of rooted trees
 
     Parameters
@@ -203,6 +332,13 @@ def majority_rule(trees, weights=None, cutoff=0.5, support_attr='support',
         Specifies type of consensus trees that are returned. Either
         ``TreeNode`` (the default) or a type that implements the same interface
         (most usefully, a subclass of ``TreeNode``).
+    bitset : bool, optional
+        If ``True``, tips are mapped to integer indices and clades are encoded
+        as fixed-width bitsets while counting and filtering them, instead of
+        as frozensets of tip names. The consensus trees are the same, but the
+        bitset encoding uses far less memory and time when there are many
+        input trees with many tips. Unlike the default, the input trees are
+        not decorated with a ``tip_names`` attribute.
 
     Returns
     -------
@@ -283,8 +419,25 @@ def majority_rule(trees, weights=None, cutoff=0.5, support_attr='support',
 
     cutoff_threshold = cutoff * weights.sum()
 
-    clade_counts, edge_lengths = _walk_clades(trees, weights)
-    clade_counts = _filter_clades(clade_counts, cutoff_threshold)
+    if bitset:
+        clade_counts, edge_lengths, clade_sizes, tip_names = \
+            _walk_clades_bitset(trees, weights)
+        accepted = _filter_clades_bitset(clade_counts, clade_sizes,
+                                         cutoff_threshold)
+
+        # only the accepted clades are decoded back into tip names
+        clade_counts = {}
+        accepted_lengths = {}
+        for clade, count in accepted.items():
+            names = _bitset_to_names(np.frombuffer(clade, dtype=np.uint64),
+                                     tip_names)
+            clade_counts[names] = count
+            accepted_lengths[names] = edge_lengths[clade]
+        edge_lengths = accepted_lengths
+    else:
+        clade_counts, edge_lengths = _walk_clades(trees, weights)
+        clade_counts = _filter_clades(clade_counts, cutoff_threshold)
+
     trees = _build_trees(clade_counts, edge_lengths, support_attr,
                          tree_node_class)
 
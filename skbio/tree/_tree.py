@@ -11,7 +11,7 @@ from operator import or_, itemgetter
 from copy import deepcopy
 from itertools import combinations
 from functools import reduce
-from collections import defaultdict
+from collections import defaultdict, deque
 
 import numpy as np
 from scipy.stats import pearsonr
@@ -78,7 +78,7 @@ class TreeNode(SkbioObject):
     """
     default_write_format = 'newick'
     _exclude_from_copy = set(['parent', 'children', '_tip_cache',
-                              '_non_tip_cache'])
+                              '_non_tip_cache', '_traversal_cache'])
 
     @experimental(as_of="0.4.0")
     def __init__(self, name=None, length=None, parent=None, children=None):
@@ -87,6 +87,7 @@ class TreeNode(SkbioObject):
         self.parent = parent
         self._tip_cache = {}
         self._non_tip_cache = {}
+        self._traversal_cache = {}
         self._registered_caches = set()
 
         self.children = []
@@ -170,6 +171,7 @@ class TreeNode(SkbioObject):
         self.invalidate_caches()
         if node.parent is not None:
             node.parent.remove(node)
+        node._traversal_cache = {}
         node.parent = self
         return node
 
@@ -272,6 +274,7 @@ class TreeNode(SkbioObject):
         r"""The actual (and only) method that performs node removal"""
         self.invalidate_caches()
         node = self.children.pop(idx)
+        node._traversal_cache = {}
         node.parent = None
         return node
 
@@ -336,7 +339,7 @@ class TreeNode(SkbioObject):
         (a)c;
         <BLANKLINE>
         """
-        for node in self.traverse(include_self=False):
+        for node in self._preorder(include_self=False):
             if func(node):
                 node.parent.remove(node)
 
@@ -427,7 +430,7 @@ class TreeNode(SkbioObject):
         Raises
         ------
         ValueError
-            If the names do not exist in the tree
+            If the names do not exist in the tree, or if no names are provided
 
         See Also
         --------
@@ -446,30 +449,74 @@ class TreeNode(SkbioObject):
         <BLANKLINE>
 
         """
-        tcopy = self.deepcopy()
-        all_tips = {n.name for n in tcopy.tips()}
         ids = set(names)
 
-        if not ids.issubset(all_tips):
+        # mark bottom-up the children of each node that lead to a tip to keep
+        kept = {}
+        found = set()
+        for node in self.postorder(include_self=False):
+            children = node.children
+            if children:
+                kept_children = [c for c in children if id(c) in kept]
+                if kept_children:
+                    kept[id(node)] = kept_children
+            elif node.name in ids:
+                kept[id(node)] = []
+                found.add(node.name)
+
+        if found != ids:
             raise ValueError("ids are not a subset of the tree.")
 
-        marked = set()
-        for tip in tcopy.tips():
-            if tip.name in ids:
-                marked.add(tip)
-                for anc in tip.ancestors():
-                    if anc in marked:
-                        break
-                    else:
-                        marked.add(anc)
-
-        for node in list(tcopy.traverse()):
-            if node not in marked:
-                node.parent.remove(node)
+        kept_children = [c for c in self.children if id(c) in kept]
+        if kept_children:
+            kept[id(self)] = kept_children
+        else:
+            raise ValueError("No tip names were provided.")
+
+        def collapse(node):
+            # skip over nodes left with a single child, accumulating their
+            # lengths in the same way as prune
+            length = node.length
+            while len(kept[id(node)]) == 1:
+                node = kept[id(node)][0]
+                if node.length is None or length is None:
+                    length = node.length or length
+                else:
+                    length = node.length + length
+            return node, length
+
+        # build the induced subtree directly, ordering the children of each
+        # node as prune would after removing the unwanted tips: children that
+        # are kept as is come first, followed by the collapsed ones
+        result = self._copy_node(self)
+        old = self
+        if len(kept[id(self)]) == 1:
+            # the root adopts the properties of its single descendant
+            old, length = collapse(kept[id(self)][0])
+            efc = self._exclude_from_copy
+            for key in old.__dict__:
+                if key not in efc:
+                    result.__dict__[key] = deepcopy(old.__dict__[key])
+            result.length = length
 
-        tcopy.prune()
+        stack = [(result, old)]
+        while stack:
+            new_parent, old_parent = stack.pop()
+            kept_children = kept[id(old_parent)]
+            ordered = ([c for c in kept_children if len(kept[id(c)]) != 1] +
+                       [c for c in kept_children if len(kept[id(c)]) == 1])
+
+            new_children = []
+            for child in ordered:
+                old_child, length = collapse(child)
+                new_child = self._copy_node(old_child)
+                new_child.length = length
+                new_child.parent = new_parent
+                new_children.append(new_child)
+                stack.append((new_child, old_child))
+            new_parent.children = new_children
 
-        return tcopy
+        return result
 
     @experimental(as_of="0.4.0")
     def copy(self):
@@ -500,20 +547,7 @@ class TreeNode(SkbioObject):
         0
 
         """
-        def __copy_node(node_to_copy):
-            r"""Helper method to copy a node"""
-            # this is _possibly_ dangerous, we're assuming the node to copy is
-            # of the same class as self, and has the same exclusion criteria.
-            # however, it is potentially dangerous to mix TreeNode subclasses
-            # within a tree, so...
-            result = self.__class__()
-            efc = self._exclude_from_copy
-            for key in node_to_copy.__dict__:
-                if key not in efc:
-                    result.__dict__[key] = deepcopy(node_to_copy.__dict__[key])
-            return result
-
-        root = __copy_node(self)
+        root = self._copy_node(self)
         nodes_stack = [[root, self, len(self.children)]]
 
         while nodes_stack:
@@ -524,7 +558,7 @@ class TreeNode(SkbioObject):
             if unvisited_children:
                 top[2] -= 1
                 old_child = old_top_node.children[-unvisited_children]
-                new_child = __copy_node(old_child)
+                new_child = self._copy_node(old_child)
                 new_top_node.append(new_child)
                 nodes_stack.append([new_child, old_child,
                                     len(old_child.children)])
@@ -535,6 +569,19 @@ class TreeNode(SkbioObject):
     __copy__ = copy
     __deepcopy__ = deepcopy = copy
 
+    def _copy_node(self, node_to_copy):
+        r"""Copy a single node, without its parent and children"""
+        # this is _possibly_ dangerous, we're assuming the node to copy is
+        # of the same class as self, and has the same exclusion criteria.
+        # however, it is potentially dangerous to mix TreeNode subclasses
+        # within a tree, so...
+        result = self.__class__()
+        efc = self._exclude_from_copy
+        for key in node_to_copy.__dict__:
+            if key not in efc:
+                result.__dict__[key] = deepcopy(node_to_copy.__dict__[key])
+        return result
+
     @experimental(as_of="0.4.0")
     def unrooted_deepcopy(self, parent=None):
         r"""Walks the tree unrooted-style and returns a new copy
@@ -1075,6 +1122,12 @@ class TreeNode(SkbioObject):
         b
 
         """
+        if self.is_root():
+            return self._iter_cached_traversal('preorder', include_self)
+        return self._preorder(include_self)
+
+    def _preorder(self, include_self=True):
+        r"""Uncached preorder traversal, see `preorder`"""
         stack = [self]
         while stack:
             curr = stack.pop()
@@ -1122,6 +1175,12 @@ class TreeNode(SkbioObject):
         None
 
         """
+        if self.is_root():
+            return self._iter_cached_traversal('postorder', include_self)
+        return self._postorder(include_self)
+
+    def _postorder(self, include_self=True):
+        r"""Uncached postorder traversal, see `postorder`"""
         child_index_stack = [0]
         curr = self
         curr_children = self.children
@@ -1192,6 +1251,13 @@ class TreeNode(SkbioObject):
         None
 
         """
+        if self.is_root():
+            return self._iter_cached_traversal('pre_and_postorder',
+                                               include_self)
+        return self._pre_and_postorder(include_self)
+
+    def _pre_and_postorder(self, include_self=True):
+        r"""Uncached pre-and-postorder traversal, see `pre_and_postorder`"""
         # handle simple case first
         if not self.children:
             if include_self:
@@ -1268,14 +1334,41 @@ class TreeNode(SkbioObject):
         e
 
         """
-        queue = [self]
+        if self.is_root():
+            return self._iter_cached_traversal('levelorder', include_self)
+        return self._levelorder(include_self)
+
+    def _levelorder(self, include_self=True):
+        r"""Uncached levelorder traversal, see `levelorder`"""
+        queue = deque([self])
         while queue:
-            curr = queue.pop(0)
+            curr = queue.popleft()
             if include_self or (curr is not self):
                 yield curr
             if curr.children:
                 queue.extend(curr.children)
 
+    def _iter_cached_traversal(self, order, include_self):
+        r"""Iterate over a traversal of the tree cached on the root
+
+        The nodes visited by a traversal of the whole tree are stored on the
+        root the first time that the traversal is requested, so that
+        subsequent traversals do not need to walk the tree. The cache is
+        cleared by `invalidate_caches`, which is called whenever the topology
+        is changed through the `TreeNode` API. A traversal that is already
+        being iterated over keeps visiting the nodes it started with, so
+        methods that change the topology while walking the tree must use the
+        uncached traversals (e.g., `_preorder`) instead.
+        """
+        nodes = self._traversal_cache.get(order)
+        if nodes is None:
+            nodes = list(getattr(self, '_' + order)())
+            self._traversal_cache[order] = nodes
+
+        for node in nodes:
+            if include_self or (node is not self):
+                yield node
+
     @experimental(as_of="0.4.0")
     def tips(self, include_self=False):
         r"""Iterates over tips descended from `self`.
@@ -1362,7 +1455,12 @@ class TreeNode(SkbioObject):
 
     @experimental(as_of="0.4.0")
     def invalidate_caches(self, attr=True):
-        r"""Delete lookup and attribute caches
+        r"""Delete lookup, traversal and attribute caches
+
+        Caches are invalidated automatically when the tree is modified using
+        methods such as `append`, `extend`, `pop` and `remove`. If the
+        `children` or `parent` of nodes are modified directly, this method
+        must be called on the tree to clear the outdated caches.
 
         Parameters
         ----------
@@ -1382,9 +1480,12 @@ class TreeNode(SkbioObject):
         else:
             self._tip_cache = {}
             self._non_tip_cache = {}
+            self._traversal_cache = {}
 
             if self._registered_caches and attr:
-                for n in self.traverse():
+                # the tree is usually about to be modified, so walking it
+                # must not cache the traversal again
+                for n in self._preorder():
                     for cache in self._registered_caches:
                         if hasattr(n, cache):
                             delattr(n, cache)
@@ -1918,25 +2019,6 @@ class TreeNode(SkbioObject):
 
         return root
 
-    def _balanced_distance_to_tip(self):
-        """Return the distance to tip from this node.
-
-        The distance to every tip from this node must be equal for this to
-        return a correct result.
-
-        Returns
-        -------
-        int
-            The distance to tip of a length-balanced tree
-
-        """
-        node = self
-        distance = 0
-        while node.has_children():
-            distance += node.children[0].length
-            node = node.children[0]
-        return distance
-
     @classonlymethod
     @experimental(as_of="0.4.0")
     def from_linkage_matrix(cls, linkage_matrix, id_list):
@@ -1957,36 +2039,138 @@ class TreeNode(SkbioObject):
 
         See Also
         --------
+        to_linkage_matrix
         scipy.cluster.hierarchy.linkage
 
+        Notes
+        -----
+        The height of each cluster is half of its distance in the linkage
+        matrix, and the branch lengths are the differences between the heights
+        of each cluster and its children. All branch lengths are computed at
+        once and the nodes are linked together directly, so that building the
+        tree takes linear time.
+
         """
+        linkage_matrix = np.asarray(linkage_matrix)
         tip_width = len(id_list)
         cluster_count = len(linkage_matrix)
-        lookup_len = cluster_count + tip_width
-        node_lookup = np.empty(lookup_len, dtype=cls)
 
-        for i, name in enumerate(id_list):
-            node_lookup[i] = cls(name=name)
+        children = linkage_matrix[:, :2].astype(int)
+        heights = np.zeros(tip_width + cluster_count)
+        heights[tip_width:] = linkage_matrix[:, 2] / 2
+        lengths = heights[tip_width:, np.newaxis] - heights[children]
 
-        for i in range(tip_width, lookup_len):
-            node_lookup[i] = cls()
+        node_lookup = [cls(name=name) for name in id_list]
+        node_lookup.extend(cls() for _ in range(cluster_count))
 
-        newest_cluster_index = cluster_count + 1
-        for link in linkage_matrix:
-            child_a = node_lookup[int(link[0])]
-            child_b = node_lookup[int(link[1])]
+        for i, ((a, b), (length_a, length_b)) in enumerate(
+                zip(children.tolist(), lengths.tolist())):
+            child_a = node_lookup[a]
+            child_b = node_lookup[b]
+            child_a.length = length_a
+            child_b.length = length_b
 
-            path_length = link[2] / 2
-            child_a.length = path_length - child_a._balanced_distance_to_tip()
-            child_b.length = path_length - child_b._balanced_distance_to_tip()
+            # the clusters are new nodes, so there are no caches to invalidate
+            new_cluster = node_lookup[tip_width + i]
+            child_a.parent = new_cluster
+            child_b.parent = new_cluster
+            new_cluster.children = [child_a, child_b]
 
-            new_cluster = node_lookup[newest_cluster_index]
-            new_cluster.append(child_a)
-            new_cluster.append(child_b)
+        return node_lookup[-1]
 
-            newest_cluster_index += 1
+    @experimental(as_of="0.5.3")
+    def to_linkage_matrix(self):
+        """Return a SciPy linkage matrix representing the tree.
 
-        return node_lookup[-1]
+        Returns
+        -------
+        ndarray
+            A linkage matrix in the format returned by
+            `scipy.cluster.hierarchy.linkage`. The distance of each cluster is
+            twice its height above the tips.
+        list
+            The tip names, in the order in which the tips are indexed in the
+            linkage matrix
+
+        Raises
+        ------
+        TreeError
+            If the tree is not bifurcating or is not ultrametric.
+        NoLengthError
+            If a node other than the root does not have a length.
+
+        See Also
+        --------
+        from_linkage_matrix
+        scipy.cluster.hierarchy.linkage
+
+        Notes
+        -----
+        The tree is treated as a dendrogram: each internal node must have
+        exactly two children, and all tips must be at the same distance from
+        each internal node. The clusters are ordered by increasing distance,
+        as they would be merged by a hierarchical clustering algorithm.
+
+        Examples
+        --------
+        >>> from skbio import TreeNode
+        >>> tree = TreeNode.read(["((a:1,b:1):2,(c:0.5,d:0.5):2.5);"])
+        >>> linkage, id_list = tree.to_linkage_matrix()
+        >>> linkage.tolist()
+        [[2.0, 3.0, 1.0, 2.0], [0.0, 1.0, 2.0, 2.0], [5.0, 4.0, 6.0, 4.0]]
+        >>> id_list
+        ['a', 'b', 'c', 'd']
+
+        """
+        tips = []
+        clusters = []
+        cluster_heights = []
+        height = {}
+        count = {}
+
+        for node in self.postorder():
+            if not node.children:
+                tips.append(node)
+                height[id(node)] = 0.0
+                count[id(node)] = 1
+                continue
+
+            if len(node.children) != 2:
+                raise TreeError("The tree must be bifurcating.")
+
+            child_heights = []
+            for child in node.children:
+                if child.length is None:
+                    raise NoLengthError("Node without length: %s" % child.name)
+                child_heights.append(child.length + height[id(child)])
+
+            # same tolerance as np.isclose, which is slow on scalars
+            height_a, height_b = child_heights
+            if abs(height_a - height_b) > 1e-08 + 1e-05 * abs(height_b):
+                raise TreeError("The tree must be ultrametric.")
+
+            height[id(node)] = max(child_heights)
+            count[id(node)] = sum(count[id(c)] for c in node.children)
+            clusters.append(node)
+            cluster_heights.append(height[id(node)])
+
+        # sort clusters by height, breaking ties by postorder so that children
+        # are always merged before their parent
+        order = np.lexsort((np.arange(len(clusters)), cluster_heights))
+
+        tip_width = len(tips)
+        index = {id(tip): i for i, tip in enumerate(tips)}
+        rows = []
+
+        for row, i in enumerate(order.tolist()):
+            node = clusters[i]
+            child_a, child_b = node.children
+            index[id(node)] = tip_width + row
+            rows.append((index[id(child_a)], index[id(child_b)],
+                         2 * cluster_heights[i], count[id(node)]))
+
+        linkage_matrix = np.array(rows, dtype=float).reshape(-1, 4)
+        return linkage_matrix, [tip.name for tip in tips]
 
     @experimental(as_of="0.4.0")
     def to_taxonomy(self, allow_empty=False, filter_f=None):
@@ -2797,7 +2981,9 @@ class TreeNode(SkbioObject):
                   \f-------|
                             \-e
         """
-        for n in self.traverse(include_self=True):
+        # the tree is modified while it is walked, so the cached traversal of
+        # the root must not be used here
+        for n in self._preorder(include_self=True):
             if len(n.children) > 2:
                 stack = n.children
                 while len(stack) > 2:
@@ -0,0 +1,129 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import numpy as np
+
+
+# number of set bits for every possible byte value
+_POPCOUNT8 = np.array([bin(i).count('1') for i in range(256)], dtype=np.uint8)
+
+
+def _tip_name_index(trees):
+    """Map the tip names of one or more trees to consecutive integers
+
+    Parameters
+    ----------
+    trees : iterable of TreeNode
+        The trees whose tips will be indexed
+
+    Returns
+    -------
+    dict
+        Keyed by tip name and valued by the index of the bit representing the
+        tip. Names are indexed in order of first appearance.
+
+    """
+    tip_index = {}
+    for tree in trees:
+        for tip in tree.tips(include_self=True):
+            if tip.name not in tip_index:
+                tip_index[tip.name] = len(tip_index)
+    return tip_index
+
+
+def _n_words(n_tips):
+    """Number of 64-bit words needed to hold one bit per tip"""
+    return max(1, (n_tips + 63) // 64)
+
+
+def _clade_bitsets(tree, tip_index, n_words=None):
+    """Encode the clade below each node of a tree as a fixed-width bitset
+
+    Parameters
+    ----------
+    tree : TreeNode
+        The tree to encode
+    tip_index : dict
+        Keyed by tip name and valued by the bit representing the tip, e.g. as
+        returned by ``_tip_name_index``
+    n_words : int, optional
+        The number of 64-bit words of each bitset. If not provided, the
+        smallest width able to represent `tip_index` is used.
+
+    Returns
+    -------
+    list of TreeNode
+        The nodes of `tree` in postorder
+    np.array of np.uint64
+        A 2-D array of shape ``(len(nodes), n_words)``, where row ``i`` is the
+        set of tips descending from ``nodes[i]``. Tip ``j`` is stored in bit
+        ``j % 64`` of word ``j // 64``.
+
+    Raises
+    ------
+    KeyError
+        If a tip name of `tree` is not in `tip_index`.
+
+    """
+    if n_words is None:
+        n_words = _n_words(len(tip_index))
+
+    nodes = list(tree.postorder(include_self=True))
+    bits = np.zeros((len(nodes), n_words), dtype=np.uint64)
+    row = {}
+
+    for i, node in enumerate(nodes):
+        row[id(node)] = i
+        if node.children:
+            rows = [row[id(c)] for c in node.children]
+            bits[i] = np.bitwise_or.reduce(bits[rows], axis=0)
+        else:
+            idx = tip_index[node.name]
+            bits[i, idx // 64] = np.uint64(1) << np.uint64(idx % 64)
+
+    return nodes, bits
+
+
+def _popcount(bits):
+    """Number of tips in each bitset
+
+    Parameters
+    ----------
+    bits : np.array of np.uint64
+        A 1-D bitset or a 2-D array with one bitset per row
+
+    Returns
+    -------
+    int or np.array of int
+        The number of set bits of `bits`, or of each row of `bits`
+
+    """
+    bits = np.ascontiguousarray(bits, dtype=np.uint64)
+    counts = _POPCOUNT8[bits.view(np.uint8)].astype(int)
+    return counts.sum(axis=-1)
+
+
+def _bitset_to_names(bits, tip_names):
+    """Decode a bitset into the frozenset of tip names it represents
+
+    Parameters
+    ----------
+    bits : np.array of np.uint64
+        A 1-D bitset
+    tip_names : list
+        Tip names in bit order, i.e., the keys of a tip index sorted by value
+
+    Returns
+    -------
+    frozenset
+        The names of the tips whose bits are set
+
+    """
+    shifts = np.arange(64, dtype=np.uint64)
+    flags = (bits[:, np.newaxis] >> shifts) & np.uint64(1)
+    return frozenset(tip_names[i] for i in np.flatnonzero(flags))
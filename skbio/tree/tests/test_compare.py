@@ -0,0 +1,76 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+from unittest import TestCase, main
+
+import numpy as np
+import numpy.testing as npt
+
+from skbio import TreeNode, DistanceMatrix
+from skbio.tree import rf_dists
+
+
+class RFDistsTests(TestCase):
+    def setUp(self):
+        newicks = ["((a,b),(c,d),e);",
+                   "(((a,b),c),d,e);",
+                   "(((a,c),b),(d,e));",
+                   "((((a,b)x)y,(c,d)),e);",
+                   "(a,b,c,d,e);"]
+        self.trees = [TreeNode.read(io.StringIO(n)) for n in newicks]
+
+    def test_rf_dists(self):
+        obs = rf_dists(self.trees)
+        self.assertIsInstance(obs, DistanceMatrix)
+        self.assertEqual(obs.ids, ('0', '1', '2', '3', '4'))
+
+        for i, t1 in enumerate(self.trees):
+            for j, t2 in enumerate(self.trees):
+                self.assertEqual(obs[i, j], t1.compare_rfd(t2))
+
+    def test_rf_dists_proportion(self):
+        obs = rf_dists(self.trees, ids=list('abcde'), proportion=True)
+        self.assertEqual(obs.ids, tuple('abcde'))
+
+        # the star tree has no subsets, so compare_rfd cannot be used for it
+        for i, t1 in enumerate(self.trees[:-1]):
+            for j, t2 in enumerate(self.trees[:-1]):
+                npt.assert_almost_equal(obs[i, j],
+                                        t1.compare_rfd(t2, proportion=True))
+        npt.assert_equal(obs['e', 'e'], 0.0)
+        npt.assert_equal(obs['a', 'e'], 1.0)
+
+    def test_rf_dists_many_tips(self):
+        names = ['t%d' % i for i in range(130)]
+        pairs = ','.join('(%s,%s)' % (names[i], names[i + 1])
+                         for i in range(0, 130, 2))
+        nested = '(%s,%s)' % (names[0], names[1])
+        for name in names[2:]:
+            nested = '(%s,%s)' % (nested, name)
+        trees = [TreeNode.read(io.StringIO('(%s);' % pairs)),
+                 TreeNode.read(io.StringIO('%s;' % nested))]
+
+        obs = rf_dists(trees)
+        npt.assert_equal(obs.data, np.array([[0., 1.], [1., 0.]]) *
+                         trees[0].compare_rfd(trees[1]))
+
+    def test_rf_dists_different_tips(self):
+        trees = [TreeNode.read(io.StringIO("((a,b),(c,d));")),
+                 TreeNode.read(io.StringIO("((a,b),(c,e));"))]
+        with self.assertRaisesRegex(ValueError, 'not present in all trees'):
+            rf_dists(trees)
+
+        trees = [TreeNode.read(io.StringIO("((a,b),(c,d));")),
+                 TreeNode.read(io.StringIO("((a,b),c);"))]
+        with self.assertRaisesRegex(ValueError, 'same set of tips'):
+            rf_dists(trees)
+
+
+if __name__ == '__main__':
+    main()
@@ -14,7 +14,8 @@ import numpy as np
 from skbio import TreeNode
 from skbio.tree import majority_rule
 from skbio.tree._majority_rule import (_walk_clades, _filter_clades,
-                                       _build_trees)
+                                       _build_trees, _walk_clades_bitset,
+                                       _filter_clades_bitset)
 
 
 class MajorityRuleTests(TestCase):
@@ -82,6 +83,62 @@ class MajorityRuleTests(TestCase):
         obs = set([frozenset([n.name for n in t.traverse()]) for t in trees])
         self.assertEqual(obs, exp)
 
+    def test_majority_rule_bitset(self):
+        trees = [
+            TreeNode.read(
+                io.StringIO("(A,(B,(H,(D,(J,(((G,E),(F,I)),C))))));")),
+            TreeNode.read(
+                io.StringIO("(A,(B,(D,((J,H),(((G,E),(F,I)),C)))));")),
+            TreeNode.read(
+                io.StringIO("(A,(B,(E,(G,((F,I),((J,(H,D)),C))))));")),
+            TreeNode.read(
+                io.StringIO("(A,(B,(E,((G,(F,I)),(((J,H),D),C)))));"))]
+
+        def clades(consensus):
+            return {(frozenset(t.name for t in n.tips(include_self=True)),
+                     n.support)
+                    for tree in consensus for n in tree.traverse()}
+
+        for cutoff in (0.0, 0.25, 0.5, 0.75):
+            exp = majority_rule(trees, cutoff=cutoff)
+            obs = majority_rule(trees, cutoff=cutoff, bitset=True)
+            self.assertEqual(len(obs), len(exp))
+            self.assertEqual(clades(obs), clades(exp))
+
+    def test_majority_rule_bitset_many_tips(self):
+        # more than 64 tips so that clades span multiple words
+        names = ['t%d' % i for i in range(100)]
+        newick = '(%s);' % ','.join('(%s,%s)' % (names[i], names[i + 1])
+                                    for i in range(0, 100, 2))
+        trees = [TreeNode.read(io.StringIO(newick)) for _ in range(3)]
+        trees.append(TreeNode.read(io.StringIO('(%s);' % ','.join(names))))
+
+        obs = majority_rule(trees, bitset=True)
+        self.assertEqual(len(obs), 1)
+        self.assertEqual(obs[0].compare_subsets(trees[0]), 0.0)
+        self.assertEqual(
+            sorted(n.support for n in obs[0].non_tips(include_self=True)),
+            [3.0] * 50 + [4.0])
+
+    def test_majority_rule_bitset_multiple_trees(self):
+        trees = [
+            TreeNode.read(io.StringIO("((a,b),(c,d),(e,f));")),
+            TreeNode.read(io.StringIO("(a,(c,d),b,(e,f));")),
+            TreeNode.read(io.StringIO("((c,d),(e,f),b);")),
+            TreeNode.read(io.StringIO("(a,(c,d),(e,f));"))]
+
+        trees = majority_rule(trees, bitset=True)
+        self.assertEqual(len(trees), 4)
+
+        exp = set([
+                  frozenset(['a']),
+                  frozenset(['b']),
+                  frozenset([None, 'c', 'd']),
+                  frozenset([None, 'e', 'f'])])
+
+        obs = set([frozenset([n.name for n in t.traverse()]) for t in trees])
+        self.assertEqual(obs, exp)
+
     def test_majority_rule_tree_node_class(self):
         class TreeNodeSubclass(TreeNode):
             pass
@@ -162,6 +219,44 @@ class MajorityRuleTests(TestCase):
         self.assertEqual(set(obs_clades), set(exp_clades))
         self.assertEqual(obs_lengths, exp_lengths)
 
+    def test_walk_clades_bitset(self):
+        trees = [TreeNode.read(io.StringIO("((A,B),(D,E));")),
+                 TreeNode.read(io.StringIO("((A,B),(D,(E,X)));"))]
+        obs_clades, obs_lengths, obs_sizes, tip_names = \
+            _walk_clades_bitset(trees, np.ones(len(trees)))
+        self.assertEqual(tip_names, ['A', 'B', 'D', 'E', 'X'])
+
+        # unlike _walk_clades, the trees are not decorated
+        for t in trees:
+            for n in t.traverse(include_self=True):
+                self.assertFalse(hasattr(n, 'tip_names'))
+
+        exp_clades, exp_lengths = _walk_clades(trees, np.ones(len(trees)))
+
+        def decode(clade):
+            bits = np.frombuffer(clade, dtype=np.uint64)[0]
+            return frozenset(name for i, name in enumerate(tip_names)
+                             if bits & (np.uint64(1) << np.uint64(i)))
+
+        self.assertEqual({(decode(c), v) for c, v in obs_clades},
+                         set(exp_clades))
+        self.assertEqual({decode(c): v for c, v in obs_lengths.items()},
+                         exp_lengths)
+        self.assertEqual({decode(c): v for c, v in obs_sizes.items()},
+                         {c: len(c) for c, _ in exp_clades})
+        self.assertEqual([obs_sizes[c] for c, _ in obs_clades],
+                         [5, 4, 3, 2, 2, 2, 1, 1, 1, 1, 1])
+
+        for t in trees:
+            for n in t.traverse(include_self=True):
+                n.length = 2.0
+
+        exp_clades, exp_lengths = _walk_clades(trees, np.ones(len(trees)))
+        obs_clades, obs_lengths, _, _ = _walk_clades_bitset(
+            trees, np.ones(len(trees)))
+        self.assertEqual({decode(c): v for c, v in obs_lengths.items()},
+                         exp_lengths)
+
     def test_filter_clades(self):
         clade_counts = [(frozenset(['A', 'B']), 8),
                         (frozenset(['A', 'C']), 7),
@@ -187,6 +282,20 @@ class MajorityRuleTests(TestCase):
                frozenset(['A', 'B', 'C']): 5}
         self.assertEqual(obs, exp)
 
+    def test_filter_clades_bitset(self):
+        def encode(*idx):
+            return np.array([sum(1 << i for i in idx)],
+                            dtype=np.uint64).tobytes()
+
+        ab, ac, a, b = encode(0, 1), encode(0, 2), encode(0), encode(1)
+        clade_counts = [(ab, 8), (ac, 7), (a, 6), (b, 5)]
+        clade_sizes = {ab: 2, ac: 2, a: 1, b: 1}
+        obs = _filter_clades_bitset(clade_counts, clade_sizes, 2)
+        self.assertEqual(obs, {ab: 8, a: 6, b: 5})
+
+        obs = _filter_clades_bitset(clade_counts, clade_sizes, 10)
+        self.assertEqual(obs, {})
+
     def test_build_trees(self):
         clade_counts = {frozenset(['A', 'B']): 6,
                         frozenset(['A']): 7,
@@ -711,6 +711,61 @@ class TreeTests(TestCase):
         exp = '(G:3.0,M:3.7);\n'
         self.assertEqual(obs, exp)
 
+    def test_shear_matches_prune(self):
+        def prune_shear(tree, names):
+            # remove the unwanted tips one at a time and prune
+            tcopy = tree.copy()
+            for tip in list(tcopy.tips()):
+                if tip.name not in names:
+                    while tip.parent is not None and len(tip.children) == 0:
+                        parent = tip.parent
+                        parent.remove(tip)
+                        tip = parent
+            tcopy.prune()
+            return str(tcopy)
+
+        newicks = ['((H:1,G:1):2,(R:0.5,M:0.7):3);',
+                   '(((a:1,b:2)c:3,(d,e)f:0)g:1,((h:2)i,j:1)k,l)root:1;',
+                   '((((a,b)c)d:2,(e:1)f:1)g:1,(h,(i,j)k)l)m;']
+        names = [['G', 'M'], ['a', 'b', 'd', 'h', 'j'], ['a', 'e', 'h'],
+                 ['b', 'd'], ['a'], ['b', 'e', 'i', 'j']]
+        for newick in newicks:
+            t = TreeNode.read(io.StringIO(newick))
+            before = str(t)
+            tips = {n.name for n in t.tips()}
+            for to_keep in names:
+                if not set(to_keep).issubset(tips):
+                    continue
+                self.assertEqual(str(t.shear(to_keep)),
+                                 prune_shear(t, to_keep))
+            # the input tree is left untouched
+            self.assertEqual(str(t), before)
+
+    def test_shear_copies_attributes(self):
+        t = TreeNode.read(io.StringIO('((a,b)c,((d)e,f)g)h;'))
+        t.find('a').foo = [1]
+        t.find('d').foo = [2]
+        obs = t.shear(['a', 'b', 'd'])
+        self.assertEqual(str(obs), '((a,b)c,d)h;\n')
+        self.assertEqual(obs.find('a').foo, [1])
+        self.assertIsNot(obs.find('a').foo, t.find('a').foo)
+        self.assertEqual(obs.find('d').foo, [2])
+        self.assertIsNot(obs.find('d'), t.find('d'))
+
+        # the root adopts the properties of its single descendant
+        obs = t.shear(['d'])
+        self.assertEqual(str(obs), 'd;\n')
+        self.assertEqual(obs.foo, [2])
+
+    def test_shear_errors(self):
+        t = TreeNode.read(io.StringIO('((a,b)c,(d,e)f)g;'))
+        with self.assertRaises(ValueError):
+            t.shear(['a', 'x'])
+        with self.assertRaises(ValueError):
+            t.shear(['c'])
+        with self.assertRaises(ValueError):
+            t.shear([])
+
     def test_compare_tip_distances(self):
         t = TreeNode.read(io.StringIO('((H:1,G:1):2,(R:0.5,M:0.7):3);'))
         t2 = TreeNode.read(io.StringIO('(((H:1,G:1,O:1):2,R:3):1,X:4);'))
@@ -864,6 +919,102 @@ class TreeTests(TestCase):
         obs = [n.name for n in self.simple_t.levelorder()]
         self.assertEqual(obs, exp)
 
+    def test_traversal_cache(self):
+        t = self.simple_t
+        exp = [n.name for n in t._postorder()]
+        self.assertEqual(t._traversal_cache, {})
+
+        obs = [n.name for n in t.postorder()]
+        self.assertEqual(obs, exp)
+        self.assertEqual([n.name for n in t._traversal_cache['postorder']],
+                         exp)
+        obs = [n.name for n in t.postorder(include_self=False)]
+        self.assertEqual(obs, exp[:-1])
+
+        # traversals of a subtree are not cached
+        i1 = t.children[0]
+        self.assertEqual([n.name for n in i1.preorder()], ['i1', 'a', 'b'])
+        self.assertEqual(i1._traversal_cache, {})
+        self.assertNotIn('preorder', t._traversal_cache)
+
+        # copies do not share the cache
+        self.assertEqual(t.copy()._traversal_cache, {})
+
+    def test_traversal_cache_invalidated(self):
+        t = self.simple_t
+        self.assertEqual([n.name for n in t.tips()], ['a', 'b', 'c', 'd'])
+        self.assertEqual([n.name for n in t.levelorder()],
+                         ['root', 'i1', 'i2', 'a', 'b', 'c', 'd'])
+
+        t.children[0].append(TreeNode('e'))
+        self.assertEqual(t._traversal_cache, {})
+        self.assertEqual([n.name for n in t.tips()],
+                         ['a', 'b', 'e', 'c', 'd'])
+
+        removed = t.children[1].pop(0)
+        self.assertEqual([n.name for n in t.tips()], ['a', 'b', 'e', 'd'])
+        self.assertEqual([n.name for n in t.levelorder()],
+                         ['root', 'i1', 'i2', 'a', 'b', 'e', 'd'])
+
+        # a cached root that is attached to another tree does not keep its
+        # cache once detached again
+        self.assertEqual([n.name for n in removed.postorder()], ['c'])
+        t.append(removed)
+        removed.append(TreeNode('f'))
+        t.remove(removed)
+        self.assertEqual([n.name for n in removed.postorder()], ['f', 'c'])
+
+        # direct modifications require an explicit invalidation
+        t.children[0].children.pop()
+        t.invalidate_caches()
+        self.assertEqual([n.name for n in t.tips()], ['a', 'b', 'd'])
+
+    def test_traversal_cache_with_cached_attr(self):
+        def tip_names(node):
+            return [node.name] if node.is_tip() else []
+
+        def check(t):
+            # the traversal is cached before each modification
+            list(t.traverse())
+            t.cache_attr(tip_names, 'tip_names')
+            return t
+
+        t = check(TreeNode.read(io.StringIO("((a,b)c,(d,e)f)root;")))
+        t.append(TreeNode('x'))
+        self.assertEqual([n.name for n in t.traverse()],
+                         ['root', 'c', 'a', 'b', 'f', 'd', 'e', 'x'])
+        self.assertFalse(hasattr(t, 'tip_names'))
+
+        check(t).extend([TreeNode('y'), TreeNode('z')])
+        self.assertEqual([n.name for n in t.tips()],
+                         ['a', 'b', 'd', 'e', 'x', 'y', 'z'])
+
+        check(t).children[0].remove(t.find('a'))
+        self.assertEqual([n.name for n in t.tips()],
+                         ['b', 'd', 'e', 'x', 'y', 'z'])
+
+        check(t).pop()
+        self.assertEqual([n.name for n in t.postorder()],
+                         ['b', 'c', 'd', 'e', 'f', 'x', 'y', 'root'])
+
+        check(t).remove_deleted(lambda n: n.name == 'x')
+        check(t).prune()
+        self.assertEqual([n.name for n in t.preorder()],
+                         ['root', 'f', 'd', 'e', 'y', 'b'])
+
+        check(t).append(TreeNode('g'))
+        check(t).bifurcate()
+        self.assertEqual([n.name for n in t.levelorder()],
+                         ['root', 'g', None, 'b', None, 'f', 'y', 'd', 'e'])
+        self.assertEqual(str(t), '(g,(b,((d,e)f,y)))root;\n')
+
+    def test_traversal_cache_remove_while_iterating(self):
+        t = TreeNode.read(io.StringIO("((a,b)c,(d,e)f,(g,h)i)root;"))
+        for node in t.postorder(include_self=False):
+            if node.name in ('a', 'c', 'd'):
+                node.parent.remove(node)
+        self.assertEqual(str(t), '((e)f,(g,h)i)root;\n')
+
     def test_bifurcate(self):
         t1 = TreeNode.read(io.StringIO('(((a,b),c),(d,e));'))
         t2 = TreeNode.read(io.StringIO('((a,b,c));'))
@@ -877,6 +1028,20 @@ class TreeTests(TestCase):
         self.assertEqual(str(t2), '((c,(a,b)));\n')
         self.assertEqual(str(t3), '((c,(a,b):0));\n')
 
+    def test_bifurcate_many_children(self):
+        t = TreeNode.read(io.StringIO('(a,b,c,d,e);'))
+        # the traversal of the root is cached before the tree is modified
+        self.assertEqual(len(list(t.traverse())), 6)
+        t.bifurcate()
+        self.assertEqual(str(t), '(e,(d,(c,(a,b))));\n')
+        for node in t.traverse():
+            self.assertLessEqual(len(node.children), 2)
+
+        t = TreeNode.read(io.StringIO('((a,b,c,d)f,(g,h,i,j)k)root;'))
+        t.bifurcate()
+        self.assertEqual(str(t),
+                         '((d,(c,(a,b)))f,(j,(i,(g,h)))k)root;\n')
+
     def test_bifurcate_with_subclass(self):
         tree = TreeNodeSubclass()
         tree.append(TreeNodeSubclass())
@@ -1246,6 +1411,54 @@ class TreeTests(TestCase):
 
         self.assertIs(type(tree), TreeNodeSubclass)
 
+    def test_to_linkage_matrix(self):
+        id_list = ['A', 'B', 'C', 'D', 'E', 'F', 'G']
+        linkage = np.asarray([[1.0,  5.0,  1.0,  2.0],
+                              [0.0,  3.0,  8.0,  2.0],
+                              [6.0,  7.0, 12.5,  3.0],
+                              [8.0,  9.0, 16.5,  5.0],
+                              [2.0, 10.0, 29.0,  6.0],
+                              [4.0, 11.0, 34.0,  7.0]])
+        tree = TreeNode.from_linkage_matrix(linkage, id_list)
+
+        obs_linkage, obs_ids = tree.to_linkage_matrix()
+        self.assertEqual(obs_ids, ['E', 'C', 'A', 'D', 'G', 'B', 'F'])
+        exp_linkage = np.asarray([[5.0,  6.0,  1.0,  2.0],
+                                  [2.0,  3.0,  8.0,  2.0],
+                                  [4.0,  7.0, 12.5,  3.0],
+                                  [8.0,  9.0, 16.5,  5.0],
+                                  [1.0, 10.0, 29.0,  6.0],
+                                  [0.0, 11.0, 34.0,  7.0]])
+        npt.assert_equal(obs_linkage, exp_linkage)
+
+        # round trip
+        obs = TreeNode.from_linkage_matrix(obs_linkage, obs_ids)
+        self.assertEqual(str(obs), str(tree))
+
+    def test_to_linkage_matrix_ties(self):
+        tree = TreeNode.read(io.StringIO("(((a:1,b:1):0,c:1):1,d:2);"))
+        obs_linkage, obs_ids = tree.to_linkage_matrix()
+        self.assertEqual(obs_ids, ['a', 'b', 'c', 'd'])
+        npt.assert_equal(obs_linkage, [[0.0, 1.0, 2.0, 2.0],
+                                       [4.0, 2.0, 2.0, 3.0],
+                                       [5.0, 3.0, 4.0, 4.0]])
+
+    def test_to_linkage_matrix_single_tip(self):
+        obs_linkage, obs_ids = TreeNode(name='a').to_linkage_matrix()
+        self.assertEqual(obs_linkage.shape, (0, 4))
+        self.assertEqual(obs_ids, ['a'])
+
+    def test_to_linkage_matrix_invalid(self):
+        with self.assertRaisesRegex(TreeError, 'bifurcating'):
+            TreeNode.read(io.StringIO(
+                "(a:1,b:1,c:1);")).to_linkage_matrix()
+        with self.assertRaisesRegex(TreeError, 'ultrametric'):
+            TreeNode.read(io.StringIO(
+                "((a:1,b:1):1,c:1);")).to_linkage_matrix()
+        with self.assertRaises(NoLengthError):
+            TreeNode.read(io.StringIO(
+                "((a,b):1,c:2);")).to_linkage_matrix()
+
     def test_shuffle_invalid_iter(self):
         shuffler = self.simple_t.shuffle(n=-1)
         with self.assertRaises(ValueError):
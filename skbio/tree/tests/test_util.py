@@ -0,0 +1,79 @@
+# ----------------------------------------------------------------------------
+# Copyright (c) 2013--, scikit-bio development team.
+#
+# Distributed under the terms of the Modified BSD License.
+#
+# The full license is in the file COPYING.txt, distributed with this software.
+# ----------------------------------------------------------------------------
+
+import io
+from unittest import TestCase, main
+
+import numpy as np
+import numpy.testing as npt
+
+from skbio import TreeNode
+from skbio.tree._util import (_tip_name_index, _n_words, _clade_bitsets,
+                              _popcount, _bitset_to_names)
+
+
+class UtilTests(TestCase):
+    def setUp(self):
+        self.t1 = TreeNode.read(io.StringIO("((a,b)c,(d,e)f)root;"))
+        self.t2 = TreeNode.read(io.StringIO("((a,x),(b,d));"))
+
+    def test_tip_name_index(self):
+        self.assertEqual(_tip_name_index([self.t1]),
+                         {'a': 0, 'b': 1, 'd': 2, 'e': 3})
+        self.assertEqual(_tip_name_index([self.t1, self.t2]),
+                         {'a': 0, 'b': 1, 'd': 2, 'e': 3, 'x': 4})
+        self.assertEqual(_tip_name_index([]), {})
+
+    def test_n_words(self):
+        self.assertEqual(_n_words(0), 1)
+        self.assertEqual(_n_words(1), 1)
+        self.assertEqual(_n_words(64), 1)
+        self.assertEqual(_n_words(65), 2)
+        self.assertEqual(_n_words(200), 4)
+
+    def test_clade_bitsets(self):
+        tip_index = _tip_name_index([self.t1])
+        nodes, bits = _clade_bitsets(self.t1, tip_index)
+        self.assertEqual([n.name for n in nodes],
+                         ['a', 'b', 'c', 'd', 'e', 'f', 'root'])
+        self.assertEqual(bits.dtype, np.uint64)
+        npt.assert_equal(bits[:, 0], [1, 2, 3, 4, 8, 12, 15])
+
+    def test_clade_bitsets_multiple_words(self):
+        names = ['t%d' % i for i in range(70)]
+        tree = TreeNode.read(io.StringIO('((%s),t70);' % ','.join(names)))
+        tip_index = _tip_name_index([tree])
+        nodes, bits = _clade_bitsets(tree, tip_index, n_words=3)
+        self.assertEqual(bits.shape, (len(nodes), 3))
+        # postorder is t0, ..., t69, (t0, ..., t69), t70, root
+        npt.assert_equal(_popcount(bits[[70, 72]]), [70, 71])
+        self.assertEqual(_bitset_to_names(bits[70], sorted(
+            tip_index, key=tip_index.get)), frozenset(names))
+
+    def test_clade_bitsets_missing_tip(self):
+        with self.assertRaises(KeyError):
+            _clade_bitsets(self.t2, _tip_name_index([self.t1]))
+
+    def test_popcount(self):
+        bits = np.array([[0, 0], [1, 0], [3, 1], [2 ** 63, 2 ** 63 + 1]],
+                        dtype=np.uint64)
+        npt.assert_equal(_popcount(bits), [0, 1, 3, 3])
+        self.assertEqual(_popcount(bits[2]), 3)
+
+    def test_bitset_to_names(self):
+        names = ['a', 'b', 'c']
+        self.assertEqual(
+            _bitset_to_names(np.array([5], dtype=np.uint64), names),
+            frozenset(['a', 'c']))
+        self.assertEqual(
+            _bitset_to_names(np.array([0], dtype=np.uint64), names),
+            frozenset())
+
+
+if __name__ == '__main__':
+    main()